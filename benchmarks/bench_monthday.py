@@ -0,0 +1,101 @@
+"""Benchmarks of :class:`monthday.MonthDay` hot paths.
+
+Run with pyperf_, and store results as JSON so that they can be compared
+between releases and interpreters::
+
+    $ python benchmarks/bench_monthday.py -o before.json
+    $ git checkout feature-branch
+    $ python benchmarks/bench_monthday.py -o after.json
+    $ python -m pyperf compare_to before.json after.json
+
+.. _pyperf: https://pyperf.readthedocs.io/
+
+"""
+import os.path
+import sys
+
+import pyperf
+
+# Benchmark the working tree rather than an installed release.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+#: Fixtures shared by every benchmark.  They're made only through the API of
+#: monthday 0.9.0, so that the suite runs against any release since.
+SETUP = '''
+import datetime
+import pickle
+
+from monthday import MonthDay
+
+aug_4 = MonthDay(8, 4)
+feb_29 = MonthDay(2, 29)
+date = datetime.date(1988, 8, 4)
+month_days = [
+    MonthDay.from_date(datetime.date(2016, 1, 1) +
+                       datetime.timedelta(days=i % 366))
+    for i in range(10000)
+]
+pickled = pickle.dumps(month_days, pickle.HIGHEST_PROTOCOL)
+years = range(1, 10000)
+leap_dates = [md.date(2016) for md in month_days]
+'''
+
+#: Pairs of a name and a statement, which run on any release.
+BENCHMARKS = [
+    ('init', 'MonthDay(8, 4)'),
+    ('from_date', 'MonthDay.from_date(date)'),
+    ('hash', 'hash(aug_4)'),
+    ('eq', 'aug_4 == feb_29'),
+    ('dict_build', 'dict.fromkeys(month_days)'),
+    ('set_build', 'set(month_days)'),
+    ('date', 'aug_4.date(2015)'),
+    ('dates', 'for _ in aug_4.dates(years): pass'),
+    ('dates_feb_29_skip',
+     'for _ in feb_29.dates(years, error_invalid_dates=False): pass'),
+    ('dates_feb_29_none',
+     'for _ in feb_29.dates(years, error_invalid_dates=None): pass'),
+    ('pickle_dumps', 'pickle.dumps(month_days, pickle.HIGHEST_PROTOCOL)'),
+    ('pickle_loads', 'pickle.loads(pickled)'),
+    ('str', 'str(aug_4)'),
+    ('repr', 'repr(aug_4)'),
+]
+
+#: Triples of a name, an extra setup, and a statement for features added
+#: since 0.9.0.  They're skipped where the statement fails to run, i.e.,
+#: against releases lacking the features.
+FEATURE_BENCHMARKS = [
+    ('date_feb_29_invalid', '', 'feb_29.date(2015, leap_policy="none")'),
+    ('counter_dates', 'from monthday.containers import MonthDayCounter',
+     'MonthDayCounter([leap_dates])'),
+    ('format', '', 'format(aug_4, "%b %-d")'),
+    ('format_many', '', 'MonthDay.format_many(month_days, "%b %-d")'),
+]
+
+
+def supported(setup, stmt):
+    namespace = {}
+    try:
+        exec(setup + stmt, namespace)
+    except (AttributeError, ImportError, TypeError):
+        return False
+    return True
+
+
+def main():
+    runner = pyperf.Runner()
+    runner.metadata['description'] = 'monthday.MonthDay hot paths'
+    args = runner.parse_args()
+    for name, stmt in BENCHMARKS:
+        runner.timeit('monthday_' + name, stmt=stmt, setup=SETUP)
+    for name, setup, stmt in FEATURE_BENCHMARKS:
+        setup = SETUP + setup + '\n'
+        if supported(setup, stmt):
+            runner.timeit('monthday_' + name, stmt=stmt, setup=setup)
+        elif not args.worker:
+            print('skipped monthday_{0}: unsupported'.format(name),
+                  file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import datetime
+import os.path
+import sys
+
+import pytest
+
+collect_ignore = []
+
+try:
+    import numpy  # noqa
+except ImportError:
+    collect_ignore.append('monthday/array.py')
+
+try:
+    import pandas  # noqa
+except ImportError:
+    collect_ignore.append('monthday/pandas.py')
+
+try:
+    import pyarrow  # noqa
+except ImportError:
+    collect_ignore.append('monthday/arrow.py')
+
+try:
+    import concurrent.futures  # noqa
+except ImportError:
+    collect_ignore.extend(['monthday/parallel.py',
+                           'monthday_parallel_test.py'])
+
+if sys.version_info < (3, 5):
+    collect_ignore.extend(['monthday/aio.py', 'monthday_aio_test.py'])
+
+if not hasattr(datetime, 'timezone'):
+    collect_ignore.extend(['monthday/zones.py', 'monthday_zones_test.py'])
+
+if sys.version_info < (3,):
+    # The command-line interface relies on Python 3's text I/O.
+    collect_ignore.extend(['monthday/__main__.py', 'monthday_main_test.py'])
+
+#: Doctests of lazy MonthDayDates views, which are made only for Python 3's
+#: range type.
+py3_doctests = frozenset(['monthday.MonthDay.dates', 'monthday.MonthDayDates'])
+
+
+def pytest_configure(config):
+    # Files listed in testpaths are collected even if they're ignored.
+    ignored = set(os.path.normpath(path) for path in collect_ignore)
+    config.args[:] = [arg for arg in config.args
+                      if os.path.normpath(arg) not in ignored]
+
+
+def pytest_collection_modifyitems(config, items):
+    if sys.version_info >= (3,):
+        return
+    skip = pytest.mark.skip(reason='dates() views need the range type of '
+                                   'Python 3')
+    for item in items:
+        if item.name in py3_doctests:
+            item.add_marker(skip)
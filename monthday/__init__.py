@@ -0,0 +1,1326 @@
+""":mod:`monthday` --- Date without year
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+from __future__ import absolute_import
+
+import array as stdarray
+import bisect
+import calendar
+import datetime
+import numbers
+import sys
+
+try:
+    from collections.abc import Iterable, Sequence
+except ImportError:
+    from collections import Iterable, Sequence
+
+if sys.version_info >= (3,):
+    _range_types = range,
+else:
+    # Python 2's xrange has neither start/stop/step nor slicing, so
+    # MonthDayDates views are made only on Python 3.
+    _range_types = ()
+
+try:
+    _string_types = basestring
+except NameError:
+    _string_types = str
+
+
+__all__ = 'MonthDay', 'MonthDayDates', '__version__', 'pack', 'unpack'
+__version__ = '0.9.1'
+
+#: The default of :class:`MonthDay` constructor's arguments, to tell
+#: omitted ones from explicit :const:`None`.
+_omitted = object()
+
+
+class MonthDay(object):
+    """Date without year.  Useful for birthdays, or anniversaries.
+
+    :param month: a month number, from 1 to 12
+    :type month: :class:`numbers.Integral`
+    :param day: a day of the ``month``, from 1 to 31 (or 30, or 29)
+    :type day: :class:`numbers.Integral`
+    :raise ValueError: if ``month`` or ``date`` is out of valid range
+
+    .. attribute:: month
+
+       (:class:`numbers.Integral`) The month number, from 1 to 12.
+
+    .. attribute:: day
+
+       (:class:`numbers.Integral`) The day of the ``month``, from 1 to 31.
+
+    Since there are only 366 distinct values, :class:`MonthDay` instances
+    are interned: constructing the same month and day twice gives
+    the identical object, and instances are immutable.
+
+    >>> MonthDay(8, 4) is MonthDay(8, 4)
+    True
+
+    :class:`MonthDay` values are totally ordered by their position in
+    a leap year, i.e., by their :meth:`toordinal()`:
+
+    >>> MonthDay(2, 29) < MonthDay(3, 1) < MonthDay(12, 31)
+    True
+
+    """
+
+    __slots__ = 'month', 'day', '_ordinal'
+
+    @classmethod
+    def fromordinal(cls, ordinal):
+        """Get a :class:`MonthDay` from the given day-of-year ``ordinal``
+        of a leap year.  It's the inverse of :meth:`toordinal()`.
+
+        >>> MonthDay.fromordinal(0)
+        monthday.MonthDay(1, 1)
+        >>> MonthDay.fromordinal(59)
+        monthday.MonthDay(2, 29)
+        >>> MonthDay.fromordinal(365)
+        monthday.MonthDay(12, 31)
+
+        :param ordinal: a day-of-year ordinal, from 0 to 365
+        :type ordinal: :class:`numbers.Integral`
+        :return: the corresponding :class:`MonthDay`
+        :rtype: :class:`MonthDay`
+        :raise ValueError: if ``ordinal`` is out of valid range
+
+        """
+        if type(ordinal) is not int and not isinstance(ordinal,
+                                                       numbers.Integral):
+            raise TypeError('ordinal must be an integer, not ' +
+                            repr(ordinal))
+        elif not 0 <= ordinal <= 365:
+            raise ValueError('ordinal must be from 0 to 365, not ' +
+                             repr(ordinal))
+        md = _interned[ordinal]
+        if cls is MonthDay:
+            return md
+        return cls._new(md.month, md.day)
+
+    @classmethod
+    def from_date(cls, date):
+        """Get only :class:`MonthDay` from the given ``date``.
+
+        :param date: the date or date/time
+        :type date: :class:`datetime.date`, :class:`datetime.datetime`
+        :return: :class:`MonthDay` without ``date``'s
+                 :attr:`~datetime.date.year`
+        :rtype: :class:`MonthDay`
+
+        """
+        if isinstance(date, datetime.date):
+            return cls._make(date.month, date.day)
+        raise TypeError('date must be an instance of datetime.date, not ' +
+                        repr(date))
+
+    @classmethod
+    def from_dates(cls, dates):
+        r"""Get :class:`MonthDay` values from the given ``dates`` at once.
+        It's equivalent to ``[MonthDay.from_date(d) for d in dates]``,
+        but much faster for large inputs since it doesn't validate
+        every element one by one:
+
+        >>> from datetime import date
+        >>> MonthDay.from_dates([date(1988, 8, 4), date(2015, 12, 25)])
+        [monthday.MonthDay(8, 4), monthday.MonthDay(12, 25)]
+
+        Besides iterables of :class:`datetime.date`\ s, it also takes
+        :class:`array.array`\ s of day-of-year ordinals (see
+        :meth:`toordinal()`), and NumPy ``datetime64`` arrays:
+
+        >>> from array import array
+        >>> MonthDay.from_dates(array('H', [0, 59]))
+        [monthday.MonthDay(1, 1), monthday.MonthDay(2, 29)]
+
+        :param dates: dates or date/times, or day-of-year ordinals
+        :type dates: :class:`~collections.abc.Iterable`,
+                     :class:`array.array`, :class:`numpy.ndarray`
+        :return: :class:`MonthDay` values without ``dates``' years.
+                 the order corresponds to the input ``dates``' order
+        :rtype: :class:`list`
+        :raise TypeError: if any element of ``dates`` is not
+                          a :class:`datetime.date`.  the message contains
+                          the index of the first bad element
+        :raise ValueError: if any ordinal is out of valid range, or
+                           there's ``NaT`` in the NumPy array
+
+        """
+        interned = _interned
+        dtype = getattr(dates, 'dtype', None)
+        if dtype is not None and dtype.kind == 'M':
+            import numpy
+            from .array import MonthDayArray
+            nat = numpy.flatnonzero(numpy.isnat(dates))
+            if nat.size:
+                raise ValueError('dates[{0}] is NaT'.format(nat[0]))
+            ordinals = MonthDayArray.from_datetime64(dates).ordinals
+            result = [interned[o] for o in ordinals.tolist()]
+        elif isinstance(dates, stdarray.array):
+            if dates.typecode not in 'bBhHiIlLqQ':
+                raise TypeError('dates must be an array of integers, not '
+                                'typecode {0!r}'.format(dates.typecode))
+            elif dates and (min(dates) < 0 or max(dates) > 365):
+                for i, ordinal in enumerate(dates):
+                    if not 0 <= ordinal <= 365:
+                        raise ValueError(
+                            'dates[{0}] must be an ordinal from 0 to 365, '
+                            'not {1!r}'.format(i, ordinal)
+                        )
+            result = [interned[o] for o in dates]
+        else:
+            if not isinstance(dates, (list, tuple)):
+                if not isinstance(dates, Iterable):
+                    raise TypeError('dates must be iterable, not ' +
+                                    repr(dates))
+                dates = list(dates)
+            for type_ in set(map(type, dates)):
+                if not issubclass(type_, datetime.date):
+                    for i, date in enumerate(dates):
+                        if not isinstance(date, datetime.date):
+                            raise TypeError(
+                                'dates[{0}] must be an instance of '
+                                'datetime.date, not {1!r}'.format(i, date)
+                            )
+            offsets = _month_offsets
+            result = [interned[offsets[d.month - 1] + d.day - 1]
+                      for d in dates]
+        if cls is MonthDay:
+            return result
+        return [cls._new(md.month, md.day) for md in result]
+
+    @classmethod
+    def parse(cls, string):
+        """Parse the given ``string`` into a :class:`MonthDay`.  It takes
+        ``MM-DD`` (the format :class:`str` makes), ISO 8601's ``--MM-DD``,
+        and ``MMDD``, as :class:`str` or :class:`bytes`:
+
+        >>> MonthDay.parse('08-04')
+        monthday.MonthDay(8, 4)
+        >>> MonthDay.parse('--12-25')
+        monthday.MonthDay(12, 25)
+        >>> MonthDay.parse(b'0229')
+        monthday.MonthDay(2, 29)
+
+        Since there are only 366 valid inputs for each format, it looks up
+        a precomputed table instead of actually parsing the ``string``.
+
+        :param string: a string to parse
+        :type string: :class:`str`, :class:`bytes`
+        :return: the parsed :class:`MonthDay`
+        :rtype: :class:`MonthDay`
+        :raise ValueError: if ``string`` is not in the valid formats,
+                           or it's out of valid range
+
+        """
+        try:
+            md = _parse_table[string]
+        except (KeyError, TypeError):
+            if not isinstance(string, (str, bytes)):
+                raise TypeError('string must be a string, not ' +
+                                repr(string))
+            raise ValueError('invalid month-day: ' + repr(string))
+        if cls is MonthDay:
+            return md
+        return cls._new(md.month, md.day)
+
+    fromisoformat = parse
+
+    @classmethod
+    def parse_many(cls, lines):
+        """Parse the given ``lines`` into :class:`MonthDay` values lazily.
+        Each line has to be in one of the formats :meth:`parse()` takes,
+        with or without a trailing newline, so it can directly consume
+        a file:
+
+        >>> list(MonthDay.parse_many(['08-04\\n', '--12-25\\n', '0229']))
+        [monthday.MonthDay(8, 4), monthday.MonthDay(12, 25),
+         monthday.MonthDay(2, 29)]
+
+        It also takes a whole bytes-like buffer, e.g., a :class:`memoryview`
+        of a memory-mapped file, which is split into lines without being
+        decoded.  It's scanned a window at a time as values are consumed,
+        so it's never copied at once:
+
+        >>> list(MonthDay.parse_many(b'08-04\\r\\n12-25\\r\\n'))
+        [monthday.MonthDay(8, 4), monthday.MonthDay(12, 25)]
+
+        :param lines: lines to parse, or a buffer of them
+        :type lines: :class:`~collections.abc.Iterable`, :class:`bytes`,
+                     :class:`bytearray`, :class:`memoryview`
+        :return: a generator of parsed :class:`MonthDay` values
+        :rtype: :class:`~collections.abc.Iterator`
+        :raise ValueError: if any line is not in the valid formats.
+                           the message contains its line number
+
+        """
+        if isinstance(lines, (bytes, bytearray, memoryview)):
+            lines = _buffer_lines(lines)
+        elif not isinstance(lines, Iterable):
+            raise TypeError('lines must be iterable, not ' + repr(lines))
+
+        def generate():
+            table = _parse_line_table
+            interned = cls is MonthDay
+            for lineno, line in enumerate(lines, 1):
+                try:
+                    md = table[line]
+                except (KeyError, TypeError):
+                    try:
+                        md = _parse_table[line.strip()]
+                    except (AttributeError, KeyError, TypeError):
+                        raise ValueError('invalid month-day at line {0}: '
+                                         '{1!r}'.format(lineno, line))
+                yield md if interned else cls._new(md.month, md.day)
+        return generate()
+
+    def __new__(cls, month=_omitted, day=_omitted):
+        if month is _omitted or day is _omitted:
+            if month is _omitted and day is _omitted:
+                # Pickles written by 0.9.0 call MonthDay.__new__(MonthDay)
+                # without arguments, and then __setstate__((month, day)).
+                # Direct calls are rejected by __init__() instead.
+                return object.__new__(cls)
+            raise TypeError('both month and day are required')
+        # Exact ints are checked first, since ABC instance checks are slow.
+        if type(month) is not int and not isinstance(month, numbers.Integral):
+            raise TypeError('month must be an integer, not ' + repr(month))
+        elif type(day) is not int and not isinstance(day, numbers.Integral):
+            raise TypeError('day must be an integer, not ' + repr(day))
+        elif not 1 <= month <= 12:
+            raise ValueError('month must be from 1 to 12, not ' + repr(month))
+        days = _days_in_month[month - 1]
+        if not 1 <= day <= days:
+            raise ValueError('day must be from 1 to {0} for month={1!r}, but '
+                             '{2!r} was given'.format(days, month, day))
+        return cls._make(int(month), int(day))
+
+    def __init__(self, month, day):
+        pass
+
+    @classmethod
+    def _make(cls, month, day):
+        """Get a :class:`MonthDay` without validating the given ``month``
+        and ``day``.  Only for internal paths which already guarantee
+        they are valid integers, e.g., :meth:`from_date()`.
+
+        """
+        if cls is MonthDay:
+            return _interned[_month_offsets[month - 1] + day - 1]
+        return cls._new(month, day)
+
+    @classmethod
+    def _new(cls, month, day):
+        self = object.__new__(cls)
+        object.__setattr__(self, 'month', month)
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, '_ordinal',
+                           _month_offsets[month - 1] + day - 1)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0.__module__}.{0.__name__} is immutable; '
+                             "can't set {1!r}".format(type(self), name))
+
+    def __delattr__(self, name):
+        raise AttributeError('{0.__module__}.{0.__name__} is immutable; '
+                             "can't delete {1!r}".format(type(self), name))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return (isinstance(other, type(self)) and
+                self.month == other.month and
+                self.day == other.day)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        if isinstance(other, MonthDay):
+            return self._ordinal < other._ordinal
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, MonthDay):
+            return self._ordinal <= other._ordinal
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, MonthDay):
+            return self._ordinal > other._ordinal
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, MonthDay):
+            return self._ordinal >= other._ordinal
+        return NotImplemented
+
+    def __hash__(self):
+        return self.month * 100 + self.day
+
+    def toordinal(self):
+        """Get the day-of-year ordinal of it in a leap year, from 0 (January 1)
+        to 365 (December 31).  Unlike :meth:`datetime.date.timetuple()`'s
+        ``tm_yday``, it's stable regardless of the year, and counts
+        February 29 as well.
+
+        >>> MonthDay(1, 1).toordinal()
+        0
+        >>> MonthDay(3, 1).toordinal()
+        60
+        >>> MonthDay(12, 31).toordinal()
+        365
+
+        :return: the day-of-year ordinal, from 0 to 365
+        :rtype: :class:`int`
+
+        """
+        return self._ordinal
+
+    def rotated_key(self):
+        """Get a key function that orders :class:`MonthDay` values by their
+        next occurrence since it, i.e., as if the year began from it.
+        Key functions are cached per pivot, and each key is a plain
+        integer looked up from a precomputed table, so there is no need to
+        build tuples for every element:
+
+        >>> days = [MonthDay(1, 1), MonthDay(8, 4), MonthDay(12, 25)]
+        >>> sorted(days, key=MonthDay(10, 1).rotated_key())
+        [monthday.MonthDay(12, 25), monthday.MonthDay(1, 1),
+         monthday.MonthDay(8, 4)]
+
+        :return: a key function which takes a :class:`MonthDay` and returns
+                 the number of days from it in a leap year, from 0 to 365
+        :rtype: :class:`~collections.abc.Callable`
+
+        """
+        try:
+            return _rotated_keys[self._ordinal]
+        except KeyError:
+            pivot = self._ordinal
+            table = [(ordinal - pivot) % 366 for ordinal in range(366)]
+
+            def key(month_day):
+                return table[month_day._ordinal]
+            return _rotated_keys.setdefault(pivot, key)
+
+    def days_until(self, date, leap_policy='skip'):
+        """Count the days from the given ``date`` until its next occurrence,
+        which is 0 if ``date`` is the day.  It's computed arithmetically,
+        without making :class:`~datetime.date` objects:
+
+        >>> from datetime import date
+        >>> MonthDay(12, 25).days_until(date(2015, 12, 24))
+        1
+        >>> MonthDay(1, 1).days_until(date(2015, 12, 24))
+        8
+        >>> MonthDay(2, 29).days_until(date(2015, 3, 1))
+        365
+        >>> MonthDay(2, 29).days_until(date(2015, 3, 1), leap_policy='mar1')
+        0
+
+        See also :meth:`MonthDayArray.days_until()
+        <monthday.array.MonthDayArray.days_until>` for many values at once.
+
+        :param date: the date to count from
+        :type date: :class:`datetime.date`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: the number of days
+        :rtype: :class:`int`
+
+        """
+        return self._days_from(date, leap_policy, 1)
+
+    def days_since(self, date, leap_policy='skip'):
+        """Count the days from its last occurrence until the given ``date``,
+        which is 0 if ``date`` is the day.  The counterpart of
+        :meth:`days_until()`:
+
+        >>> from datetime import date
+        >>> MonthDay(12, 25).days_since(date(2015, 12, 24))
+        364
+        >>> MonthDay(2, 29).days_since(date(2015, 3, 1))
+        1096
+        >>> MonthDay(2, 29).days_since(date(2015, 3, 1), leap_policy='feb28')
+        1
+
+        :param date: the date to count until
+        :type date: :class:`datetime.date`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: the number of days
+        :rtype: :class:`int`
+
+        """
+        return self._days_from(date, leap_policy, -1)
+
+    def _days_from(self, date, leap_policy, step):
+        if not isinstance(date, datetime.date):
+            raise TypeError('date must be a datetime.date, not ' + repr(date))
+        elif leap_policy not in _observed_leap_policies:
+            raise ValueError("leap_policy must be one of 'skip', 'feb28', "
+                             "and 'mar1', not " + repr(leap_policy))
+        ordinal = self._ordinal
+        if ordinal == _feb_29_ordinal:
+            substitute = _substitute_day_of_year(leap_policy)
+        target = date.toordinal()
+        year = date.year
+        # Only February 29 with 'skip' needs more than two years
+        # (e.g., 1896 to 1904), and never more than nine.
+        while True:
+            if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+                day_of_year = ordinal
+            elif ordinal < _feb_29_ordinal:
+                day_of_year = ordinal
+            elif ordinal > _feb_29_ordinal:
+                day_of_year = ordinal - 1
+            elif substitute is None:
+                year += step
+                continue
+            else:
+                day_of_year = substitute
+            days = (_days_before_year(year) + day_of_year + 1 - target) * step
+            if days >= 0:
+                return days
+            year += step
+
+    def date(self, year, leap_policy='raise'):
+        """Get a :class:`~datetime.date` by combining the given ``year``
+        with it.
+
+        >>> MonthDay(12, 25).date(2015)
+        datetime.date(2015, 12, 25)
+
+        It may raise :exc:`ValueError` if February 29 is tried to be combined
+        with a non-leap year e.g.:
+
+        >>> feb_29 = MonthDay(2, 29)
+        >>> feb_29.date(2012)
+        datetime.date(2012, 2, 29)
+        >>> feb_29.date(2013)
+        Traceback (most recent call last):
+          ...
+        ValueError: since 2013 is not a leap year,
+                    monthday.MonthDay(2, 29) can't be combined with 2013
+
+        The ``leap_policy`` decides what to do instead of raising
+        :exc:`ValueError` for such case:
+
+        ``'raise'``
+           Raise :exc:`ValueError`.  The default.
+
+        ``'skip'``, ``'none'``
+           Return :const:`None`.
+
+        ``'feb28'``
+           Return February 28 of the ``year``.
+
+        ``'mar1'``
+           Return March 1 of the ``year``.
+
+        >>> feb_29.date(2013, leap_policy='feb28')
+        datetime.date(2013, 2, 28)
+        >>> feb_29.date(2013, leap_policy='mar1')
+        datetime.date(2013, 3, 1)
+        >>> feb_29.date(2013, leap_policy='none') is None
+        True
+
+        :param year: a year to combine with
+        :type year: :class:`numbers.Integral`
+        :param leap_policy: what to do when February 29 is combined with
+                            a non-leap year.  one of ``'raise'``, ``'skip'``,
+                            ``'none'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: a :class:`datetime.date` with the given ``year``
+        :rtype: :class:`datetime.date`
+        :raise ValueError: when ``year`` is not a leap year
+                           while it's ``MonthDay(2, 29)``, and
+                           ``leap_policy`` is ``'raise'``
+
+        """
+        cache = _date_cache
+        if cache is not None:
+            if type(year) is int and leap_policy in _leap_substitutes:
+                index = (year - cache.start) * 366 + self._ordinal
+                if 0 <= index < cache.size:
+                    date = cache.table[index]
+                    if date is not None:
+                        with cache.lock:
+                            cache.hits += 1
+                        return date
+        if type(year) is not int and not isinstance(year, numbers.Integral):
+            raise TypeError('year must be an integer, not ' + repr(year))
+        elif leap_policy not in _leap_substitutes:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_leap_substitutes),
+                                            leap_policy))
+        if cache is not None:
+            with cache.lock:
+                cache.misses += 1
+        year = int(year)
+        if self._ordinal == _feb_29_ordinal and not calendar.isleap(year):
+            if leap_policy == 'raise':
+                raise ValueError("since {0!r} is not a leap year, {1!r} can't "
+                                 "be combined with {0!r}".format(year, self))
+            substitute = _leap_substitutes[leap_policy]
+            return substitute and datetime.date(year, *substitute)
+        date = datetime.date(year, self.month, self.day)
+        if cache is not None:
+            index = (year - cache.start) * 366 + self._ordinal
+            if 0 <= index < cache.size:
+                cache.table[index] = date
+        return date
+
+    def dates(self, years, error_invalid_dates=True, leap_policy=None):
+        r"""Get :class:`~datetime.date`\ s by combining the given ``years``
+        with it.
+
+        >>> list(MonthDay(8, 4).dates(range(1988, 1992)))
+        [datetime.date(1988, 8, 4), datetime.date(1989, 8, 4),
+         datetime.date(1990, 8, 4), datetime.date(1991, 8, 4)]
+
+        It may raise :exc:`ValueError` if there happen to be any invalid
+        dates in the result, e.g. Feburary 29 for non-leap years:
+
+        >>> feb_29 = MonthDay(2, 29)
+        >>> list(feb_29.dates(range(2011, 2017)))
+        Traceback (most recent call last):
+          ...
+        ValueError: since 2010 is not a leap year,
+                    monthday.MonthDay(2, 29) can't be combined with 2010
+
+        If you want to simply ignore these invalid dates in the result,
+        set ``error_invalid_dates`` to :const:`False` e.g.:
+
+        >>> list(feb_29.dates(range(2011, 2017), error_invalid_dates=False))
+        [datetime.date(2012, 2, 29), datetime.date(2016, 2, 29)]
+
+        But the result length might be shorter than the input ``years`` list.
+
+        If you want to match the length of the input and the result, set
+        ``error_invalid_dates`` to :const:`None` --- it will replace invalid
+        dates in the result with :const:`None` values e.g.:
+
+        >>> list(feb_29.dates(range(2011, 2017), error_invalid_dates=None))
+        [None, datetime.date(2012, 2, 29),
+         None, None, None, datetime.date(2016, 2, 29)]
+
+        These are aliases of ``leap_policy`` values, which are
+        :const:`True` for ``'raise'``, :const:`False` for ``'skip'``,
+        and :const:`None` for ``'none'`` (see also :meth:`date()`).
+        The ``leap_policy`` also can substitute other dates for them:
+
+        >>> list(feb_29.dates(range(2011, 2013), leap_policy='mar1'))
+        [datetime.date(2011, 3, 1), datetime.date(2012, 2, 29)]
+
+        If ``years`` is a :class:`range`, it returns a lazy
+        :class:`MonthDayDates` sequence instead of a generator, so that
+        its length, any of its dates, and membership are computed without
+        iterating:
+
+        >>> occurrences = feb_29.dates(range(1900, 2100), False)
+        >>> len(occurrences)
+        49
+        >>> occurrences[-1]
+        datetime.date(2096, 2, 29)
+
+        :param years: years to combine with
+        :type years: :class:`~collections.abc.Iterable`
+        :param error_invalid_dates: if set to :const:`True`, raise
+                                    :exc:`ValueError` for invalid dates.
+                                    if set to :const:`False`, just ignore
+                                    invalid dates --- the result length might
+                                    be shorter than the input ``years`` list.
+                                    if set to :const:`None`, fill :const:`None`
+                                    values instead of invalid dates --- the
+                                    result length must be the same to the input
+                                    ``year`` list.  :const:`True` by default
+        :type error_invalid_dates: :class:`bool`, ``type(None)``
+        :param leap_policy: what to do for invalid dates.  one of ``'raise'``,
+                            ``'skip'``, ``'none'``, ``'feb28'``, and
+                            ``'mar1'``.  it takes precedence over
+                            ``error_invalid_dates`` if set
+        :type leap_policy: :class:`str`
+        :return: :class:`datetime.date` values with the given ``years``.
+                 the order corresponds to the input ``years``' order
+        :rtype: :class:`~collections.abc.Iterable`, :class:`MonthDayDates`
+        :raise ValueError: if ``error_invalid_dates`` is set to :const:`True`
+                           and there happend to be any invalid dates in
+                           the result
+        :raise TypeError: if ``years`` is not iterable of integers
+
+        """
+        if not isinstance(years, Iterable):
+            raise TypeError('years must be iterable, not ' + repr(years))
+        elif leap_policy is None:
+            leap_policy = ('raise' if error_invalid_dates
+                           else 'skip' if error_invalid_dates is not None
+                           else 'none')
+        elif leap_policy not in _leap_substitutes:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_leap_substitutes),
+                                            leap_policy))
+        if isinstance(years, _range_types):
+            return MonthDayDates(self, years, leap_policy)
+        month, day = self.month, self.day
+        feb_29 = self._ordinal == _feb_29_ordinal
+        substitute = _leap_substitutes[leap_policy]
+
+        def generate():
+            for year in years:
+                if type(year) is not int:
+                    if not isinstance(year, numbers.Integral):
+                        raise TypeError('year must be an integer, not ' +
+                                        repr(year))
+                    year = int(year)
+                if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+                    pass
+                elif not feb_29 or year % 4 == 0 and (year % 100 != 0 or
+                                                      year % 400 == 0):
+                    yield datetime.date(year, month, day)
+                    continue
+                elif substitute is not None:
+                    yield datetime.date(year, *substitute)
+                    continue
+                if leap_policy == 'none':
+                    yield None
+                elif leap_policy != 'skip':
+                    # Let date() raise the proper error.
+                    yield self.date(year, leap_policy)
+        return generate()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Get a :class:`MonthDay` from the given 2-byte representation
+        made by :meth:`to_bytes()`.
+
+        >>> MonthDay.from_bytes(b'\\xd8\\x00')
+        monthday.MonthDay(8, 4)
+
+        :param data: 2 bytes
+        :type data: :class:`bytes`
+        :return: the decoded :class:`MonthDay`
+        :rtype: :class:`MonthDay`
+        :raise ValueError: if ``data`` is not a valid representation
+
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be bytes, not ' + repr(data))
+        data = bytearray(data)
+        if len(data) != 2:
+            raise ValueError('data must be 2 bytes, not {0}'.format(len(data)))
+        return cls.fromordinal(data[0] | data[1] << 8)
+
+    def to_bytes(self):
+        """Get the compact 2-byte representation of it, which is its
+        :meth:`toordinal()` in little endian.  :meth:`from_bytes()`
+        decodes it.
+
+        >>> MonthDay(8, 4).to_bytes() == b'\\xd8\\x00'
+        True
+
+        See also :func:`pack()` for many values at once.
+
+        :return: 2 bytes
+        :rtype: :class:`bytes`
+
+        """
+        return bytes(bytearray((self._ordinal & 0xff, self._ordinal >> 8)))
+
+    def __reduce__(self):
+        if type(self) is MonthDay:
+            return _unpickle, (self._ordinal,)
+        return type(self), (self.month, self.day)
+
+    def __setstate__(self, state):
+        # Only for loading pickles written by 0.9.0; see __new__().
+        if hasattr(self, '_ordinal'):
+            raise AttributeError('{0.__module__}.{0.__name__} is immutable'
+                                 .format(type(self)))
+        month, day = state
+        valid = type(self)(month, day)
+        object.__setattr__(self, 'month', valid.month)
+        object.__setattr__(self, 'day', valid.day)
+        object.__setattr__(self, '_ordinal', valid._ordinal)
+
+    def isoformat(self):
+        """Get the ISO 8601 representation of it, i.e., ``--MM-DD``.
+        :meth:`fromisoformat()` parses it back.
+
+        >>> MonthDay(8, 4).isoformat()
+        '--08-04'
+
+        :return: the ISO 8601 representation
+        :rtype: :class:`str`
+
+        """
+        return '--' + _str_table[self._ordinal]
+
+    @classmethod
+    def format_many(cls, month_days, format_spec=''):
+        """Format the given ``month_days`` at once.  It's equivalent to
+        ``[format(md, format_spec) for md in month_days]``, but looks up
+        the rendered strings only once:
+
+        >>> MonthDay.format_many([MonthDay(8, 4), MonthDay(12, 25)], '%b %-d')
+        ['Aug 4', 'Dec 25']
+
+        It also takes a :class:`monthday.array.MonthDayArray`.
+
+        :param month_days: :class:`MonthDay` values to format
+        :type month_days: :class:`~collections.abc.Iterable`
+        :param format_spec: the format spec (see :meth:`__format__()`).
+                            the same to :class:`str` by default
+        :type format_spec: :class:`str`
+        :return: formatted strings in the order of ``month_days``
+        :rtype: :class:`list`
+        :raise TypeError: if any of ``month_days`` is not
+                          a :class:`MonthDay`
+        :raise ValueError: if ``format_spec`` has any invalid directives
+
+        """
+        table = _format_table(format_spec)
+        ordinals = getattr(month_days, '_ordinals', None)
+        if ordinals is not None:
+            return [table[o] for o in ordinals.tolist()]
+        elif not isinstance(month_days, Iterable):
+            raise TypeError('month_days must be iterable, not ' +
+                            repr(month_days))
+        try:
+            return [table[md._ordinal] for md in month_days]
+        except AttributeError:
+            for i, md in enumerate(month_days):
+                if not isinstance(md, MonthDay):
+                    raise TypeError('month_days[{0}] must be an instance of '
+                                    'monthday.MonthDay, not {1!r}'.format(i,
+                                                                          md))
+            raise
+
+    def __format__(self, format_spec):
+        """Format it with :meth:`~datetime.date.strftime()`-like directives
+        limited to month and day:
+
+        ``%m``
+           Zero-padded month number, e.g., ``08``.
+        ``%-m``
+           Month number, e.g., ``8``.
+        ``%d``
+           Zero-padded day, e.g., ``04``.
+        ``%-d``
+           Day, e.g., ``4``.
+        ``%b``
+           Abbreviated month name, e.g., ``Aug``.
+        ``%B``
+           Full month name, e.g., ``August``.
+        ``%%``
+           A literal ``%``.
+
+        >>> '{0:%b %-d}'.format(MonthDay(8, 4))
+        'Aug 4'
+        >>> format(MonthDay(8, 4), '%d/%m')
+        '04/08'
+
+        An empty format spec is the same to :class:`str`.  Since there are
+        only 366 values, each format spec is rendered for all of them
+        at once when it's first used, and then looked up.  Month names are
+        of the locale at that time.
+
+        :param format_spec: the format spec
+        :type format_spec: :class:`str`
+        :return: the formatted string
+        :rtype: :class:`str`
+        :raise ValueError: if ``format_spec`` has any invalid directives
+
+        """
+        if not format_spec and type(format_spec) is str:
+            return _str_table[self._ordinal]
+        return _format_table(format_spec)[self._ordinal]
+
+    def __str__(self):
+        return _str_table[self._ordinal]
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r}, {2!r})'.format(
+            type(self), self.month, self.day
+        )
+
+
+class MonthDayDates(Sequence):
+    """Lazy sequence of :class:`~datetime.date` values which
+    :meth:`MonthDay.dates()` returns for a :class:`range` of years.  Dates
+    are made only when they're accessed, and :func:`len()`, indexing,
+    slicing, :func:`reversed()`, and ``in`` are all constant time, even for
+    February 29 with ``'skip'``, since leap years recur every 400 years:
+
+    >>> dates = MonthDay(2, 29).dates(range(1800, 2401), False)
+    >>> len(dates)
+    146
+    >>> dates[100]
+    datetime.date(2216, 2, 29)
+    >>> datetime.date(2096, 2, 29) in dates
+    True
+    >>> datetime.date(2100, 2, 28) in dates
+    False
+    >>> dates[:3]
+    monthday.MonthDayDates(monthday.MonthDay(2, 29), range(1800, 2401),
+                           'skip')[0:3]
+    >>> list(reversed(dates[:3]))
+    [datetime.date(1812, 2, 29), datetime.date(1808, 2, 29),
+     datetime.date(1804, 2, 29)]
+
+    Its elements are the same to what :meth:`MonthDay.dates()` generates for
+    other iterables, including raising :exc:`ValueError` for invalid dates
+    with the ``'raise'`` policy, when they're accessed.
+
+    :param month_day: the date without year
+    :type month_day: :class:`MonthDay`
+    :param years: years to combine with
+    :type years: :class:`range`
+    :param leap_policy: one of ``'raise'``, ``'skip'``, ``'none'``,
+                        ``'feb28'``, and ``'mar1'``
+    :type leap_policy: :class:`str`
+
+    """
+
+    __slots__ = ('month_day', 'years', 'leap_policy', '_base', '_period',
+                 '_offsets', '_length', '_indices')
+
+    def __init__(self, month_day, years, leap_policy='raise'):
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('month_day must be a monthday.MonthDay, not ' +
+                            repr(month_day))
+        elif not isinstance(years, _range_types):
+            raise TypeError('years must be a range, not ' + repr(years))
+        elif leap_policy not in _leap_substitutes:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_leap_substitutes),
+                                            leap_policy))
+        self.month_day = month_day
+        self.years = years
+        self.leap_policy = leap_policy
+        if leap_policy != 'skip':
+            # Every year has its element, even if it's None or an error.
+            base, period, offsets = years, 1, (0,)
+        else:
+            base = _clip_years(years)
+            if month_day._ordinal != _feb_29_ordinal:
+                period, offsets = 1, (0,)
+            else:
+                # Leap years recur every 400 years, i.e., every period
+                # steps of base.
+                period = 400 // _gcd(abs(base.step), 400)
+                offsets = tuple(k for k in range(period)
+                                if _is_leap(base.start + k * base.step))
+        self._base = base
+        self._period = period
+        self._offsets = offsets
+        if offsets:
+            full, rest = divmod(len(base), period)
+            length = full * len(offsets) + bisect.bisect_left(offsets, rest)
+        else:
+            length = 0
+        self._length = length
+        self._indices = range(length)
+
+    def _year(self, position):
+        quotient, remainder = divmod(position, len(self._offsets))
+        step = quotient * self._period + self._offsets[remainder]
+        return self._base.start + step * self._base.step
+
+    def _date(self, year):
+        month_day = self.month_day
+        if datetime.MINYEAR <= year <= datetime.MAXYEAR:
+            if month_day._ordinal != _feb_29_ordinal or _is_leap(year):
+                return datetime.date(year, month_day.month, month_day.day)
+            substitute = _leap_substitutes[self.leap_policy]
+            if substitute is not None:
+                return datetime.date(year, *substitute)
+        if self.leap_policy == 'none':
+            return None
+        # Let date() raise the proper error.
+        return month_day.date(year, self.leap_policy)
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = object.__new__(type(self))
+            for attr in MonthDayDates.__slots__:
+                setattr(view, attr, getattr(self, attr))
+            view._indices = self._indices[index]
+            return view
+        return self._date(self._year(self._indices[index]))
+
+    def _generate(self, indices):
+        if self._period != 1:
+            # February 29 with 'skip'; every year is a leap year.
+            date = datetime.date
+            year = self._year
+            for position in indices:
+                yield date(year(position), 2, 29)
+            return
+        base = self._base
+        years = range(base.start + indices.start * base.step,
+                      base.start + indices.stop * base.step,
+                      indices.step * base.step)
+        if years and self.month_day._ordinal != _feb_29_ordinal and \
+           datetime.MINYEAR <= min(years[0], years[-1]) and \
+           max(years[0], years[-1]) <= datetime.MAXYEAR:
+            date = datetime.date
+            month, day = self.month_day.month, self.month_day.day
+            for year in years:
+                yield date(year, month, day)
+            return
+        date = self._date
+        for year in years:
+            yield date(year)
+
+    def __iter__(self):
+        return self._generate(self._indices)
+
+    def __reversed__(self):
+        return self._generate(self._indices[::-1])
+
+    def _position(self, value):
+        if value is None:
+            if self.leap_policy == 'none':
+                for position in self._indices:
+                    if self._date(self._year(position)) is None:
+                        return position
+            return None
+        elif not isinstance(value, datetime.date) or \
+                isinstance(value, datetime.datetime):
+            return None
+        year = value.year
+        if year not in self._base:
+            return None
+        quotient, remainder = divmod(self._base.index(year), self._period)
+        try:
+            position = (quotient * len(self._offsets) +
+                        self._offsets.index(remainder))
+        except ValueError:
+            return None
+        if position not in self._indices:
+            return None
+        try:
+            date = self._date(year)
+        except ValueError:
+            return None
+        return position if date == value else None
+
+    def __contains__(self, value):
+        return self._position(value) is not None
+
+    def index(self, value, start=0, stop=None):
+        position = self._position(value)
+        if position is not None:
+            index = self._indices.index(position)
+            if start <= index and (stop is None or index < stop):
+                return index
+        raise ValueError('{0!r} is not in {1!r}'.format(value, self))
+
+    def count(self, value):
+        if value is None:
+            return sum(1 for date in self if date is None)
+        return int(value in self)
+
+    def __repr__(self):
+        r = '{0.__module__}.{0.__name__}({1!r}, {2!r}, {3!r})'.format(
+            type(self), self.month_day, self.years, self.leap_policy
+        )
+        indices = self._indices
+        if indices != range(self._length):
+            r += '[{0}:{1}'.format(indices.start, indices.stop)
+            if indices.step != 1:
+                r += ':{0}'.format(indices.step)
+            r += ']'
+        return r
+
+
+def pack(month_days):
+    """Pack the given ``month_days`` into compact bytes, 2 bytes for each
+    value, i.e., :meth:`MonthDay.to_bytes()` of all values concatenated.
+    :func:`unpack()` decodes them.
+
+    >>> pack([MonthDay(8, 4), MonthDay(12, 25)]) == b'\\xd8\\x00g\\x01'
+    True
+
+    :param month_days: :class:`MonthDay` values to pack
+    :type month_days: :class:`~collections.abc.Iterable`
+    :return: packed bytes
+    :rtype: :class:`bytes`
+    :raise TypeError: if any of ``month_days`` is not a :class:`MonthDay`
+
+    """
+    if not isinstance(month_days, (list, tuple)):
+        if not isinstance(month_days, Iterable):
+            raise TypeError('month_days must be iterable, not ' +
+                            repr(month_days))
+        month_days = list(month_days)
+    for type_ in set(map(type, month_days)):
+        if not issubclass(type_, MonthDay):
+            for i, md in enumerate(month_days):
+                if not isinstance(md, MonthDay):
+                    raise TypeError('month_days[{0}] must be an instance of '
+                                    'monthday.MonthDay, not {1!r}'.format(i,
+                                                                          md))
+    ordinals = stdarray.array('H', [md._ordinal for md in month_days])
+    if sys.byteorder != 'little':
+        ordinals.byteswap()
+    return _tobytes(ordinals)
+
+
+def unpack(data):
+    """Unpack the bytes made by :func:`pack()` into :class:`MonthDay`
+    values.
+
+    >>> unpack(b'\\xd8\\x00g\\x01')
+    [monthday.MonthDay(8, 4), monthday.MonthDay(12, 25)]
+
+    :param data: packed bytes
+    :type data: :class:`bytes`, :class:`bytearray`, :class:`memoryview`
+    :return: unpacked :class:`MonthDay` values
+    :rtype: :class:`list`
+    :raise ValueError: if ``data`` is not a valid packed bytes
+
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError('data must be bytes, not ' + repr(data))
+    ordinals = stdarray.array('H')
+    try:
+        _frombytes(ordinals, data)
+    except ValueError:
+        raise ValueError('data length must be even, not ' +
+                         repr(len(memoryview(data).tobytes())))
+    if sys.byteorder != 'little':
+        ordinals.byteswap()
+    if ordinals and max(ordinals) > 365:
+        raise ValueError('data contains invalid ordinals')
+    interned = _interned
+    return [interned[o] for o in ordinals]
+
+
+if hasattr(stdarray.array, 'frombytes'):
+    def _frombytes(array, data):
+        array.frombytes(data)
+
+    def _tobytes(array):
+        return array.tobytes()
+else:
+    # Python 2 names them fromstring()/tostring(), and the former takes
+    # neither memoryview nor bytearray.
+    def _frombytes(array, data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        array.fromstring(bytes(data))
+
+    def _tobytes(array):
+        return array.tostring()
+
+
+def _buffer_lines(buffer, window=1 << 16):
+    """Lazily split the bytes-like ``buffer`` into lines, without their
+    trailing ``\\n``, copying only a ``window`` of it at a time.
+
+    """
+    view = memoryview(buffer)
+    rest = b''
+    for start in range(0, len(view), window):
+        lines = view[start:start + window].tobytes().split(b'\n')
+        lines[0] = rest + lines[0]
+        rest = lines.pop()
+        for line in lines:
+            yield line
+    if rest:
+        yield rest
+
+
+def _unpickle(ordinal):
+    # Referred by pickles; do not rename.
+    return _interned[ordinal]
+
+
+def _substitute_day_of_year(leap_policy):
+    """Get the day of a non-leap year, counted from 0, on which February 29
+    is observed under the ``leap_policy``, or :const:`None` if it's not.
+
+    """
+    substitute = _leap_substitutes[leap_policy]
+    if substitute is None:
+        return None
+    month, day = substitute
+    return _month_offsets[month - 1] + day - 1 - (month > 2)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _clip_years(years):
+    # Narrow the range of years to datetime.MINYEAR through datetime.MAXYEAR.
+    start, step = years.start, years.step
+    if step > 0:
+        first = -((start - datetime.MINYEAR) // step)
+        last = (datetime.MAXYEAR - start) // step
+    else:
+        first = -((start - datetime.MAXYEAR) // step)
+        last = (datetime.MINYEAR - start) // step
+    return years[max(first, 0):max(last + 1, 0)]
+
+
+def _days_before_year(year):
+    # The same to datetime.date(year, 1, 1).toordinal() - 1, but also works
+    # for years out of datetime.MINYEAR and datetime.MAXYEAR.
+    year -= 1
+    return year * 365 + year // 4 - year // 100 + year // 400
+
+
+#: (:class:`tuple`) The number of days of each month in a leap year.
+_days_in_month = 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31
+
+#: (:class:`tuple`) The day-of-year ordinal of the first day of each month
+#: in a leap year.
+_month_offsets = tuple(sum(_days_in_month[:i]) for i in range(12))
+
+#: (:class:`int`) The ordinal of February 29.
+_feb_29_ordinal = 59
+
+#: (:class:`dict`) Leap policies to ``(month, day)`` pairs on which
+#: February 29 is observed in non-leap years, or :const:`None`.
+_leap_substitutes = {
+    'raise': None,
+    'skip': None,
+    'none': None,
+    'feb28': (2, 28),
+    'mar1': (3, 1),
+}
+
+#: (:class:`tuple`) Leap policies which observe February 29 on another day
+#: in non-leap years or skip it, for operations which can neither raise
+#: nor fill :const:`None`, e.g., :meth:`MonthDay.days_until()`.
+_observed_leap_policies = 'feb28', 'mar1', 'skip'
+
+#: (:class:`list`) Interned :class:`MonthDay` instances, indexed by
+#: their ordinals.
+_interned = [
+    MonthDay._new(month, day)
+    for month, days in enumerate(_days_in_month, 1)
+    for day in range(1, days + 1)
+]
+
+#: (:class:`dict`) :class:`MonthDay` values indexed by every string
+#: :meth:`MonthDay.parse()` takes, both as :class:`str` and :class:`bytes`.
+_parse_table = {}
+for _md in _interned:
+    for _format in '{0:02d}-{1:02d}', '--{0:02d}-{1:02d}', '{0:02d}{1:02d}':
+        _string = _format.format(_md.month, _md.day)
+        _parse_table[_string] = _parse_table[_string.encode()] = _md
+del _md, _format, _string
+
+#: (:class:`dict`) :data:`_parse_table` plus its keys with trailing
+#: newlines, for :meth:`MonthDay.parse_many()`.
+_parse_line_table = dict(_parse_table)
+for _string, _md in _parse_table.items():
+    for _newline in '\n', '\r\n', b'\n', b'\r\n', b'\r':
+        if isinstance(_newline, type(_string)):
+            _parse_line_table[_string + _newline] = _md
+del _string, _md, _newline
+
+#: The table of :meth:`MonthDay.date()` results, or :const:`None` if
+#: it's not enabled.  See :mod:`monthday.cache`.
+_date_cache = None
+
+#: (:class:`dict`) Cached :meth:`MonthDay.rotated_key()` functions,
+#: indexed by pivot ordinals.
+_rotated_keys = {}
+
+#: (:class:`list`) :class:`str` of :class:`MonthDay` values, indexed by
+#: their ordinals.
+_str_table = ['{0:02d}-{1:02d}'.format(md.month, md.day) for md in _interned]
+
+#: (:class:`dict`) :meth:`MonthDay.__format__()` directives to
+#: :meth:`str.format()` replacement fields.
+_format_directives = {
+    'm': '{month:02d}',
+    '-m': '{month}',
+    'd': '{day:02d}',
+    '-d': '{day}',
+    'b': '{month_abbr}',
+    'B': '{month_name}',
+    '%': '%',
+}
+
+#: (:class:`dict`) Rendered strings of :class:`MonthDay` values indexed by
+#: their ordinals, indexed by format specs.
+_format_tables = {'': _str_table}
+
+#: (:class:`int`) The maximum number of cached format specs.
+_format_tables_size = 256
+
+
+def _format_table(format_spec):
+    if type(format_spec) is str:
+        key = format_spec
+    elif isinstance(format_spec, _string_types):
+        # Unicode specs on Python 2 are equal to byte string ones, but
+        # render unicode strings.
+        key = format_spec,
+    else:
+        raise TypeError('format_spec must be a string, not ' +
+                        repr(format_spec))
+    try:
+        return _format_tables[key]
+    except KeyError:
+        pass
+    if not format_spec:
+        # The same to str(), but of the type of format_spec.
+        table = [format_spec + string for string in _str_table]
+        _format_tables[key] = table
+        return table
+    fields = []
+    literals = format_spec.replace('{', '{{').replace('}', '}}').split('%')
+    fields.append(literals[0])
+    rest = iter(literals[1:])
+    for piece in rest:
+        if not piece:
+            # '%%', or a trailing '%'.
+            try:
+                fields.append('%' + next(rest))
+            except StopIteration:
+                raise ValueError('format_spec must not end with a single '
+                                 "'%': " + repr(format_spec))
+            continue
+        directive = piece[:2] if piece[0] == '-' else piece[:1]
+        try:
+            fields.append(_format_directives[directive])
+        except KeyError:
+            raise ValueError('invalid directive %{0} in format_spec '
+                             '{1!r}'.format(piece[:2], format_spec))
+        fields.append(piece[len(directive):])
+    template = ''.join(fields)
+    table = [
+        template.format(month=md.month, day=md.day,
+                        month_abbr=calendar.month_abbr[md.month],
+                        month_name=calendar.month_name[md.month])
+        for md in _interned
+    ]
+    if len(_format_tables) >= _format_tables_size:
+        _format_tables.clear()
+        _format_tables[''] = _str_table
+    _format_tables[key] = table
+    return table
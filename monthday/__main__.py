@@ -0,0 +1,446 @@
+""":mod:`monthday.__main__` --- Command-line interface
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run ``python -m monthday`` with one of the following subcommands.  Each
+reads CSV from the given files or the standard input, and writes to
+the standard output, in large buffered chunks:
+
+``count`` (or ``group``)
+   Count values of a date column by month and day::
+
+       $ python -m monthday count --column birthday users.csv
+       01-01,1204
+       01-02,1113
+       ...
+
+``upcoming``
+   Print rows whose date column recurs within some days from a date,
+   prefixed by the occurrence and the number of days until it::
+
+       $ python -m monthday upcoming --column 1 --from 2015-12-24 --days 7
+       2015-12-25,1,alice,1988-12-25
+       ...
+
+``expand``
+   Combine month-days with a range of years::
+
+       $ python -m monthday expand --years 2015:2018 08-04 02-29
+       2015-08-04
+       2016-08-04
+       2017-08-04
+       2016-02-29
+
+Date columns can be either ``YYYY-MM-DD`` (optionally followed by a time),
+or one of the formats :meth:`MonthDay.parse() <monthday.MonthDay.parse>`
+takes.  They are looked up in tables instead of being parsed into
+:class:`datetime.date` objects.  Pass ``--stats`` to report throughput to
+the standard error.  It requires Python 3.
+
+"""
+from __future__ import absolute_import
+
+import argparse
+import array
+import csv
+import datetime
+import itertools
+import os
+import sys
+import time
+
+from . import MonthDay, _feb_29_ordinal, _interned, _parse_table
+from .containers import MonthDayCounter
+
+__all__ = 'main',
+
+
+#: (:class:`int`) The number of rows processed at a time.
+CHUNK_SIZE = 1 << 14
+
+#: (:class:`int`) The buffer size of input and output streams.
+BUFFER_SIZE = 1 << 20
+
+#: (:class:`int`) The maximum number of distinct cells memoized by
+#: :class:`_ColumnParser`.
+_memo_size = 1 << 16
+
+
+class _InvalidValue(ValueError):
+    pass
+
+
+class _ColumnParser(object):
+    """Map cells to ordinals, memoizing distinct cells."""
+
+    __slots__ = '_memo',
+
+    def __init__(self):
+        self._memo = {}
+
+    def __call__(self, value):
+        md = _parse_table.get(value)
+        if md is None and len(value) >= 10 and value[4] == '-' and \
+           value[7] == '-' and value[10:11] in ('', 'T', ' ') and \
+           value[:4].isdigit():
+            md = _parse_table.get(value[5:10])
+            if md is not None and md._ordinal == _feb_29_ordinal:
+                year = int(value[:4])
+                if not (year % 4 == 0 and (year % 100 != 0 or
+                                           year % 400 == 0)):
+                    md = None
+        if md is None:
+            raise _InvalidValue(value)
+        self._memo[value] = ordinal = md._ordinal
+        return ordinal
+
+    def ordinals(self, cells):
+        """Map the list of ``cells`` to a list of ordinals, where invalid
+        cells are mapped to :const:`None`.
+
+        """
+        # Look up cells at the C level, and parse only distinct new ones.
+        memo = self._memo
+        ordinals = list(map(memo.get, cells))
+        if None in ordinals:
+            missing = set(cells).difference(memo)
+            if len(memo) + len(missing) > _memo_size:
+                memo.clear()
+                missing = set(cells)
+            for cell in missing:
+                try:
+                    self(cell)
+                except _InvalidValue:
+                    pass
+            ordinals = list(map(memo.get, cells))
+        return ordinals
+
+
+def _reopen(stream, mode):
+    """Open the file descriptor of the standard ``stream`` again with
+    a buffer of :data:`BUFFER_SIZE` bytes, which never translates newlines,
+    as the csv module expects.  Closing it doesn't close the descriptor.
+    :const:`None` if the ``stream`` has no file descriptor.
+
+    """
+    try:
+        fileno = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    if 'w' in mode:
+        stream.flush()
+    return open(fileno, mode, buffering=BUFFER_SIZE, newline='',
+                encoding=stream.encoding, closefd=False)
+
+
+def _open_inputs(paths, stdin):
+    """Generate pairs of the path and the opened file of each of
+    ``paths``, where ``'-'`` means the ``stdin``.
+
+    """
+    for path in paths:
+        if path == '-':
+            f = _reopen(stdin, 'r')
+            if f is None:
+                yield path, stdin
+                continue
+        else:
+            f = open(path, newline='', buffering=BUFFER_SIZE)
+        with f:
+            yield path, f
+
+
+def _input_name(path):
+    return '<stdin>' if path == '-' else path
+
+
+def _read(reader, path, size):
+    """Read up to ``size`` rows from the csv ``reader`` of ``path``.
+    Exit with an error message if they can't be decoded.
+
+    """
+    try:
+        return list(itertools.islice(reader, size))
+    except UnicodeDecodeError as e:
+        raise SystemExit('error: {0}: {1}'.format(_input_name(path), e))
+
+
+def _rows(args, stdin):
+    """Generate pairs of a list of rows and a list of their ordinals,
+    :data:`CHUNK_SIZE` rows at a time.  Ordinals are :const:`None` for
+    invalid cells if ``--skip-invalid`` is set.
+
+    """
+    parse = _ColumnParser()
+    for path, f in _open_inputs(args.files, stdin):
+        reader = csv.reader(f, delimiter=args.delimiter)
+        column = args.column
+        rows = 0
+        if args.header or not column.isdigit():
+            header = _read(reader, path, 1)
+            if not header:
+                continue
+            elif column.isdigit():
+                column = int(column)
+            else:
+                try:
+                    column = header[0].index(column)
+                except ValueError:
+                    raise SystemExit('error: no column {0!r} in {1}'.format(
+                        column, _input_name(path)
+                    ))
+        else:
+            column = int(column)
+        while True:
+            chunk = _read(reader, path, CHUNK_SIZE)
+            if not chunk:
+                break
+            try:
+                cells = [row[column] for row in chunk]
+            except IndexError:
+                cells = [row[column] if column < len(row) else ''
+                         for row in chunk]
+            ordinals = parse.ordinals(cells)
+            if not args.skip_invalid and None in ordinals:
+                i = ordinals.index(None)
+                raise SystemExit('error: {0}: row {1}: invalid date: '
+                                 '{2!r}'.format(_input_name(path),
+                                                rows + i + 1, cells[i]))
+            rows += len(chunk)
+            yield chunk, ordinals
+
+
+def _count(args, stdin, stdout):
+    counter = MonthDayCounter()
+    rows = 0
+    for chunk, ordinals in _rows(args, stdin):
+        rows += len(chunk)
+        if args.skip_invalid:
+            ordinals = [o for o in ordinals if o is not None]
+        counter.update(array.array('H', ordinals))
+    if args.sort == 'count':
+        pairs = counter.most_common()
+    else:
+        pairs = counter.items()
+    delimiter = args.delimiter
+    stdout.write(''.join(
+        '{0}{1}{2}\n'.format(md, delimiter, count) for md, count in pairs
+    ))
+    return rows
+
+
+def _upcoming(args, stdin, stdout):
+    from_date = args.from_date
+    # Occurrences after date.max are out of the window.
+    max_days = (datetime.date.max - from_date).days
+    # There are only 366 values, so precompute every answer.
+    prefixes = {}
+    for md in _interned:
+        days = md.days_until(from_date, args.leap_policy)
+        if days < args.days and days <= max_days:
+            occurrence = from_date + datetime.timedelta(days=days)
+            prefixes[md._ordinal] = [occurrence.isoformat(), str(days)]
+    rows = 0
+    writer = csv.writer(stdout, delimiter=args.delimiter,
+                        lineterminator='\n')
+    for chunk, ordinals in _rows(args, stdin):
+        rows += len(chunk)
+        writer.writerows(
+            prefixes[ordinal] + row
+            for row, ordinal in zip(chunk, ordinals)
+            if ordinal in prefixes
+        )
+    return rows
+
+
+def _read_month_days(lines):
+    """Parse non-blank ``lines`` into :class:`~monthday.MonthDay` values.
+    Exit with an error message at the first invalid line.
+
+    """
+    current = [0, '']
+
+    def nonblank():
+        for lineno, line in enumerate(lines, 1):
+            if line.strip():
+                current[:] = lineno, line
+                yield line
+    month_days = MonthDay.parse_many(nonblank())
+    while True:
+        try:
+            md = next(month_days)
+        except StopIteration:
+            return
+        except UnicodeDecodeError as e:
+            raise SystemExit('error: <stdin>: {0}'.format(e))
+        except ValueError:
+            raise SystemExit('error: <stdin>: line {0}: invalid month-day: '
+                             '{1!r}'.format(current[0], current[1].strip()))
+        yield md
+
+
+def _expand(args, stdin, stdout):
+    if args.month_days:
+        month_days = args.month_days
+    else:
+        month_days = _read_month_days(stdin)
+    # Years out of the range of datetime.date have no dates, whatever
+    # the leap policy is.
+    years = range(max(args.years.start, datetime.MINYEAR),
+                  min(args.years.stop, datetime.MAXYEAR + 1))
+    # Year prefixes are shared by every value but February 29.
+    prefixes = ['{0:04d}-'.format(year) for year in years]
+    rows = 0
+    lines = []
+    for md in month_days:
+        if md._ordinal == _feb_29_ordinal:
+            lines.extend(
+                d.isoformat()
+                for d in md.dates(years, leap_policy=args.leap_policy)
+            )
+        else:
+            suffix = str(md)
+            lines.extend(prefix + suffix for prefix in prefixes)
+        if len(lines) >= CHUNK_SIZE:
+            rows += len(lines)
+            lines.append('')
+            stdout.write('\n'.join(lines))
+            del lines[:]
+    if lines:
+        rows += len(lines)
+        lines.append('')
+        stdout.write('\n'.join(lines))
+    return rows
+
+
+def _parse_month_day(string):
+    try:
+        return MonthDay.parse(string)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _parse_date(string):
+    try:
+        return datetime.datetime.strptime(string, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError('invalid date: ' + repr(string))
+
+
+def _parse_years(string):
+    try:
+        start, stop = string.split(':')
+        return range(int(start), int(stop) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            'years must be START:END (inclusive), not ' + repr(string)
+        )
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python -m monthday',
+                                     description='Date without year.')
+    parser.add_argument('--stats', action='store_true',
+                        help='report throughput to the standard error')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+    csv_options = argparse.ArgumentParser(add_help=False)
+    csv_options.add_argument('files', metavar='FILE', nargs='*',
+                             default=['-'],
+                             help='CSV files to read.  the standard input '
+                                  'by default')
+    csv_options.add_argument('-c', '--column', default='0',
+                             help='the index (from 0) or the header name of '
+                                  'the date column.  names imply --header '
+                                  '[default: %(default)s]')
+    csv_options.add_argument('--header', action='store_true',
+                             help='skip the first row as a header')
+    csv_options.add_argument('-d', '--delimiter', default=',',
+                             help='the field delimiter [default: '
+                                  '%(default)r]')
+    csv_options.add_argument('--skip-invalid', action='store_true',
+                             help='skip invalid dates instead of failing')
+    leap_options = argparse.ArgumentParser(add_help=False)
+    leap_options.add_argument('--leap-policy', default='skip',
+                              choices=['skip', 'feb28', 'mar1'],
+                              help='how to treat February 29 in non-leap '
+                                   'years [default: %(default)s]')
+    count = commands.add_parser('count', aliases=['group'],
+                                parents=[csv_options],
+                                help='count a date column by month-day')
+    count.add_argument('--sort', choices=['date', 'count'], default='date',
+                       help='the order of output [default: %(default)s]')
+    count.set_defaults(function=_count)
+    upcoming = commands.add_parser(
+        'upcoming', parents=[csv_options, leap_options],
+        help='print rows recurring within some days'
+    )
+    upcoming.add_argument('--from', dest='from_date', type=_parse_date,
+                          default=datetime.date.today(),
+                          help='the date to count from, in YYYY-MM-DD '
+                               '[default: today]')
+    upcoming.add_argument('--days', type=int, default=30,
+                          help='the number of days since --from, '
+                               'inclusive [default: %(default)s]')
+    upcoming.set_defaults(function=_upcoming)
+    expand = commands.add_parser(
+        'expand', parents=[leap_options],
+        help='combine month-days with a range of years'
+    )
+    expand.add_argument('month_days', metavar='MM-DD', nargs='*',
+                        type=_parse_month_day,
+                        help='month-days to expand.  read from lines of '
+                             'the standard input if omitted')
+    expand.add_argument('-y', '--years', type=_parse_years, required=True,
+                        help='the inclusive range of years, e.g., 2015:2020')
+    expand.set_defaults(function=_expand)
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    """Run the command-line interface.
+
+    :param argv: command-line arguments.  :data:`sys.argv` by default
+    :type argv: :class:`~collections.abc.Sequence`
+    :param stdin: the input stream.  :data:`sys.stdin` by default
+    :param stdout: the output stream.  :data:`sys.stdout` by default
+    :param stderr: the stream to report throughput.
+                   :data:`sys.stderr` by default
+    :return: the exit status
+    :rtype: :class:`int`
+
+    """
+    args = _parser().parse_args(argv)
+    if stdin is None:
+        stdin = sys.stdin
+    if stderr is None:
+        stderr = sys.stderr
+    own_stdout = stdout is None
+    if own_stdout:
+        stdout = _reopen(sys.stdout, 'w')
+        if stdout is None:
+            stdout = sys.stdout
+            own_stdout = False
+    started = time.time()
+    try:
+        rows = args.function(args, stdin, stdout)
+        stdout.flush()
+    except BrokenPipeError:
+        if not own_stdout:
+            raise
+        # The reader, e.g., head(1), has gone; silence the final flush.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if own_stdout:
+            stdout.close()
+    if args.stats:
+        elapsed = max(time.time() - started, 1e-9)
+        stderr.write('{0}: {1} rows in {2:.3f}s ({3:,.0f} rows/s)\n'.format(
+            args.command, rows, elapsed, rows / elapsed
+        ))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+""":mod:`monthday.aio` --- asyncio anniversary notifier
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module requires Python 3.5 or higher.
+
+"""
+import asyncio
+import datetime
+
+from . import _observed_leap_policies
+from .index import MonthDayIndex
+
+__all__ = 'AnniversaryNotifier', 'SystemClock'
+
+
+class SystemClock(object):
+    """The default clock of :class:`AnniversaryNotifier`, which follows
+    the local time.  Any object having the same methods can be used instead,
+    e.g., a fake clock for testing.
+
+    """
+
+    def now(self):
+        """Get the current local date/time.
+
+        :return: the current date/time
+        :rtype: :class:`datetime.datetime`
+
+        """
+        return datetime.datetime.now()
+
+    async def sleep(self, seconds):
+        """Sleep for the given ``seconds``.
+
+        :param seconds: seconds to sleep
+        :type seconds: :class:`float`
+
+        """
+        await asyncio.sleep(seconds)
+
+
+class AnniversaryNotifier(object):
+    """Asynchronous iterator of ``(date, key)`` pairs which are due,
+    for ``async for`` loops.  Instead of polling, it computes the next due
+    occurrence from its :class:`~monthday.index.MonthDayIndex`, and sleeps
+    until the day of it:
+
+    .. code-block:: python
+
+       notifier = AnniversaryNotifier()
+       notifier.register('alice', MonthDay(8, 4))
+       async for date, key in notifier:
+           await send_greetings(key)
+
+    It starts from the day the iteration starts, and yields occurrences
+    on that day immediately.  Keys can be registered and canceled while
+    it's running, and then it wakes up to reconsider the next due occurrence
+    without rescanning the whole registry.
+
+    :param month_days: an optional initial mapping of keys to
+                       :class:`~monthday.MonthDay` values
+    :type month_days: :class:`~collections.abc.Mapping`
+    :param leap_policy: how to treat February 29 in non-leap years.
+                        see also :meth:`MonthDayIndex.between()
+                        <monthday.index.MonthDayIndex.between>`
+    :type leap_policy: :class:`str`
+    :param clock: the clock to follow.  :class:`SystemClock` by default
+
+    """
+
+    def __init__(self, month_days=(), leap_policy='skip', clock=None):
+        if leap_policy not in _observed_leap_policies:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_observed_leap_policies),
+                                            leap_policy))
+        self.index = MonthDayIndex(month_days)
+        self.leap_policy = leap_policy
+        self.clock = SystemClock() if clock is None else clock
+        # Made by _wait() for each wait, since an Event binds to the event
+        # loop current when it's made on Python 3.9 or lower, and this may
+        # be made before the loop.
+        self._changed = None
+        self._since = None
+        self._pending = []
+        self._stopped = False
+
+    def register(self, key, month_day):
+        """Register the given ``key`` with its ``month_day``.  If the ``key``
+        is already registered, it's replaced.
+
+        :param key: an arbitrary key, e.g., a user id
+        :param month_day: the month and day the ``key`` occurs
+        :type month_day: :class:`~monthday.MonthDay`
+
+        """
+        self.index[key] = month_day
+        self._notify()
+
+    def cancel(self, key):
+        """Cancel the registration of the given ``key``.
+
+        :param key: the key to cancel
+        :raise KeyError: if the ``key`` is not registered
+
+        """
+        del self.index[key]
+        self._notify()
+
+    def stop(self):
+        """Stop the iteration.  Pending ``async for`` loops end."""
+        self._stopped = True
+        self._notify()
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._stopped:
+            today = self.clock.now().date()
+            if self._since is None or self._since < today:
+                # Occurrences the clock has already passed, e.g., of keys
+                # registered late, are never due.
+                self._since = today
+            while self._pending:
+                date, key = self._pending.pop()
+                if key in self.index:
+                    return date, key
+            due = None
+            for date, _ in self.index.occurrences(self._since,
+                                                  self.leap_policy):
+                due = date
+                break
+            if due is not None and due <= today:
+                pending = list(self.index.between(due, due, self.leap_policy))
+                pending.reverse()
+                self._pending = pending
+                self._since = due + datetime.timedelta(days=1)
+                continue
+            await self._wait(due)
+        raise StopAsyncIteration
+
+    async def _wait(self, due):
+        """Sleep until the ``due`` date, or any registration changes."""
+        self._changed = changed = asyncio.Event()
+        waiters = [asyncio.ensure_future(changed.wait())]
+        if due is not None:
+            midnight = datetime.datetime.combine(due, datetime.time())
+            seconds = (midnight - self.clock.now()).total_seconds()
+            waiters.append(
+                asyncio.ensure_future(self.clock.sleep(max(seconds, 0)))
+            )
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
@@ -0,0 +1,350 @@
+""":mod:`monthday.array` --- Columnar array of dates without year
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module requires NumPy_.  It stores :class:`~monthday.MonthDay` values
+as their ordinals (see :meth:`MonthDay.toordinal()
+<monthday.MonthDay.toordinal>`) in a compact ``uint16`` buffer, so that
+a column of millions of values can be combined with years in a single
+vectorized call.
+
+.. _NumPy: http://www.numpy.org/
+
+"""
+import numbers
+
+import numpy
+
+from . import (MonthDay, _interned, _month_offsets, _observed_leap_policies,
+               _substitute_day_of_year)
+
+__all__ = 'MonthDayArray',
+
+
+#: (:class:`numpy.ndarray`) The day-of-year ordinal of the first day of
+#: each month in a leap year.
+_offsets = numpy.array(_month_offsets, dtype=numpy.int64)
+
+
+class MonthDayArray(object):
+    """Array of :class:`~monthday.MonthDay` values backed by a ``uint16``
+    NumPy buffer of their ordinals.
+
+    >>> from monthday import MonthDay
+    >>> array = MonthDayArray([MonthDay(8, 4), MonthDay(2, 29)])
+    >>> len(array)
+    2
+    >>> array[0]
+    monthday.MonthDay(8, 4)
+    >>> list(array)
+    [monthday.MonthDay(8, 4), monthday.MonthDay(2, 29)]
+
+    :param month_days: :class:`~monthday.MonthDay` values
+    :type month_days: :class:`~collections.abc.Iterable`
+    :raise TypeError: if any of ``month_days`` is not
+                      a :class:`~monthday.MonthDay`
+
+    """
+
+    __slots__ = '_ordinals',
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """Make an array from the given day-of-year ``ordinals``.
+
+        >>> MonthDayArray.from_ordinals([0, 59, 365])
+        monthday.array.MonthDayArray([monthday.MonthDay(1, 1),
+                                      monthday.MonthDay(2, 29),
+                                      monthday.MonthDay(12, 31)])
+
+        :param ordinals: integers from 0 to 365
+        :type ordinals: :class:`numpy.ndarray`,
+                        :class:`~collections.abc.Iterable`
+        :return: an array of the corresponding values
+        :rtype: :class:`MonthDayArray`
+        :raise ValueError: if any of ``ordinals`` is out of valid range
+
+        """
+        ordinals = numpy.asarray(ordinals)
+        if ordinals.ndim != 1:
+            raise ValueError('ordinals must be one-dimensional')
+        elif ordinals.size and not numpy.issubdtype(ordinals.dtype,
+                                                    numpy.integer):
+            raise TypeError('ordinals must be integers, not ' +
+                            str(ordinals.dtype))
+        elif ordinals.size and (ordinals.min() < 0 or ordinals.max() > 365):
+            raise ValueError('ordinals must be from 0 to 365')
+        return cls._from_buffer(ordinals.astype(numpy.uint16))
+
+    @classmethod
+    def from_datetime64(cls, dates):
+        """Make an array from the given NumPy ``dates``, dropping their
+        years.
+
+        >>> import numpy
+        >>> dates = numpy.array(['1988-08-04', '2016-02-29'],
+        ...                     dtype='datetime64[D]')
+        >>> MonthDayArray.from_datetime64(dates)
+        monthday.array.MonthDayArray([monthday.MonthDay(8, 4),
+                                      monthday.MonthDay(2, 29)])
+
+        :param dates: an array of dates or date/times
+        :type dates: :class:`numpy.ndarray` of ``datetime64``
+        :return: an array of :class:`~monthday.MonthDay` values without
+                 ``dates``' years
+        :rtype: :class:`MonthDayArray`
+        :raise ValueError: if there are any ``NaT`` values in ``dates``
+
+        """
+        dates = numpy.asarray(dates)
+        if dates.dtype.kind != 'M':
+            raise TypeError('dates must be an array of datetime64, not ' +
+                            str(dates.dtype))
+        elif dates.ndim != 1:
+            raise ValueError('dates must be one-dimensional')
+        days = dates.astype('datetime64[D]')
+        if numpy.isnat(days).any():
+            raise ValueError('dates must not contain NaT')
+        months = days.astype('datetime64[M]')
+        month_numbers = (months - days.astype('datetime64[Y]')).astype(
+            numpy.int64
+        )
+        ordinals = _offsets[month_numbers] + (days - months).astype(
+            numpy.int64
+        )
+        return cls._from_buffer(ordinals.astype(numpy.uint16))
+
+    @classmethod
+    def _from_buffer(cls, ordinals):
+        self = object.__new__(cls)
+        self._ordinals = ordinals
+        return self
+
+    def __init__(self, month_days):
+        if isinstance(month_days, MonthDayArray):
+            self._ordinals = month_days._ordinals.copy()
+            return
+        ordinals = []
+        append = ordinals.append
+        for month_day in month_days:
+            if not isinstance(month_day, MonthDay):
+                raise TypeError('expected monthday.MonthDay, not ' +
+                                repr(month_day))
+            append(month_day._ordinal)
+        self._ordinals = numpy.array(ordinals, dtype=numpy.uint16)
+
+    @property
+    def ordinals(self):
+        """(:class:`numpy.ndarray`) The read-only ``uint16`` buffer of
+        day-of-year ordinals.
+
+        """
+        view = self._ordinals.view()
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __iter__(self):
+        interned = _interned
+        for ordinal in self._ordinals.tolist():
+            yield interned[ordinal]
+
+    def __getitem__(self, index):
+        if isinstance(index, numbers.Integral):
+            return _interned[int(self._ordinals[index])]
+        return self._from_buffer(self._ordinals[index])
+
+    def __eq__(self, other):
+        if isinstance(other, MonthDayArray):
+            return numpy.array_equal(self._ordinals, other._ordinals)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, MonthDayArray):
+            return not numpy.array_equal(self._ordinals, other._ordinals)
+        return NotImplemented
+
+    __hash__ = None
+
+    def date(self, years):
+        """Combine the given ``years`` with every value in the array at once.
+        Unlike :meth:`MonthDay.date() <monthday.MonthDay.date>`, it doesn't
+        raise :exc:`ValueError` for February 29 with non-leap years, but
+        fills ``NaT`` for them instead, and reports them as a mask:
+
+        >>> from monthday import MonthDay
+        >>> array = MonthDayArray([MonthDay(8, 4), MonthDay(2, 29)])
+        >>> dates, invalid = array.date(2015)
+        >>> dates
+        array(['2015-08-04', 'NaT'], dtype='datetime64[D]')
+        >>> invalid
+        array([False,  True])
+        >>> dates, invalid = array.date([2016, 2016])
+        >>> dates
+        array(['2016-08-04', '2016-02-29'], dtype='datetime64[D]')
+
+        :param years: a year, or years of the same length to the array
+        :type years: :class:`numbers.Integral`, :class:`numpy.ndarray`
+        :return: a pair of ``datetime64[D]`` dates, and a boolean mask which
+                 is :const:`True` for invalid dates
+        :rtype: :class:`tuple`
+
+        """
+        years = numpy.asarray(years)
+        if years.size and not numpy.issubdtype(years.dtype, numpy.integer):
+            raise TypeError('years must be integers, not ' + str(years.dtype))
+        years = years.astype(numpy.int64)
+        ordinals = self._ordinals.astype(numpy.int64)
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        after_feb = (ordinals > 59) & ~leap
+        invalid = (ordinals == 59) & ~leap
+        dates = (
+            (years - 1970).astype('datetime64[Y]').astype('datetime64[D]') +
+            (ordinals - after_feb)
+        )
+        dates[invalid] = numpy.datetime64('NaT')
+        return dates, invalid
+
+    def days_until(self, dates, leap_policy='skip'):
+        """Count the days from the given ``dates`` until the next occurrence
+        of each value at once.  See also :meth:`MonthDay.days_until()
+        <monthday.MonthDay.days_until>`:
+
+        >>> import numpy
+        >>> from monthday import MonthDay
+        >>> array = MonthDayArray([MonthDay(12, 25), MonthDay(1, 1),
+        ...                        MonthDay(2, 29)])
+        >>> array.days_until(numpy.datetime64('2015-12-24'))
+        array([  1,   8, 67])
+
+        It's handy to rank values by proximity, e.g.:
+
+        >>> array[array.days_until(numpy.datetime64('2015-12-24')).argsort()]
+        monthday.array.MonthDayArray([monthday.MonthDay(12, 25),
+                                      monthday.MonthDay(1, 1),
+                                      monthday.MonthDay(2, 29)])
+
+        :param dates: a date, or dates of the same length to the array
+        :type dates: :class:`datetime.date`, :class:`numpy.ndarray`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: ``int64`` numbers of days
+        :rtype: :class:`numpy.ndarray`
+        :raise ValueError: if there are any ``NaT`` values in ``dates``
+
+        """
+        return self._days_from(dates, leap_policy, 1)
+
+    def days_since(self, dates, leap_policy='skip'):
+        """Count the days from the last occurrence of each value until
+        the given ``dates`` at once.  See also :meth:`MonthDay.days_since()
+        <monthday.MonthDay.days_since>`.
+
+        :param dates: a date, or dates of the same length to the array
+        :type dates: :class:`datetime.date`, :class:`numpy.ndarray`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: ``int64`` numbers of days
+        :rtype: :class:`numpy.ndarray`
+        :raise ValueError: if there are any ``NaT`` values in ``dates``
+
+        """
+        return self._days_from(dates, leap_policy, -1)
+
+    def _days_from(self, dates, leap_policy, step):
+        if leap_policy not in _observed_leap_policies:
+            raise ValueError("leap_policy must be one of 'skip', 'feb28', "
+                             "and 'mar1', not " + repr(leap_policy))
+        substitute = _substitute_day_of_year(leap_policy)
+        dates = numpy.asarray(dates)
+        if dates.dtype.kind not in 'MO':
+            raise TypeError('dates must be datetime64, not ' +
+                            str(dates.dtype))
+        days = dates.astype('datetime64[D]')
+        if numpy.isnat(days).any():
+            raise ValueError('dates must not contain NaT')
+        days = numpy.broadcast_to(days, self._ordinals.shape)
+        years = days.astype('datetime64[Y]').astype(numpy.int64) + 1970
+        ordinals = self._ordinals.astype(numpy.int64)
+        result = numpy.empty(self._ordinals.shape, dtype=numpy.int64)
+        pending = numpy.arange(len(ordinals))
+        # Only February 29 with 'skip' needs more than two years
+        # (e.g., 1896 to 1904), and never more than nine.
+        while pending.size:
+            leap = ((years % 4 == 0) &
+                    ((years % 100 != 0) | (years % 400 == 0)))
+            day_of_year = ordinals - ((ordinals > 59) & ~leap)
+            valid = (ordinals != 59) | leap
+            if substitute is not None:
+                day_of_year[~valid] = substitute
+                valid[:] = True
+            occurrences = (
+                (years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+                + day_of_year
+            )
+            distances = (occurrences - days).astype(numpy.int64) * step
+            found = valid & (distances >= 0)
+            result[pending[found]] = distances[found]
+            rest = ~found
+            pending, days, ordinals = pending[rest], days[rest], ordinals[rest]
+            years = years[rest] + step
+        return result
+
+    def is_today(self, zone_codes, zones, instant=None, leap_policy='skip'):
+        """Evaluate whether each value is today in its time zone at
+        the given ``instant`` at once.  Time zones are given as codes,
+        which index the ``zones`` sequence, so that the local date of
+        each zone is computed only once:
+
+        >>> import datetime
+        >>> from monthday import MonthDay
+        >>> array = MonthDayArray([MonthDay(12, 25), MonthDay(12, 25),
+        ...                        MonthDay(12, 24)])
+        >>> instant = datetime.datetime(2015, 12, 24, 20, 0,
+        ...                             tzinfo=datetime.timezone.utc)
+        >>> array.is_today([0, 1, 1], ['Asia/Seoul', 'America/New_York'],
+        ...                instant)
+        array([ True, False,  True])
+
+        See also :func:`monthday.zones.is_today()`.
+
+        :param zone_codes: indices of ``zones`` for each value
+        :type zone_codes: :class:`numpy.ndarray`
+        :param zones: time zones, which are :class:`datetime.tzinfo`
+                      objects or time zone names
+        :type zones: :class:`~collections.abc.Sequence`
+        :param instant: a timezone-aware instant.  the current time by
+                        default
+        :type instant: :class:`datetime.datetime`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: a boolean array
+        :rtype: :class:`numpy.ndarray`
+
+        """
+        from .zones import _check_instant, local_ordinals
+        instant = _check_instant(instant)
+        zone_codes = numpy.asarray(zone_codes)
+        if zone_codes.shape != self._ordinals.shape:
+            raise ValueError('zone_codes must have the same length to '
+                             'the array')
+        elif zone_codes.size and not numpy.issubdtype(zone_codes.dtype,
+                                                      numpy.integer):
+            raise TypeError('zone_codes must be integers, not ' +
+                            str(zone_codes.dtype))
+        todays = numpy.array(
+            [local_ordinals(zone, instant, leap_policy) for zone in zones],
+            dtype=numpy.int64
+        ).reshape(-1, 2)
+        todays = todays[zone_codes]
+        ordinals = self._ordinals.astype(numpy.int64)
+        return (ordinals == todays[:, 0]) | (ordinals == todays[:, 1])
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r})'.format(
+            type(self), list(self)
+        )
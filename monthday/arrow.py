@@ -0,0 +1,125 @@
+""":mod:`monthday.arrow` --- Arrow extension type
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module requires pyarrow_.  Importing it registers
+:class:`MonthDayType`, an Arrow extension type stored as ``uint16`` ordinals
+(see :meth:`MonthDay.toordinal() <monthday.MonthDay.toordinal>`), so that
+columns of :class:`~monthday.MonthDay` values are written to Parquet
+as small integers, and read back as the same type:
+
+>>> from monthday import MonthDay
+>>> array = from_month_days([MonthDay(8, 4), None, MonthDay(2, 29)])
+>>> array.type == MonthDayType()
+True
+>>> array.storage.to_pylist()
+[216, None, 59]
+>>> array.to_pylist()
+[monthday.MonthDay(8, 4), None, monthday.MonthDay(2, 29)]
+
+If pandas is installed as well, it's converted to and from
+the :class:`monthday.pandas.MonthDayDtype` without conversion through
+Python objects.
+
+.. _pyarrow: https://arrow.apache.org/docs/python/
+
+"""
+from __future__ import absolute_import
+
+import pyarrow
+
+from . import MonthDay, _interned
+
+__all__ = 'MonthDayScalar', 'MonthDayType', 'from_month_days'
+
+
+class MonthDayType(pyarrow.ExtensionType):
+    """The Arrow extension type of :class:`~monthday.MonthDay` values.
+    Its storage type is ``uint16``, and its name is ``'monthday.monthday'``.
+
+    """
+
+    def __init__(self):
+        super(MonthDayType, self).__init__(pyarrow.uint16(),
+                                           'monthday.monthday')
+
+    def __arrow_ext_serialize__(self):
+        return b''
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        if storage_type != pyarrow.uint16():
+            raise TypeError('storage_type must be uint16, not ' +
+                            str(storage_type))
+        return cls()
+
+    def __arrow_ext_scalar_class__(self):
+        return MonthDayScalar
+
+    def __reduce__(self):
+        return type(self), ()
+
+    def to_pandas_dtype(self):
+        from .pandas import MonthDayDtype
+        return MonthDayDtype()
+
+    @classmethod
+    def wrap(cls, ordinals, mask=None):
+        """Make an Arrow array from the given ordinals.
+
+        :param ordinals: integers from 0 to 365
+        :type ordinals: :class:`numpy.ndarray`,
+                        :class:`~collections.abc.Iterable`
+        :param mask: an optional boolean mask which is :const:`True` for
+                     missing values
+        :type mask: :class:`numpy.ndarray`
+        :return: an array of the type
+        :rtype: :class:`pyarrow.ExtensionArray`
+
+        """
+        storage = pyarrow.array(ordinals, type=pyarrow.uint16(), mask=mask)
+        return pyarrow.ExtensionArray.from_storage(cls(), storage)
+
+
+class MonthDayScalar(pyarrow.ExtensionScalar):
+    """The Arrow scalar of :class:`MonthDayType`.  Its :meth:`as_py()`
+    returns a :class:`~monthday.MonthDay`.
+
+    """
+
+    def as_py(self, **kwargs):
+        if self.value is None:
+            return None
+        return _interned[self.value.as_py()]
+
+
+def from_month_days(month_days):
+    """Make an Arrow array of :class:`MonthDayType` from the given
+    :class:`~monthday.MonthDay` values.
+
+    :param month_days: :class:`~monthday.MonthDay` values, or :const:`None`
+                       for missing values
+    :type month_days: :class:`~collections.abc.Iterable`
+    :return: an array of :class:`MonthDayType`
+    :rtype: :class:`pyarrow.ExtensionArray`
+    :raise TypeError: if any of ``month_days`` is neither
+                      a :class:`~monthday.MonthDay` nor :const:`None`
+
+    """
+    ordinals = []
+    append = ordinals.append
+    for month_day in month_days:
+        if month_day is None:
+            append(None)
+        elif isinstance(month_day, MonthDay):
+            append(month_day._ordinal)
+        else:
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+    return MonthDayType.wrap(ordinals)
+
+
+try:
+    pyarrow.register_extension_type(MonthDayType())
+except pyarrow.ArrowKeyError:
+    # Already registered, e.g., the module was reloaded.
+    pass
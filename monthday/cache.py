@@ -0,0 +1,116 @@
+""":mod:`monthday.cache` --- Opt-in memoization of dates
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Programs which call :meth:`MonthDay.date() <monthday.MonthDay.date>` for
+the same pairs of a value and a year over and over can turn on a dense
+table of its results, which has 366 slots for each year in a window.
+Looking up the table is several times faster than making
+a :class:`~datetime.date`, and repeated calls give the identical object:
+
+>>> from monthday import MonthDay
+>>> enable()
+>>> MonthDay(8, 4).date(2015) is MonthDay(8, 4).date(2015)
+True
+>>> stats = info()
+>>> stats.hits, stats.misses, stats.currsize
+(1, 1, 1)
+>>> disable()
+
+The window is from 1900 to 2100 by default, and :func:`enable()` takes
+another :class:`range` of years.
+
+Only valid dates are cached, so February 29 with non-leap years still
+raises :exc:`ValueError` (or follows the ``leap_policy``) every time.
+Years out of the window are computed as usual, and counted as misses.
+
+The table is safe to share among threads, since each slot is filled at
+most with equal dates, and hit and miss counts are updated under a lock.
+
+"""
+import collections
+import threading
+
+import monthday
+
+try:
+    _range = xrange
+except NameError:
+    _range = range
+
+__all__ = 'CacheInfo', 'clear', 'disable', 'enable', 'info'
+
+
+#: (:class:`type`) The named tuple type of :func:`info()`'s result.
+#: ``currsize`` is the number of cached dates.
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses years currsize')
+
+
+class _DateCache(object):
+
+    __slots__ = 'years', 'start', 'size', 'table', 'hits', 'misses', 'lock'
+
+    def __init__(self, years):
+        self.years = years
+        self.start = years[0]
+        self.size = len(years) * 366
+        self.table = [None] * self.size
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+
+def enable(years=_range(1900, 2101)):
+    """Enable the cache of :meth:`MonthDay.date()
+    <monthday.MonthDay.date>` for the given window of ``years``.  If it's
+    already enabled, the cache is replaced by an empty one.
+
+    :param years: the window of years to cache.  it takes 366 slots for
+                  each year.  from 1900 to 2100 by default
+    :type years: :class:`range` (:func:`xrange` on Python 2)
+    :raise ValueError: if ``years`` is empty, its step is not 1, or it's
+                       out of :data:`datetime.MINYEAR` and
+                       :data:`datetime.MAXYEAR`
+
+    """
+    # Python 2's xrange has no start/step/stop, so index it instead.
+    if not isinstance(years, _range):
+        raise TypeError('years must be a range, not ' + repr(years))
+    elif not years:
+        raise ValueError('years must not be empty')
+    elif len(years) > 1 and years[1] - years[0] != 1:
+        raise ValueError('years must be a range of step 1, not ' +
+                         repr(years))
+    elif years[0] < 1 or years[-1] > 9999:
+        raise ValueError('years must be from 1 to 9999, not ' + repr(years))
+    monthday._date_cache = _DateCache(years)
+
+
+def disable():
+    """Disable the cache, and drop cached dates."""
+    monthday._date_cache = None
+
+
+def clear():
+    """Drop cached dates, and reset the statistics.  The window of years
+    is kept.  It does nothing if the cache is not enabled.
+
+    """
+    cache = monthday._date_cache
+    if cache is not None:
+        monthday._date_cache = _DateCache(cache.years)
+
+
+def info():
+    """Get the statistics of the cache.
+
+    :return: the statistics, or :const:`None` if the cache is not enabled
+    :rtype: :class:`CacheInfo`
+
+    """
+    cache = monthday._date_cache
+    if cache is None:
+        return None
+    table = cache.table
+    with cache.lock:
+        hits, misses = cache.hits, cache.misses
+    return CacheInfo(hits, misses, cache.years,
+                     len(table) - table.count(None))
@@ -0,0 +1,588 @@
+""":mod:`monthday.containers` --- Dense containers of dates without year
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Since there are only 366 :class:`~monthday.MonthDay` values, sets and
+mappings of them don't need generic hash tables.  Containers in this module
+are indexed by ordinals (see :meth:`MonthDay.toordinal()
+<monthday.MonthDay.toordinal>`) instead, and iterate in chronological order.
+
+"""
+from __future__ import absolute_import
+
+import array
+import datetime
+import numbers
+import sys
+from collections import Counter
+
+try:
+    from collections.abc import (Iterable, Mapping, MutableMapping,
+                                 MutableSet, Set)
+except ImportError:
+    from collections import (Iterable, Mapping, MutableMapping, MutableSet,
+                             Set)
+
+from . import MonthDay, _frombytes, _interned, _month_offsets
+
+__all__ = 'MonthDayCounter', 'MonthDayMap', 'MonthDaySet'
+
+
+#: (:class:`int`) The bitmap having all 366 bits set.
+_full_bits = (1 << 366) - 1
+
+
+def _bit_count(bits):
+    try:
+        return bits.bit_count()
+    except AttributeError:
+        return bin(bits).count('1')
+
+
+class MonthDaySet(MutableSet):
+    """Set of :class:`~monthday.MonthDay` values stored as a 366-bit
+    integer bitmap, so that membership tests are constant time, and union,
+    intersection, and difference of two sets are done word by word:
+
+    >>> from monthday import MonthDay
+    >>> holidays = MonthDaySet([MonthDay(1, 1), MonthDay(12, 25)])
+    >>> blackout = MonthDaySet([MonthDay(12, 25), MonthDay(12, 31)])
+    >>> holidays & blackout
+    monthday.containers.MonthDaySet([monthday.MonthDay(12, 25)])
+    >>> MonthDay(1, 1) in holidays - blackout
+    True
+
+    :param month_days: initial values
+    :type month_days: :class:`~collections.abc.Iterable`
+    :raise TypeError: if any of ``month_days`` is not
+                      a :class:`~monthday.MonthDay`
+
+    """
+
+    __slots__ = '_bits',
+
+    @classmethod
+    def from_bits(cls, bits):
+        """Make a set from the given bitmap, which is the same to
+        :attr:`bits`.
+
+        :param bits: a bitmap whose ``i``-th bit is set if the ordinal ``i``
+                     is in the set
+        :type bits: :class:`int`
+        :return: a new set
+        :rtype: :class:`MonthDaySet`
+        :raise TypeError: if ``bits`` is not an integer
+        :raise ValueError: if ``bits`` has bits other than 366 bits
+
+        """
+        if not isinstance(bits, numbers.Integral):
+            raise TypeError('bits must be an integer, not ' + repr(bits))
+        elif not 0 <= bits <= _full_bits:
+            raise ValueError('bits must be from 0 to 2 ** 366 - 1')
+        result = cls()
+        result._bits = int(bits)
+        return result
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return cls(iterable)
+
+    def __init__(self, month_days=()):
+        bits = 0
+        if isinstance(month_days, MonthDaySet):
+            bits = month_days._bits
+        else:
+            for month_day in month_days:
+                if not isinstance(month_day, MonthDay):
+                    raise TypeError('expected monthday.MonthDay, not ' +
+                                    repr(month_day))
+                bits |= 1 << month_day._ordinal
+        self._bits = bits
+
+    @property
+    def bits(self):
+        """(:class:`int`) The bitmap whose ``i``-th bit is set if the ordinal
+        ``i`` is in the set.
+
+        """
+        return self._bits
+
+    def __len__(self):
+        return _bit_count(self._bits)
+
+    def __iter__(self):
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            yield _interned[lowest.bit_length() - 1]
+            bits ^= lowest
+
+    def __reversed__(self):
+        bits = self._bits
+        while bits:
+            ordinal = bits.bit_length() - 1
+            yield _interned[ordinal]
+            bits ^= 1 << ordinal
+
+    def __contains__(self, value):
+        return isinstance(value, MonthDay) and bool(
+            self._bits >> value._ordinal & 1
+        )
+
+    def add(self, value):
+        if not isinstance(value, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' + repr(value))
+        self._bits |= 1 << value._ordinal
+
+    def discard(self, value):
+        if isinstance(value, MonthDay):
+            self._bits &= ~(1 << value._ordinal)
+
+    def clear(self):
+        self._bits = 0
+
+    def copy(self):
+        """Make a shallow copy.
+
+        :return: a new set of the same values
+        :rtype: :class:`MonthDaySet`
+
+        """
+        return self.from_bits(self._bits)
+
+    def __eq__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self._bits == other._bits
+        return Set.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __le__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self._bits & ~other._bits == 0
+        return Set.__le__(self, other)
+
+    def __lt__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self._bits != other._bits and self <= other
+        return Set.__lt__(self, other)
+
+    def __ge__(self, other):
+        if isinstance(other, MonthDaySet):
+            return other <= self
+        return Set.__ge__(self, other)
+
+    def __gt__(self, other):
+        if isinstance(other, MonthDaySet):
+            return other < self
+        return Set.__gt__(self, other)
+
+    def isdisjoint(self, other):
+        if isinstance(other, MonthDaySet):
+            return not self._bits & other._bits
+        return Set.isdisjoint(self, other)
+
+    def __or__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self.from_bits(self._bits | other._bits)
+        return Set.__or__(self, other)
+
+    def __and__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self.from_bits(self._bits & other._bits)
+        return Set.__and__(self, other)
+
+    def __sub__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self.from_bits(self._bits & ~other._bits)
+        return Set.__sub__(self, other)
+
+    def __xor__(self, other):
+        if isinstance(other, MonthDaySet):
+            return self.from_bits(self._bits ^ other._bits)
+        return Set.__xor__(self, other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __ior__(self, other):
+        if isinstance(other, MonthDaySet):
+            self._bits |= other._bits
+            return self
+        return MutableSet.__ior__(self, other)
+
+    def __iand__(self, other):
+        if isinstance(other, MonthDaySet):
+            self._bits &= other._bits
+            return self
+        return MutableSet.__iand__(self, other)
+
+    def __isub__(self, other):
+        if isinstance(other, MonthDaySet):
+            self._bits &= ~other._bits
+            return self
+        return MutableSet.__isub__(self, other)
+
+    def __ixor__(self, other):
+        if isinstance(other, MonthDaySet):
+            self._bits ^= other._bits
+            return self
+        return MutableSet.__ixor__(self, other)
+
+    def __invert__(self):
+        """The complement, i.e., all :class:`~monthday.MonthDay` values
+        not in the set.
+
+        """
+        return self.from_bits(self._bits ^ _full_bits)
+
+    def __getstate__(self):
+        return self._bits
+
+    def __setstate__(self, state):
+        self._bits = state
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r})'.format(
+            type(self), list(self)
+        )
+
+
+#: The sentinel of empty slots of :class:`MonthDayMap`.
+_empty = object()
+
+
+class MonthDayMap(MutableMapping):
+    """Mapping of :class:`~monthday.MonthDay` keys backed by a 366-slot
+    array, so that lookups need no hashing, memory use is predictable,
+    and iteration is in chronological order:
+
+    >>> from monthday import MonthDay
+    >>> holidays = MonthDayMap()
+    >>> holidays[MonthDay(12, 25)] = 'Christmas'
+    >>> holidays[MonthDay(1, 1)] = "New Year's Day"
+    >>> list(holidays.items())
+    [(monthday.MonthDay(1, 1), "New Year's Day"),
+     (monthday.MonthDay(12, 25), 'Christmas')]
+
+    :param mapping: an optional initial mapping or iterable of pairs
+    :type mapping: :class:`~collections.abc.Mapping`,
+                   :class:`~collections.abc.Iterable`
+
+    """
+
+    __slots__ = '_slots', '_len'
+
+    def __init__(self, mapping=()):
+        self._slots = [_empty] * 366
+        self._len = 0
+        self.update(mapping)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for ordinal, value in enumerate(self._slots):
+            if value is not _empty:
+                yield _interned[ordinal]
+
+    def __reversed__(self):
+        slots = self._slots
+        for ordinal in range(365, -1, -1):
+            if slots[ordinal] is not _empty:
+                yield _interned[ordinal]
+
+    def __contains__(self, key):
+        return (isinstance(key, MonthDay) and
+                self._slots[key._ordinal] is not _empty)
+
+    def __getitem__(self, key):
+        if isinstance(key, MonthDay):
+            value = self._slots[key._ordinal]
+            if value is not _empty:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' + repr(key))
+        if self._slots[key._ordinal] is _empty:
+            self._len += 1
+        self._slots[key._ordinal] = value
+
+    def __delitem__(self, key):
+        if not isinstance(key, MonthDay) or \
+           self._slots[key._ordinal] is _empty:
+            raise KeyError(key)
+        self._slots[key._ordinal] = _empty
+        self._len -= 1
+
+    def clear(self):
+        self._slots = [_empty] * 366
+        self._len = 0
+
+    def keyset(self):
+        """Get the keys as a :class:`MonthDaySet`.
+
+        :return: the set of keys
+        :rtype: :class:`MonthDaySet`
+
+        """
+        bits = 0
+        for ordinal, value in enumerate(self._slots):
+            if value is not _empty:
+                bits |= 1 << ordinal
+        return MonthDaySet.from_bits(bits)
+
+    def __getstate__(self):
+        # The _empty sentinel can't survive pickling, so pickle pairs.
+        return list(self.items())
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r})'.format(
+            type(self), list(self.items())
+        )
+
+
+class MonthDayCounter(Mapping):
+    """Counter of :class:`~monthday.MonthDay` values backed by 366 slots.
+    It's fed chunk by chunk, and counts dates without making
+    a :class:`~monthday.MonthDay` object for each of them, so that it can
+    aggregate a stream too large to fit in memory:
+
+    >>> from datetime import date
+    >>> counter = MonthDayCounter()
+    >>> counter.update([date(1988, 8, 4), date(2015, 8, 4)])
+    >>> counter.update([date(2015, 12, 25)])
+    >>> counter[MonthDay(8, 4)]
+    2
+    >>> counter.most_common(1)
+    [(monthday.MonthDay(8, 4), 2)]
+
+    Partial counters, e.g., ones made by separate processes from shards of
+    the stream, can be merged:
+
+    >>> other = MonthDayCounter([[date(2000, 12, 25)]])
+    >>> sorted((counter + other).items())
+    [(monthday.MonthDay(8, 4), 2), (monthday.MonthDay(12, 25), 2)]
+
+    See :meth:`update()` for the types of chunks it takes.  Unlike
+    :class:`collections.Counter`, it gives ``0`` for values it never
+    counted, but iterates only over values counted at least once.
+
+    :param chunks: initial chunks to count
+    :type chunks: :class:`~collections.abc.Iterable`
+
+    """
+
+    __slots__ = '_counts',
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Make a counter from the given 366 counts, which are the same
+        to :attr:`counts`.
+
+        :param counts: counts indexed by ordinals
+        :type counts: :class:`~collections.abc.Sequence`
+        :return: a new counter
+        :rtype: :class:`MonthDayCounter`
+        :raise ValueError: if there aren't exactly 366 non-negative counts
+
+        """
+        counts = [int(c) for c in counts]
+        if len(counts) != 366:
+            raise ValueError('counts must have 366 elements, not ' +
+                             repr(len(counts)))
+        elif min(counts) < 0:
+            raise ValueError('counts must not be negative')
+        result = cls()
+        result._counts = counts
+        return result
+
+    def __init__(self, chunks=()):
+        self._counts = [0] * 366
+        for chunk in chunks:
+            self.update(chunk)
+
+    @property
+    def counts(self):
+        """(:class:`list`) The 366 counts indexed by ordinals (see
+        :meth:`MonthDay.toordinal() <monthday.MonthDay.toordinal>`).
+
+        """
+        return list(self._counts)
+
+    def update(self, chunk):
+        """Count the values in the given ``chunk``, which is one of:
+
+        - an iterable of :class:`datetime.date`\\ s (or
+          :class:`datetime.datetime`\\ s) and :class:`~monthday.MonthDay`
+          values;
+        - an :class:`array.array` of day-of-year ordinals (see
+          :meth:`MonthDay.toordinal() <monthday.MonthDay.toordinal>`);
+        - bytes made by :func:`monthday.pack()`;
+        - a NumPy array of ordinals, or of ``datetime64``;
+        - a :class:`monthday.array.MonthDayArray`;
+        - another :class:`MonthDayCounter`, which is merged.
+
+        NumPy arrays are counted in a single vectorized pass.
+
+        :param chunk: values to count
+        :raise TypeError: if ``chunk`` or any of its elements is of
+                          unsupported type
+        :raise ValueError: if any ordinal is out of valid range, or
+                           there's ``NaT`` in the NumPy array
+
+        """
+        counts = self._counts
+        if isinstance(chunk, MonthDayCounter):
+            for ordinal, count in enumerate(chunk._counts):
+                counts[ordinal] += count
+            return
+        dtype = getattr(chunk, 'dtype', None)
+        # A MonthDayArray can't exist unless monthday.array has been
+        # imported, so look it up there instead of importing NumPy.
+        array_module = sys.modules.get('monthday.array')
+        if dtype is None and array_module is not None and \
+           isinstance(chunk, array_module.MonthDayArray):
+            chunk = chunk.ordinals
+            dtype = chunk.dtype
+        if dtype is not None:
+            import numpy
+            if dtype.kind == 'M':
+                from .array import MonthDayArray
+                chunk = MonthDayArray.from_datetime64(
+                    numpy.asarray(chunk).ravel()
+                ).ordinals
+            elif dtype.kind not in 'iu':
+                raise TypeError('chunk must be an array of integers or '
+                                'datetime64, not ' + str(dtype))
+            elif chunk.size and (chunk.min() < 0 or chunk.max() > 365):
+                raise ValueError('chunk must consist of ordinals from 0 to '
+                                 '365')
+            binned = numpy.bincount(chunk.ravel(), minlength=366)
+            for ordinal, count in enumerate(binned.tolist()):
+                counts[ordinal] += count
+            return
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            ordinals = array.array('H')
+            try:
+                _frombytes(ordinals, chunk)
+            except ValueError:
+                raise ValueError('chunk length must be even, not ' +
+                                 repr(len(memoryview(chunk).tobytes())))
+            if sys.byteorder != 'little':
+                ordinals.byteswap()
+            chunk = ordinals
+        elif isinstance(chunk, array.array):
+            if chunk.typecode not in 'bBhHiIlLqQ':
+                raise TypeError('chunk must be an array of integers, not '
+                                'typecode {0!r}'.format(chunk.typecode))
+        elif isinstance(chunk, Iterable):
+            chunk = _ordinals_of(chunk)
+        else:
+            raise TypeError('chunk must be iterable, not ' + repr(chunk))
+        tally = Counter(chunk)
+        if tally and (min(tally) < 0 or max(tally) > 365):
+            raise ValueError('chunk must consist of ordinals from 0 to 365')
+        for ordinal, count in tally.items():
+            counts[ordinal] += count
+
+    def total(self):
+        """Get the sum of all counts.
+
+        :return: the number of counted values
+        :rtype: :class:`int`
+
+        """
+        return sum(self._counts)
+
+    def most_common(self, n=None):
+        """List the ``n`` most common values and their counts, from the most
+        common to the least.  Values of equal counts are in chronological
+        order.
+
+        :param n: the number of values to list.  all counted values
+                  by default
+        :type n: :class:`numbers.Integral`
+        :return: pairs of a :class:`~monthday.MonthDay` and its count
+        :rtype: :class:`list`
+
+        """
+        pairs = sorted(
+            ((ordinal, count) for ordinal, count in enumerate(self._counts)
+             if count),
+            key=lambda pair: -pair[1]
+        )
+        if n is not None:
+            pairs = pairs[:n]
+        return [(_interned[ordinal], count) for ordinal, count in pairs]
+
+    def __len__(self):
+        return 366 - self._counts.count(0)
+
+    def __iter__(self):
+        for ordinal, count in enumerate(self._counts):
+            if count:
+                yield _interned[ordinal]
+
+    def __contains__(self, key):
+        return isinstance(key, MonthDay) and bool(self._counts[key._ordinal])
+
+    def __getitem__(self, key):
+        if not isinstance(key, MonthDay):
+            raise KeyError(key)
+        return self._counts[key._ordinal]
+
+    def __add__(self, other):
+        if isinstance(other, MonthDayCounter):
+            return self.from_counts(
+                [a + b for a, b in zip(self._counts, other._counts)]
+            )
+        return NotImplemented
+
+    def __iadd__(self, other):
+        if isinstance(other, MonthDayCounter):
+            self.update(other)
+            return self
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, MonthDayCounter):
+            return self._counts == other._counts
+        return Mapping.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return self._counts
+
+    def __setstate__(self, state):
+        self._counts = state
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}.from_counts({1!r})'.format(
+            type(self), self._counts
+        )
+
+
+def _ordinals_of(values):
+    offsets = _month_offsets
+    date = datetime.date
+    for value in values:
+        if isinstance(value, MonthDay):
+            yield value._ordinal
+        elif isinstance(value, date):
+            yield offsets[value.month - 1] + value.day - 1
+        else:
+            raise TypeError('expected monthday.MonthDay or datetime.date, '
+                            'not ' + repr(value))
@@ -0,0 +1,275 @@
+""":mod:`monthday.index` --- Occurrence-window index
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import calendar
+import collections
+import datetime
+import numbers
+import sys
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from . import (MonthDay, _feb_29_ordinal as _feb_29, _interned,
+               _leap_substitutes, _month_offsets, _observed_leap_policies)
+
+__all__ = 'MonthDayIndex',
+
+
+if sys.version_info >= (3, 7):
+    _bucket = dict
+else:
+    # Buckets are ordered sets of keys, and dicts don't keep the order
+    # of insertion before Python 3.7.
+    _bucket = collections.OrderedDict
+
+
+class MonthDayIndex(MutableMapping):
+    """Mapping of arbitrary keys (e.g., user ids) to
+    :class:`~monthday.MonthDay` values, which is also indexed by day of year
+    so that it can quickly answer which keys occur between two dates.
+
+    >>> from datetime import date
+    >>> from monthday import MonthDay
+    >>> index = MonthDayIndex()
+    >>> index['alice'] = MonthDay(12, 30)
+    >>> index['bob'] = MonthDay(1, 2)
+    >>> index['carol'] = MonthDay(8, 4)
+    >>> list(index.between(date(2015, 12, 25), date(2016, 1, 5)))
+    [(datetime.date(2015, 12, 30), 'alice'),
+     (datetime.date(2016, 1, 2), 'bob')]
+
+    Keys are bucketed by their ordinals (see :meth:`MonthDay.toordinal()
+    <monthday.MonthDay.toordinal>`), so inserting and deleting a key
+    takes constant time, and a query doesn't scan any keys outside
+    its window.
+
+    :param mapping: an optional initial mapping of keys to
+                    :class:`~monthday.MonthDay` values
+    :type mapping: :class:`~collections.abc.Mapping`
+
+    """
+
+    def __init__(self, mapping=()):
+        self._month_days = {}
+        self._buckets = [_bucket() for _ in range(366)]
+        self.update(mapping)
+
+    def __len__(self):
+        return len(self._month_days)
+
+    def __iter__(self):
+        for bucket in self._buckets:
+            for key in bucket:
+                yield key
+
+    def __contains__(self, key):
+        return key in self._month_days
+
+    def __getitem__(self, key):
+        return self._month_days[key]
+
+    def __setitem__(self, key, month_day):
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+        previous = self._month_days.get(key)
+        if previous is not None:
+            del self._buckets[previous._ordinal][key]
+        self._month_days[key] = month_day
+        self._buckets[month_day._ordinal][key] = None
+
+    def __delitem__(self, key):
+        month_day = self._month_days.pop(key)
+        del self._buckets[month_day._ordinal][key]
+
+    def keys_on(self, month_day):
+        """Get the keys which have the given ``month_day``.
+
+        :param month_day: the month and day to look up
+        :type month_day: :class:`~monthday.MonthDay`
+        :return: the keys having ``month_day``
+        :rtype: :class:`list`
+
+        """
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+        return list(self._buckets[month_day._ordinal])
+
+    def between(self, start_date, end_date, leap_policy='skip'):
+        """Find occurrences between ``start_date`` and ``end_date``,
+        both inclusive, in chronological order.  The window may cross
+        New Year, and may be even longer than a year; then keys
+        occur once for each year.
+
+        Since February 29 doesn't occur in non-leap years, the
+        ``leap_policy`` decides how to treat keys having it:
+
+        ``'skip'``
+           Don't yield them in non-leap years.  The default.
+
+        ``'feb28'``
+           Yield them on February 28 in non-leap years.
+
+        ``'mar1'``
+           Yield them on March 1 in non-leap years.
+
+        >>> from datetime import date
+        >>> from monthday import MonthDay
+        >>> index = MonthDayIndex({'leapling': MonthDay(2, 29)})
+        >>> list(index.between(date(2015, 2, 1), date(2015, 3, 31)))
+        []
+        >>> list(index.between(date(2015, 2, 1), date(2015, 3, 31),
+        ...                    leap_policy='mar1'))
+        [(datetime.date(2015, 3, 1), 'leapling')]
+
+        :param start_date: the first date of the window
+        :type start_date: :class:`datetime.date`
+        :param end_date: the last date of the window
+        :type end_date: :class:`datetime.date`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+        :type leap_policy: :class:`str`
+        :return: pairs of an occurrence date and its key
+        :rtype: :class:`~collections.abc.Iterator`
+
+        """
+        if not isinstance(start_date, datetime.date):
+            raise TypeError('start_date must be an instance of datetime.date'
+                            ', not ' + repr(start_date))
+        elif not isinstance(end_date, datetime.date):
+            raise TypeError('end_date must be an instance of datetime.date'
+                            ', not ' + repr(end_date))
+        elif leap_policy not in _observed_leap_policies:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_observed_leap_policies),
+                                            leap_policy))
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime.datetime):
+            end_date = end_date.date()
+        substitute = _leap_substitutes[leap_policy]
+
+        def generate():
+            buckets = self._buckets
+            for year in range(start_date.year, end_date.year + 1):
+                lo = _to_ordinal(start_date) if year == start_date.year else 0
+                hi = _to_ordinal(end_date) if year == end_date.year else 365
+                leap = calendar.isleap(year)
+                if not leap:
+                    # Keys of February 29 are observed on the substituted day,
+                    # which is adjacent to its ordinal, hence still in order.
+                    if substitute == (2, 28) and hi == _feb_29 - 1:
+                        hi = _feb_29
+                    elif substitute == (3, 1) and lo == _feb_29 + 1:
+                        lo = _feb_29
+                for ordinal in range(lo, hi + 1):
+                    bucket = buckets[ordinal]
+                    if not bucket:
+                        continue
+                    elif leap or ordinal != _feb_29:
+                        md = _interned[ordinal]
+                        date = datetime.date(year, md.month, md.day)
+                    elif substitute is None:
+                        continue
+                    else:
+                        date = datetime.date(year, *substitute)
+                    for key in list(bucket):
+                        yield date, key
+        return generate()
+
+    def upcoming(self, from_date, days, leap_policy='skip'):
+        """Find occurrences in the ``days`` days since ``from_date``
+        (inclusive) in chronological order.  It's a shortcut of
+        :meth:`between()`:
+
+        >>> from datetime import date
+        >>> from monthday import MonthDay
+        >>> index = MonthDayIndex({'alice': MonthDay(1, 1)})
+        >>> list(index.upcoming(date(2015, 12, 31), 2))
+        [(datetime.date(2016, 1, 1), 'alice')]
+        >>> list(index.upcoming(date(2015, 12, 31), 1))
+        []
+
+        :param from_date: the first date of the window
+        :type from_date: :class:`datetime.date`
+        :param days: the number of days of the window
+        :type days: :class:`numbers.Integral`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            see also :meth:`between()`
+        :type leap_policy: :class:`str`
+        :return: pairs of an occurrence date and its key
+        :rtype: :class:`~collections.abc.Iterator`
+
+        """
+        if not isinstance(days, numbers.Integral):
+            raise TypeError('days must be an integer, not ' + repr(days))
+        elif days < 0:
+            raise ValueError('days must not be negative, not ' + repr(days))
+        elif not days:
+            return iter(())
+        return self.between(from_date,
+                            from_date + datetime.timedelta(days=int(days) - 1),
+                            leap_policy=leap_policy)
+
+    def occurrences(self, since, leap_policy='skip'):
+        """Lazily generate every occurrence since the given ``since`` date
+        (inclusive) in chronological order, endlessly across years.
+        Occurrences are taken from ordinal buckets year by year, so
+        the cost is amortized constant time per occurrence, and
+        no occurrences are precomputed or sorted:
+
+        >>> from datetime import date
+        >>> from itertools import islice
+        >>> from monthday import MonthDay
+        >>> index = MonthDayIndex({'alice': MonthDay(12, 31),
+        ...                        'bob': MonthDay(1, 1)})
+        >>> list(islice(index.occurrences(date(2015, 12, 31)), 3))
+        [(datetime.date(2015, 12, 31), 'alice'),
+         (datetime.date(2016, 1, 1), 'bob'),
+         (datetime.date(2016, 12, 31), 'alice')]
+
+        Keys added to or deleted from the index while iterating are
+        reflected from the next date.  It stops when the index becomes
+        empty, or it reaches :const:`datetime.MAXYEAR`.
+
+        :param since: the date to start from
+        :type since: :class:`datetime.date`
+        :param leap_policy: how to treat February 29 in non-leap years.
+                            see also :meth:`between()`
+        :type leap_policy: :class:`str`
+        :return: pairs of an occurrence date and its key
+        :rtype: :class:`~collections.abc.Iterator`
+
+        """
+        if not isinstance(since, datetime.date):
+            raise TypeError('since must be an instance of datetime.date, '
+                            'not ' + repr(since))
+        elif leap_policy not in _observed_leap_policies:
+            raise ValueError('leap_policy must be one of {0!r}, not '
+                             '{1!r}'.format(sorted(_observed_leap_policies),
+                                            leap_policy))
+
+        def generate():
+            start = since
+            while self._month_days:
+                end = datetime.date(start.year, 12, 31)
+                for occurrence in self.between(start, end, leap_policy):
+                    yield occurrence
+                if end.year >= datetime.MAXYEAR:
+                    break
+                start = datetime.date(end.year + 1, 1, 1)
+        return generate()
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r})'.format(
+            type(self), self._month_days
+        )
+
+
+def _to_ordinal(date):
+    return _month_offsets[date.month - 1] + date.day - 1
@@ -0,0 +1,344 @@
+""":mod:`monthday.instrument` --- Opt-in instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module counts and times :class:`~monthday.MonthDay` operations,
+to see how many objects are built, how often :meth:`MonthDay.dates()
+<monthday.MonthDay.dates>` hits invalid dates, and so on:
+
+>>> from monthday import MonthDay
+>>> with collect() as stats:
+...     feb_29 = MonthDay(2, 29)
+...     dates = list(feb_29.dates(range(2011, 2017), False))
+>>> stats.counters['construct']
+1
+>>> stats.counters['dates.yielded'], stats.counters['dates.invalid']
+(2, 4)
+
+It's disabled by default, and costs nothing while disabled: the instrumented
+methods are patched into :class:`~monthday.MonthDay` (and
+:class:`~monthday.MonthDayDates`) only while any collector or hook is
+active, and the original methods are restored after that.
+
+The following operations are recorded.  Timed operations also have
+a :class:`Histogram` of their elapsed time:
+
+``'construct'`` (timed)
+   :class:`~monthday.MonthDay` constructor calls.
+
+``'from_date'`` (timed)
+   :meth:`MonthDay.from_date() <monthday.MonthDay.from_date>` calls.
+
+``'date'`` (timed)
+   :meth:`MonthDay.date() <monthday.MonthDay.date>` calls.
+
+``'dates'``
+   :meth:`MonthDay.dates() <monthday.MonthDay.dates>` calls.
+
+``'dates.yielded'``
+   Valid dates yielded by :meth:`MonthDay.dates()
+   <monthday.MonthDay.dates>`.  Recorded when the iteration ends.
+
+``'dates.invalid'``
+   Invalid dates skipped or filled with :const:`None` by
+   :meth:`MonthDay.dates() <monthday.MonthDay.dates>`.  Recorded when
+   the iteration ends.
+
+For a :class:`range` of years, :meth:`MonthDay.dates()
+<monthday.MonthDay.dates>` still returns a lazy
+:class:`~monthday.MonthDayDates` sequence, and these are recorded
+whenever it's iterated.  Years skipped by ``'skip'`` are recorded only
+when the whole sequence is iterated to its end.
+
+``'pickle'`` (timed)
+   :class:`~monthday.MonthDay` values pickled.
+
+Note that recording is not synchronized between threads.
+
+"""
+import collections
+import contextlib
+import time
+
+from . import Iterable, MonthDay, MonthDayDates, _range_types
+
+__all__ = 'Histogram', 'Stats', 'add_hook', 'collect', 'remove_hook'
+
+
+#: (:class:`~collections.abc.Callable`) The timer to measure elapsed time.
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Histogram(object):
+    """Histogram of elapsed time, bucketed by powers of two of nanoseconds.
+
+    .. attribute:: buckets
+
+       (:class:`dict`) Exponents to the numbers of samples.  The bucket
+       ``n`` counts samples from ``2 ** (n - 1)`` to ``2 ** n - 1``
+       nanoseconds.
+
+    .. attribute:: count
+
+       (:class:`int`) The number of samples.
+
+    .. attribute:: total
+
+       (:class:`float`) The sum of samples in seconds.
+
+    .. attribute:: min
+
+       (:class:`float`) The minimum sample in seconds.
+
+    .. attribute:: max
+
+       (:class:`float`) The maximum sample in seconds.
+
+    """
+
+    __slots__ = 'buckets', 'count', 'total', 'min', 'max'
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, seconds):
+        """Add a sample.
+
+        :param seconds: the elapsed time in seconds
+        :type seconds: :class:`float`
+
+        """
+        exponent = int(seconds * 1e9).bit_length()
+        self.buckets[exponent] = self.buckets.get(exponent, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        """(:class:`float`) The mean of samples in seconds, or :const:`None`
+        if there's no samples.
+
+        """
+        return self.total / self.count if self.count else None
+
+    def __repr__(self):
+        return '<{0.__module__}.{0.__name__} count={1} mean={2!r}>'.format(
+            type(self), self.count, self.mean
+        )
+
+
+class Stats(object):
+    """Collected counters and timings.
+
+    .. attribute:: counters
+
+       (:class:`collections.Counter`) Operation names to their counts.
+
+    .. attribute:: timings
+
+       (:class:`dict`) Timed operation names to their :class:`Histogram`\\ s.
+
+    """
+
+    def __init__(self):
+        self.counters = collections.Counter()
+        self.timings = {}
+
+    def record(self, operation, seconds=None, count=1):
+        """Record an operation.
+
+        :param operation: the operation name
+        :type operation: :class:`str`
+        :param seconds: the elapsed time in seconds, if timed
+        :type seconds: :class:`float`
+        :param count: how many times it happened.  1 by default
+        :type count: :class:`int`
+
+        """
+        self.counters[operation] += count
+        if seconds is not None:
+            try:
+                histogram = self.timings[operation]
+            except KeyError:
+                histogram = self.timings[operation] = Histogram()
+            histogram.add(seconds)
+
+
+#: (:class:`list`) Active :class:`Stats` collectors.
+_collectors = []
+
+#: (:class:`list`) Active hooks.
+_hooks = []
+
+#: (:class:`dict`) The original attributes of :class:`~monthday.MonthDay`
+#: and :class:`~monthday.MonthDayDates` by pairs of the class and
+#: the name, while instrumented methods are patched into them.
+_originals = {}
+
+
+@contextlib.contextmanager
+def collect():
+    """Collect counters and timings in the scope of a ``with`` block.
+    Collectors can be nested; every active one records the same operations.
+
+    :return: a context manager which returns :class:`Stats`
+
+    """
+    stats = Stats()
+    _collectors.append(stats)
+    _update()
+    try:
+        yield stats
+    finally:
+        _collectors.remove(stats)
+        _update()
+
+
+def add_hook(hook):
+    """Add a hook which is called for every recorded operation, e.g.,
+    to export them to a metrics system.  It takes the same arguments to
+    :meth:`Stats.record()`: the operation name, the elapsed time in seconds
+    (or :const:`None` if not timed), and the count.
+
+    :param hook: a callable to add
+    :type hook: :class:`~collections.abc.Callable`
+
+    """
+    if not callable(hook):
+        raise TypeError('hook must be callable, not ' + repr(hook))
+    _hooks.append(hook)
+    _update()
+
+
+def remove_hook(hook):
+    """Remove the hook added by :func:`add_hook()`.
+
+    :param hook: the callable to remove
+    :type hook: :class:`~collections.abc.Callable`
+    :raise ValueError: if the ``hook`` is not added
+
+    """
+    _hooks.remove(hook)
+    _update()
+
+
+def _record(operation, seconds=None, count=1):
+    for stats in _collectors:
+        stats.record(operation, seconds, count)
+    for hook in _hooks:
+        hook(operation, seconds, count)
+
+
+def _update():
+    """Patch or restore :class:`~monthday.MonthDay`'s methods according to
+    whether any collector or hook is active.
+
+    """
+    if (_collectors or _hooks) and not _originals:
+        for (cls, name), wrapper in _wrappers().items():
+            _originals[cls, name] = cls.__dict__[name]
+            setattr(cls, name, wrapper)
+    elif not (_collectors or _hooks) and _originals:
+        for (cls, name), original in _originals.items():
+            setattr(cls, name, original)
+        _originals.clear()
+
+
+def _timed(operation, function):
+    def wrapper(*args, **kwargs):
+        start = timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(operation, timer() - start)
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _counted(view, dates):
+    """Generate the ``dates`` of the :class:`~monthday.MonthDayDates`
+    ``view``, and record how many are valid and invalid when it ends.
+
+    """
+    yielded = invalid = 0
+    dates = iter(dates)
+    try:
+        while True:
+            try:
+                date = next(dates)
+            except StopIteration:
+                if view.leap_policy == 'skip' and \
+                   len(view._indices) == view._length:
+                    invalid += len(view.years) - view._length
+                return
+            except ValueError:
+                # The 'raise' policy hit an invalid date.
+                invalid += 1
+                raise
+            if date is None:
+                invalid += 1
+            else:
+                yielded += 1
+            yield date
+    finally:
+        _record('dates.yielded', count=yielded)
+        _record('dates.invalid', count=invalid)
+
+
+def _wrappers():
+    new = MonthDay.__new__
+    from_date = MonthDay.__dict__['from_date'].__func__
+    dates = MonthDay.dates
+    iterate = MonthDayDates.__iter__
+    iterate_reversed = MonthDayDates.__reversed__
+
+    def instrumented_dates(self, years, *args, **kwargs):
+        _record('dates')
+        if not isinstance(years, Iterable) or \
+           isinstance(years, _range_types):
+            # A lazy MonthDayDates records when it's iterated instead.
+            return dates(self, years, *args, **kwargs)
+        consumed = [0]
+
+        def count(years):
+            for year in years:
+                consumed[0] += 1
+                yield year
+        result = dates(self, count(years), *args, **kwargs)
+
+        def generate():
+            yielded = 0
+            try:
+                for date in result:
+                    if date is not None:
+                        yielded += 1
+                    yield date
+            finally:
+                _record('dates.yielded', count=yielded)
+                _record('dates.invalid', count=consumed[0] - yielded)
+        return generate()
+    instrumented_dates.__name__ = dates.__name__
+    instrumented_dates.__doc__ = dates.__doc__
+
+    def instrumented_iter(self):
+        return _counted(self, iterate(self))
+
+    def instrumented_reversed(self):
+        return _counted(self, iterate_reversed(self))
+    return {
+        (MonthDay, '__new__'): staticmethod(_timed('construct', new)),
+        (MonthDay, 'from_date'): classmethod(_timed('from_date', from_date)),
+        (MonthDay, 'date'): _timed('date', MonthDay.date),
+        (MonthDay, 'dates'): instrumented_dates,
+        (MonthDay, '__reduce__'): _timed('pickle', MonthDay.__reduce__),
+        (MonthDayDates, '__iter__'): instrumented_iter,
+        (MonthDayDates, '__reversed__'): instrumented_reversed,
+    }
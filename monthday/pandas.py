@@ -0,0 +1,310 @@
+""":mod:`monthday.pandas` --- pandas extension type
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module requires pandas_ (and NumPy).  Importing it registers
+the ``'monthday'`` dtype, which stores :class:`~monthday.MonthDay` values
+as ``uint16`` ordinals instead of Python objects, and the ``.md`` accessor
+for series of that dtype:
+
+>>> import pandas
+>>> from monthday import MonthDay
+>>> birthdays = pandas.Series([MonthDay(8, 4), MonthDay(2, 29), None],
+...                           dtype='monthday')
+>>> birthdays.sort_values().tolist()
+[monthday.MonthDay(2, 29), monthday.MonthDay(8, 4), <NA>]
+>>> birthdays.md.date(2016).tolist()
+[Timestamp('2016-08-04 00:00:00'), Timestamp('2016-02-29 00:00:00'), NaT]
+
+If pyarrow_ is installed as well, columns of the dtype are converted to
+:class:`monthday.arrow.MonthDayType`, so that they are written to Parquet
+as small integers, and read back without conversion through Python
+objects.
+
+.. _pandas: http://pandas.pydata.org/
+.. _pyarrow: https://arrow.apache.org/docs/python/
+
+"""
+from __future__ import absolute_import
+
+import numbers
+
+import numpy
+import pandas
+from pandas.api.extensions import (ExtensionArray, ExtensionDtype,
+                                   register_extension_dtype,
+                                   register_series_accessor, take)
+
+from . import MonthDay, _interned
+from .array import MonthDayArray
+
+__all__ = 'MonthDayAccessor', 'MonthDayDtype', 'MonthDayExtensionArray'
+
+
+#: (:class:`int`) The ordinal which represents missing values.
+NA_ORDINAL = 0xffff
+
+
+@register_extension_dtype
+class MonthDayDtype(ExtensionDtype):
+    """The pandas dtype of :class:`~monthday.MonthDay` values.  It's
+    registered as ``'monthday'``.
+
+    """
+
+    name = 'monthday'
+    type = MonthDay
+    kind = 'O'
+    na_value = pandas.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return MonthDayExtensionArray
+
+    def __from_arrow__(self, array):
+        """Convert a :mod:`pyarrow` array or chunked array of either
+        :class:`monthday.arrow.MonthDayType` or ``uint16`` into
+        :class:`MonthDayExtensionArray`.
+
+        """
+        chunks = getattr(array, 'chunks', [array])
+        results = []
+        for chunk in chunks:
+            storage = getattr(chunk, 'storage', chunk)
+            if storage.null_count:
+                ordinals = storage.fill_null(NA_ORDINAL).to_numpy()
+            else:
+                ordinals = storage.to_numpy(zero_copy_only=True)
+            results.append(ordinals.astype(numpy.uint16, copy=False))
+        if not results:
+            return MonthDayExtensionArray(numpy.array([], numpy.uint16))
+        elif len(results) == 1:
+            return MonthDayExtensionArray(results[0])
+        return MonthDayExtensionArray(numpy.concatenate(results))
+
+
+def _to_ordinal(value):
+    if isinstance(value, MonthDay):
+        return value._ordinal
+    elif isinstance(value, str):
+        return MonthDay.parse(value)._ordinal
+    elif pandas.isna(value):
+        return NA_ORDINAL
+    raise TypeError('expected monthday.MonthDay, not ' + repr(value))
+
+
+class MonthDayExtensionArray(ExtensionArray):
+    """The pandas extension array of :class:`MonthDayDtype`, backed by
+    a ``uint16`` NumPy array of ordinals (see :meth:`MonthDay.toordinal()
+    <monthday.MonthDay.toordinal>`).  Missing values are represented
+    as :data:`NA_ORDINAL`.
+
+    :param ordinals: ordinals from 0 to 365, or :data:`NA_ORDINAL`
+    :type ordinals: :class:`numpy.ndarray`
+    :param copy: whether to copy ``ordinals``
+    :type copy: :class:`bool`
+
+    """
+
+    def __init__(self, ordinals, copy=False):
+        ordinals = numpy.asarray(ordinals, dtype=numpy.uint16)
+        if copy:
+            ordinals = ordinals.copy()
+        if ordinals.ndim != 1:
+            raise ValueError('ordinals must be one-dimensional')
+        invalid = (ordinals > 365) & (ordinals != NA_ORDINAL)
+        if invalid.any():
+            raise ValueError('ordinals must be from 0 to 365')
+        self._ordinals = ordinals
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(scalars, MonthDayExtensionArray):
+            return cls(scalars._ordinals, copy=copy)
+        elif isinstance(scalars, MonthDayArray):
+            return cls(scalars.ordinals, copy=True)
+        return cls(numpy.fromiter((_to_ordinal(v) for v in scalars),
+                                  dtype=numpy.uint16))
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        return cls._from_sequence(strings)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(numpy.concatenate([a._ordinals for a in to_concat]))
+
+    @property
+    def dtype(self):
+        return MonthDayDtype()
+
+    @property
+    def nbytes(self):
+        return self._ordinals.nbytes
+
+    @property
+    def ordinals(self):
+        """(:class:`numpy.ndarray`) The ``uint16`` array of ordinals,
+        which has :data:`NA_ORDINAL` for missing values.
+
+        """
+        return self._ordinals
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            ordinal = int(self._ordinals[item])
+            return pandas.NA if ordinal == NA_ORDINAL else _interned[ordinal]
+        item = pandas.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._ordinals[item])
+
+    def __setitem__(self, key, value):
+        if pandas.api.types.is_list_like(value):
+            ordinals = type(self)._from_sequence(value)._ordinals
+        else:
+            ordinals = _to_ordinal(value)
+        key = pandas.api.indexers.check_array_indexer(self, key)
+        self._ordinals[key] = ordinals
+
+    def isna(self):
+        return self._ordinals == NA_ORDINAL
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill:
+            fill_value = (NA_ORDINAL if fill_value is None
+                          else _to_ordinal(fill_value))
+        result = take(self._ordinals, indices, allow_fill=allow_fill,
+                      fill_value=fill_value)
+        return type(self)(result)
+
+    def copy(self):
+        return type(self)(self._ordinals, copy=True)
+
+    def _values_for_argsort(self):
+        return self._ordinals
+
+    def _values_for_factorize(self):
+        return self._ordinals.astype(numpy.int32), NA_ORDINAL
+
+    def _compare(self, other, op):
+        if isinstance(other, (pandas.Series, pandas.Index,
+                              pandas.DataFrame)):
+            return NotImplemented
+        elif isinstance(other, MonthDayExtensionArray):
+            other_ordinals = other._ordinals
+        elif isinstance(other, MonthDay) or pandas.api.types.is_scalar(other):
+            try:
+                other_ordinals = numpy.uint16(_to_ordinal(other))
+            except (TypeError, ValueError):
+                # As pandas does, values never equal incompatible scalars,
+                # though they can't be ordered with them.
+                if op is numpy.equal or op is numpy.not_equal:
+                    result = numpy.full(len(self), op is numpy.not_equal)
+                    return pandas.arrays.BooleanArray(
+                        result, numpy.zeros(len(self), dtype=bool)
+                    )
+                raise TypeError('invalid comparison between monthday and ' +
+                                repr(other))
+        else:
+            other_ordinals = type(self)._from_sequence(other)._ordinals
+        result = op(self._ordinals, other_ordinals)
+        na = self.isna() | (other_ordinals == NA_ORDINAL)
+        return pandas.arrays.BooleanArray(result & ~na, na)
+
+    def __eq__(self, other):
+        return self._compare(other, numpy.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, numpy.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, numpy.less)
+
+    def __le__(self, other):
+        return self._compare(other, numpy.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, numpy.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, numpy.greater_equal)
+
+    def date(self, years):
+        """Combine the given ``years`` with every value at once.  Missing
+        values, and February 29 with non-leap years, become ``NaT``.
+
+        :param years: a year, or years of the same length to the array
+        :type years: :class:`numbers.Integral`, :class:`numpy.ndarray`
+        :return: ``datetime64[D]`` dates
+        :rtype: :class:`numpy.ndarray`
+
+        """
+        na = self.isna()
+        array = MonthDayArray._from_buffer(
+            numpy.where(na, 0, self._ordinals).astype(numpy.uint16)
+        )
+        dates, _ = array.date(years)
+        dates[na] = numpy.datetime64('NaT')
+        return dates
+
+    def __arrow_array__(self, type=None):
+        from .arrow import MonthDayType
+        return MonthDayType.wrap(self._ordinals, self.isna())
+
+    def _formatter(self, boxed=False):
+        return str if boxed else repr
+
+
+@register_series_accessor('md')
+class MonthDayAccessor(object):
+    """The ``.md`` accessor of series of :class:`MonthDayDtype`."""
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, MonthDayDtype):
+            raise AttributeError("can only use .md accessor with 'monthday' "
+                                 'dtype')
+        self._series = series
+
+    def _wrap(self, values, dtype=None):
+        return pandas.Series(values, index=self._series.index,
+                             name=self._series.name, dtype=dtype)
+
+    @property
+    def ordinal(self):
+        """(:class:`pandas.Series`) Ordinals, or missing values."""
+        ordinals = self._series.array.ordinals
+        return self._wrap(pandas.arrays.IntegerArray(
+            ordinals.astype(numpy.int16), ordinals == NA_ORDINAL
+        ))
+
+    @property
+    def month(self):
+        """(:class:`pandas.Series`) Months, or missing values."""
+        return self._wrap(self._series.array.date(2000)).dt.month.astype(
+            'Int8'
+        )
+
+    @property
+    def day(self):
+        """(:class:`pandas.Series`) Days, or missing values."""
+        return self._wrap(self._series.array.date(2000)).dt.day.astype(
+            'Int8'
+        )
+
+    def date(self, years):
+        """Combine the given ``years`` with every value at once.  See also
+        :meth:`MonthDayExtensionArray.date()`.
+
+        :param years: a year, or years of the same length to the series
+        :type years: :class:`numbers.Integral`, :class:`numpy.ndarray`,
+                     :class:`pandas.Series`
+        :return: a ``datetime64`` series
+        :rtype: :class:`pandas.Series`
+
+        """
+        return self._wrap(self._series.array.date(numpy.asarray(years)))
@@ -0,0 +1,316 @@
+""":mod:`monthday.parallel` --- Parallel expansion across processes
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Combining millions of :class:`~monthday.MonthDay` values with a range of
+years through :meth:`MonthDay.dates() <monthday.MonthDay.dates>` is
+embarrassingly parallel.  Functions in this module shard the values into
+chunks and send them to a :mod:`concurrent.futures` process pool as packed
+ordinals (see :func:`monthday.pack()`); workers send back dates as
+:class:`array.array`\\ s of proleptic Gregorian ordinals (see
+:meth:`datetime.date.toordinal()`) rather than pickled objects, only one
+row for each distinct value in a chunk:
+
+>>> from monthday import MonthDay
+>>> for dates in expand([MonthDay(8, 4), MonthDay(2, 29)], range(2015, 2017),
+...                     error_invalid_dates=None):
+...     print(dates)
+[datetime.date(2015, 8, 4), datetime.date(2016, 8, 4)]
+[None, datetime.date(2016, 2, 29)]
+
+Results are streamed in the order of the input, however the chunks are
+scheduled, and only a bounded number of chunks are in flight at a time.
+
+As there are at most 366 distinct values, the work to share out grows
+with the range of years rather than with the number of values.  Unless an
+executor is given, rows of fewer than :data:`inline_threshold` dates in
+total are therefore expanded in the current process, and a process pool is
+only spawned for wide ranges of years.
+
+"""
+from __future__ import absolute_import
+
+import array
+import collections
+import datetime
+import itertools
+import multiprocessing
+import numbers
+import sys
+
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from . import (_frombytes, _interned, _leap_substitutes, _range_types,
+               pack)
+
+__all__ = 'expand', 'expand_ordinals', 'inline_threshold'
+
+#: (:class:`numbers.Integral`) The number of dates a chunk's rows have to
+#: amount to before they are sent to the default process pool instead of
+#: being expanded in the current process.
+inline_threshold = 1 << 16
+
+
+def _resolve_leap_policy(error_invalid_dates, leap_policy):
+    if leap_policy is None:
+        return ('raise' if error_invalid_dates
+                else 'skip' if error_invalid_dates is not None
+                else 'none')
+    elif leap_policy not in _leap_substitutes:
+        raise ValueError('leap_policy must be one of {0!r}, not '
+                         '{1!r}'.format(sorted(_leap_substitutes),
+                                        leap_policy))
+    return leap_policy
+
+
+def _unpack(data):
+    ordinals = array.array('H')
+    _frombytes(ordinals, data)
+    if sys.byteorder != 'little':
+        ordinals.byteswap()
+    return ordinals
+
+
+def _expand_chunk(data, years, leap_policy):
+    """Run in worker processes.  Expand each value in the ``data`` packed
+    by :func:`monthday.pack()` into a row of proleptic Gregorian ordinals,
+    which are 0 for invalid dates, and return the table mapping their
+    day-of-year ordinals to their rows.
+
+    """
+    if leap_policy == 'skip':
+        # Keep rows of the same width; the caller drops zeros.
+        leap_policy = 'none'
+    interned = _interned
+    return dict(
+        (ordinal, array.array('i', (
+            0 if date is None else date.toordinal()
+            for date in interned[ordinal].dates(years,
+                                                leap_policy=leap_policy)
+        )))
+        for ordinal in _unpack(data)
+    )
+
+
+def _check_years(years):
+    if isinstance(years, _range_types):
+        return years
+    years = tuple(years)
+    for year in years:
+        if not isinstance(year, numbers.Integral):
+            raise TypeError('year must be an integer, not ' + repr(year))
+    return years
+
+
+def _check_chunk_size(chunk_size):
+    if not isinstance(chunk_size, numbers.Integral):
+        raise TypeError('chunk_size must be an integer, not ' +
+                        repr(chunk_size))
+    elif chunk_size < 1:
+        raise ValueError('chunk_size must be positive, not ' +
+                         repr(chunk_size))
+
+
+def expand_ordinals(month_days, years, error_invalid_dates=True,
+                    leap_policy=None, executor=None, chunk_size=1024):
+    """Combine each of ``month_days`` with every one of ``years`` in
+    parallel, and lazily generate the results as buffers of proleptic
+    Gregorian ordinals (see :meth:`datetime.date.toordinal()`), one buffer
+    for each chunk of ``chunk_size`` values.  Each buffer is row-major,
+    i.e., it has ``len(years)`` ordinals for the first value of the chunk,
+    and then the next value's, and so on.
+
+    >>> from monthday import MonthDay
+    >>> buffers = expand_ordinals([MonthDay(2, 29)], [2015, 2016],
+    ...                           error_invalid_dates=False)
+    >>> list(next(buffers))
+    [0, 736023]
+
+    Unlike :func:`expand()`, invalid dates are filled with 0 even if
+    ``error_invalid_dates`` is :const:`False`, so that every row has
+    the same width.
+
+    :param month_days: :class:`~monthday.MonthDay` values
+    :type month_days: :class:`~collections.abc.Iterable`
+    :param years: years to combine with
+    :type years: :class:`~collections.abc.Iterable`
+    :param error_invalid_dates: the same to :meth:`MonthDay.dates()
+                                <monthday.MonthDay.dates>`'s
+    :type error_invalid_dates: :class:`bool`, ``type(None)``
+    :param leap_policy: the same to :meth:`MonthDay.dates()
+                        <monthday.MonthDay.dates>`'s
+    :type leap_policy: :class:`str`
+    :param executor: an executor to submit chunks to.  a new
+                     :class:`~concurrent.futures.ProcessPoolExecutor`,
+                     which is shut down when the generator is done,
+                     by default.  without an executor, chunks of rows
+                     smaller than :data:`inline_threshold` are expanded
+                     in the current process
+    :type executor: :class:`concurrent.futures.Executor`
+    :param chunk_size: the number of values sent to a worker at a time
+    :type chunk_size: :class:`numbers.Integral`
+    :return: :class:`array.array`\\ s of signed integers
+    :rtype: :class:`~collections.abc.Iterator`
+    :raise ValueError: if ``error_invalid_dates`` is set to :const:`True`
+                       and there happen to be any invalid dates in
+                       the result.  buffers of chunks preceding the one
+                       having an invalid date are generated first
+    :raise TypeError: if any of ``month_days`` is not
+                      a :class:`~monthday.MonthDay`, or ``years`` is not
+                      iterable of integers
+
+    """
+    leap_policy = _resolve_leap_policy(error_invalid_dates, leap_policy)
+    _check_chunk_size(chunk_size)
+    years = _check_years(years)
+    month_days = iter(month_days)
+    return _join(_generate(month_days, years, leap_policy, executor,
+                           chunk_size))
+
+
+def _generate(month_days, years, leap_policy, executor, chunk_size):
+    """Generate pairs of the ordinals of each chunk and the table of rows
+    made by :func:`_expand_chunk()`, which covers the chunk.
+
+    There are at most 366 distinct rows however many values there are,
+    so only values whose rows haven't been requested by preceding chunks
+    are sent to workers, and workers send back only their rows.  The table
+    is shared by every chunk, and grows as their results arrive in order.
+
+    """
+    own_executor = executor is None
+    try:
+        window = 2 * multiprocessing.cpu_count()
+    except NotImplementedError:
+        window = 2
+    pending = collections.deque()
+    requested = set()
+    rows = {}
+    try:
+        while True:
+            while len(pending) < window:
+                chunk = list(itertools.islice(month_days, chunk_size))
+                if not chunk:
+                    break
+                ordinals = _unpack(pack(chunk))
+                missing = set(ordinals).difference(requested)
+                if missing:
+                    requested.update(missing)
+                    data = pack(_interned[o] for o in sorted(missing))
+                    if own_executor and \
+                       len(missing) * len(years) < inline_threshold:
+                        future = _run(_expand_chunk, data, years,
+                                      leap_policy)
+                    else:
+                        if executor is None:
+                            executor = ProcessPoolExecutor()
+                        future = executor.submit(_expand_chunk, data,
+                                                 years, leap_policy)
+                else:
+                    future = None
+                pending.append((ordinals, future))
+            if not pending:
+                break
+            ordinals, future = pending.popleft()
+            if future is not None:
+                rows.update(future.result())
+            yield ordinals, rows
+    finally:
+        if not own_executor:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+        elif executor is None:
+            # Every chunk has been expanded in the current process.
+            pass
+        elif sys.version_info >= (3, 9):
+            # Cancelling futures of a process pool one by one right before
+            # shutting it down races with its manager thread, which then may
+            # wait forever for their results; let the pool cancel them.
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            executor.shutdown(wait=True)
+
+
+def _run(function, *args):
+    """Call ``function`` in the current process, and wrap up what it
+    returns or raises in a finished :class:`~concurrent.futures.Future`."""
+    future = Future()
+    try:
+        future.set_result(function(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _join(tables):
+    for ordinals, rows in tables:
+        buffer = array.array('i')
+        extend = buffer.extend
+        for ordinal in ordinals:
+            extend(rows[ordinal])
+        yield buffer
+
+
+def expand(month_days, years, error_invalid_dates=True, leap_policy=None,
+           executor=None, chunk_size=1024):
+    """Combine each of ``month_days`` with every one of ``years`` in
+    parallel.  For each value it generates the list of what
+    :meth:`MonthDay.dates() <monthday.MonthDay.dates>` would generate,
+    in the order of ``month_days``.  See also :func:`expand_ordinals()`.
+
+    :param month_days: :class:`~monthday.MonthDay` values
+    :type month_days: :class:`~collections.abc.Iterable`
+    :param years: years to combine with
+    :type years: :class:`~collections.abc.Iterable`
+    :param error_invalid_dates: the same to :meth:`MonthDay.dates()
+                                <monthday.MonthDay.dates>`'s
+    :type error_invalid_dates: :class:`bool`, ``type(None)``
+    :param leap_policy: the same to :meth:`MonthDay.dates()
+                        <monthday.MonthDay.dates>`'s
+    :type leap_policy: :class:`str`
+    :param executor: an executor to submit chunks to.  a new
+                     :class:`~concurrent.futures.ProcessPoolExecutor`
+                     by default
+    :type executor: :class:`concurrent.futures.Executor`
+    :param chunk_size: the number of values sent to a worker at a time
+    :type chunk_size: :class:`numbers.Integral`
+    :return: a :class:`list` of :class:`datetime.date` values (and
+             :const:`None` values if ``error_invalid_dates`` is
+             :const:`None`) for each of ``month_days``
+    :rtype: :class:`~collections.abc.Iterator`
+    :raise ValueError: if ``error_invalid_dates`` is set to :const:`True`
+                       and there happen to be any invalid dates in
+                       the result
+    :raise TypeError: if any of ``month_days`` is not
+                      a :class:`~monthday.MonthDay`, or ``years`` is not
+                      iterable of integers
+
+    """
+    leap_policy = _resolve_leap_policy(error_invalid_dates, leap_policy)
+    years = _check_years(years)
+    if not years:
+        # Every row is empty, so there is nothing to send to workers.
+        month_days = list(month_days)
+        pack(month_days)
+        return iter([[] for _ in month_days])
+    _check_chunk_size(chunk_size)
+    tables = _generate(iter(month_days), years, leap_policy, executor,
+                       chunk_size)
+    return _decode(tables, leap_policy == 'skip')
+
+
+def _decode(tables, skip):
+    fromordinal = datetime.date.fromordinal
+    dates = {}
+    for ordinals, rows in tables:
+        for ordinal in ordinals:
+            try:
+                row = dates[ordinal]
+            except KeyError:
+                if skip:
+                    row = [fromordinal(o) for o in rows[ordinal] if o]
+                else:
+                    row = [fromordinal(o) if o else None
+                           for o in rows[ordinal]]
+                dates[ordinal] = row
+            yield list(row)
@@ -0,0 +1,255 @@
+""":mod:`monthday.ranges` --- Ranges of dates without year
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Useful for seasons, promotion windows, zodiac signs, and so on.  Ranges
+may wrap around New Year:
+
+>>> from monthday import MonthDay
+>>> capricorn = MonthDayRange(MonthDay(12, 22), MonthDay(1, 19))
+>>> MonthDay(1, 1) in capricorn
+True
+>>> len(capricorn)
+29
+
+"""
+import datetime
+
+from . import MonthDay, _interned, _month_offsets
+
+__all__ = 'MonthDayRange', 'MonthDayRangeTable'
+
+
+def _ordinal_of(value):
+    if isinstance(value, MonthDay):
+        return value._ordinal
+    elif isinstance(value, datetime.date):
+        return _month_offsets[value.month - 1] + value.day - 1
+    raise TypeError('expected monthday.MonthDay or datetime.date, not ' +
+                    repr(value))
+
+
+class MonthDayRange(object):
+    """Range of :class:`~monthday.MonthDay` values from ``start`` to
+    ``stop``, both inclusive.  If ``stop`` precedes ``start``, the range
+    wraps around New Year.  Membership tests, :func:`len()`, and
+    intersections are constant time.
+
+    :param start: the first day of the range
+    :type start: :class:`~monthday.MonthDay`
+    :param stop: the last day of the range
+    :type stop: :class:`~monthday.MonthDay`
+
+    Ranges are immutable and hashable.
+
+    """
+
+    __slots__ = '_start', '_stop', '_length'
+
+    def __init__(self, start, stop):
+        if not isinstance(start, MonthDay):
+            raise TypeError('start must be a monthday.MonthDay, not ' +
+                            repr(start))
+        elif not isinstance(stop, MonthDay):
+            raise TypeError('stop must be a monthday.MonthDay, not ' +
+                            repr(stop))
+        self._start = start
+        self._stop = stop
+        self._length = (stop._ordinal - start._ordinal) % 366 + 1
+
+    @property
+    def start(self):
+        """(:class:`~monthday.MonthDay`) The first day of the range."""
+        return self._start
+
+    @property
+    def stop(self):
+        """(:class:`~monthday.MonthDay`) The last day of the range,
+        inclusive.
+
+        """
+        return self._stop
+
+    @property
+    def wraps(self):
+        """(:class:`bool`) Whether the range wraps around New Year."""
+        return self._stop._ordinal < self._start._ordinal
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        """Whether the given :class:`~monthday.MonthDay` or
+        :class:`datetime.date` falls in the range.
+
+        """
+        try:
+            ordinal = _ordinal_of(value)
+        except TypeError:
+            return False
+        return (ordinal - self._start._ordinal) % 366 < self._length
+
+    def __iter__(self):
+        start = self._start._ordinal
+        for i in range(self._length):
+            yield _interned[(start + i) % 366]
+
+    def __reversed__(self):
+        start = self._start._ordinal
+        for i in range(self._length - 1, -1, -1):
+            yield _interned[(start + i) % 366]
+
+    def _intervals(self):
+        """Split it into at most two non-wrapping ``(first, last)`` ordinal
+        pairs.
+
+        """
+        start, stop = self._start._ordinal, self._stop._ordinal
+        if start <= stop:
+            return [(start, stop)]
+        return [(start, 365), (0, stop)]
+
+    def overlaps(self, other):
+        """Whether it and the ``other`` range share any day.
+
+        :param other: the other range
+        :type other: :class:`MonthDayRange`
+        :rtype: :class:`bool`
+
+        """
+        return bool(self.intersection(other))
+
+    def intersection(self, other):
+        """Get the days both it and the ``other`` range contain.  Since
+        either can wrap around New Year, they may share two separate
+        ranges:
+
+        >>> winter = MonthDayRange(MonthDay(12, 1), MonthDay(2, 29))
+        >>> holidays = MonthDayRange(MonthDay(2, 1), MonthDay(12, 31))
+        >>> winter.intersection(holidays)
+        [monthday.ranges.MonthDayRange(monthday.MonthDay(2, 1),
+                                       monthday.MonthDay(2, 29)),
+         monthday.ranges.MonthDayRange(monthday.MonthDay(12, 1),
+                                       monthday.MonthDay(12, 31))]
+
+        :param other: the other range
+        :type other: :class:`MonthDayRange`
+        :return: zero, one, or two non-overlapping ranges in
+                 chronological order of their starts
+        :rtype: :class:`list`
+
+        """
+        if not isinstance(other, MonthDayRange):
+            raise TypeError('expected monthday.ranges.MonthDayRange, not ' +
+                            repr(other))
+        pieces = []
+        for first, last in sorted(
+            (max(a_first, b_first), min(a_last, b_last))
+            for a_first, a_last in self._intervals()
+            for b_first, b_last in other._intervals()
+        ):
+            if first > last:
+                continue
+            elif pieces and pieces[-1][1] + 1 == first:
+                pieces[-1] = pieces[-1][0], last
+            else:
+                pieces.append((first, last))
+        if len(pieces) > 1 and pieces[0][0] == 0 and pieces[-1][1] == 365:
+            # Join the pieces at both ends into one wrapping around New Year.
+            head, tail = pieces.pop(0), pieces.pop()
+            pieces.append((tail[0], head[1]))
+        cls = type(self)
+        return [cls(_interned[first], _interned[last])
+                for first, last in pieces]
+
+    def __eq__(self, other):
+        return (isinstance(other, MonthDayRange) and
+                self._start._ordinal == other._start._ordinal and
+                self._stop._ordinal == other._stop._ordinal)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self._start._ordinal * 366 + self._stop._ordinal
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r}, {2!r})'.format(
+            type(self), self._start, self._stop
+        )
+
+
+class MonthDayRangeTable(object):
+    """Lookup table of non-overlapping :class:`MonthDayRange`\\ s.  It finds
+    the range containing a :class:`~monthday.MonthDay` or
+    :class:`datetime.date` in constant time, through a precomputed table
+    of 366 entries:
+
+    >>> from datetime import date
+    >>> seasons = MonthDayRangeTable([
+    ...     MonthDayRange(MonthDay(3, 1), MonthDay(5, 31)),
+    ...     MonthDayRange(MonthDay(6, 1), MonthDay(8, 31)),
+    ...     MonthDayRange(MonthDay(9, 1), MonthDay(11, 30)),
+    ...     MonthDayRange(MonthDay(12, 1), MonthDay(2, 29)),
+    ... ])
+    >>> seasons[date(2015, 1, 15)]
+    monthday.ranges.MonthDayRange(monthday.MonthDay(12, 1),
+                                  monthday.MonthDay(2, 29))
+
+    :param ranges: non-overlapping ranges
+    :type ranges: :class:`~collections.abc.Iterable`
+    :raise ValueError: if any ranges overlap
+
+    """
+
+    __slots__ = 'ranges', '_table'
+
+    def __init__(self, ranges):
+        self.ranges = tuple(ranges)
+        table = [None] * 366
+        for range_ in self.ranges:
+            if not isinstance(range_, MonthDayRange):
+                raise TypeError('expected monthday.ranges.MonthDayRange, not '
+                                + repr(range_))
+            for first, last in range_._intervals():
+                for ordinal in range(first, last + 1):
+                    if table[ordinal] is not None:
+                        raise ValueError('{0!r} overlaps {1!r}'.format(
+                            range_, table[ordinal]
+                        ))
+                    table[ordinal] = range_
+        self._table = table
+
+    def find(self, value):
+        """Find the range containing the given ``value``.
+
+        :param value: a date with or without year
+        :type value: :class:`~monthday.MonthDay`, :class:`datetime.date`
+        :return: the range containing ``value``, or :const:`None` if
+                 no range contains it
+        :rtype: :class:`MonthDayRange`
+
+        """
+        return self._table[_ordinal_of(value)]
+
+    def __getitem__(self, value):
+        result = self._table[_ordinal_of(value)]
+        if result is None:
+            raise KeyError(value)
+        return result
+
+    def __contains__(self, value):
+        try:
+            return self._table[_ordinal_of(value)] is not None
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def __iter__(self):
+        return iter(self.ranges)
+
+    def __repr__(self):
+        return '{0.__module__}.{0.__name__}({1!r})'.format(
+            type(self), list(self.ranges)
+        )
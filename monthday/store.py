@@ -0,0 +1,280 @@
+""":mod:`monthday.store` --- Memory-mapped column store
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module provides a small file format to keep many
+:class:`~monthday.MonthDay` values (and optionally integer keys, e.g.,
+customer ids, parallel to them) on disk, and to query them without loading
+them all into Python objects.  Files are opened through :mod:`mmap`, so
+a query reads only the pages it needs, and processes opening the same file
+share the page cache.
+
+>>> import os.path, tempfile
+>>> from monthday import MonthDay
+>>> path = os.path.join(tempfile.mkdtemp(), 'birthdays.mds')
+>>> write(path, [MonthDay(8, 4), MonthDay(12, 25), MonthDay(8, 4)],
+...       keys=[1, 2, 3])
+>>> with MonthDayStore(path) as store:
+...     print(len(store), store.count(MonthDay(8, 4)))
+...     print(list(store.keys_on(MonthDay(8, 4))))
+3 2
+[1, 3]
+
+A file consists of the following sections, all in little endian:
+
+1. The header: 4 bytes of magic ``b'MDAY'``, a 16-bit format version,
+   16-bit flags (the least significant bit is set if there's a key column),
+   and a 64-bit count of rows.
+2. The offset index: 367 64-bit integers.  Rows having the ordinal ``i``
+   (see :meth:`MonthDay.toordinal() <monthday.MonthDay.toordinal>`) are
+   from the ``i``-th offset to the ``i + 1``-th offset.
+3. The ordinal column: a 16-bit ordinal for each row, sorted, and padded
+   to 8 bytes.
+4. The key column, if any: a signed 64-bit key for each row.
+
+"""
+from __future__ import absolute_import, print_function
+
+import array
+import mmap
+import numbers
+import struct
+import sys
+
+from . import MonthDay, _frombytes, _interned, _tobytes
+
+__all__ = 'MonthDayStore', 'write'
+
+
+#: (:class:`bytes`) The magic number of the file format.
+MAGIC = b'MDAY'
+
+#: (:class:`int`) The version of the file format.
+VERSION = 1
+
+#: (:class:`struct.Struct`) The header layout.
+_header = struct.Struct('<4sHHQ')
+
+#: (:class:`int`) The flag set if there's a key column.
+_has_keys = 0x01
+
+#: (:class:`int`) The number of offsets in the index.
+_offsets_length = 367
+
+try:
+    array.array('q')
+except ValueError:
+    # Python 2 lacks 'q', but 'l' is 8 bytes on LP64 platforms, which
+    # _array() checks.
+    _int64 = 'l'
+else:
+    _int64 = 'q'
+
+
+def _array(typecode, values=()):
+    result = array.array(typecode, values)
+    if result.itemsize != (2 if typecode == 'H' else 8):
+        raise RuntimeError('unsupported platform: array({0!r}) is not {1} '
+                           'bytes'.format(typecode, result.itemsize))
+    return result
+
+
+def _layout(count):
+    """Get the offsets of the ordinal column and the key column."""
+    ordinals_start = _header.size + 8 * _offsets_length
+    keys_start = ordinals_start + (2 * count + 7) // 8 * 8
+    return ordinals_start, keys_start
+
+
+def write(path, month_days, keys=None):
+    """Write the given ``month_days`` (and optionally ``keys`` parallel
+    to them) into a new file.
+
+    :param path: the path of the file to write
+    :type path: :class:`str`
+    :param month_days: :class:`~monthday.MonthDay` values to write
+    :type month_days: :class:`~collections.abc.Iterable`
+    :param keys: integer keys parallel to ``month_days``, which fit in
+                 signed 64 bits.  optional
+    :type keys: :class:`~collections.abc.Iterable`
+    :raise TypeError: if any of ``month_days`` is not
+                      a :class:`~monthday.MonthDay`
+    :raise ValueError: if the lengths of ``month_days`` and ``keys``
+                       differ
+
+    """
+    buckets = [[] for _ in range(366)]
+    if keys is None:
+        counts = [0] * 366
+        for month_day in month_days:
+            if not isinstance(month_day, MonthDay):
+                raise TypeError('expected monthday.MonthDay, not ' +
+                                repr(month_day))
+            counts[month_day._ordinal] += 1
+    else:
+        keys = iter(keys)
+        for month_day in month_days:
+            if not isinstance(month_day, MonthDay):
+                raise TypeError('expected monthday.MonthDay, not ' +
+                                repr(month_day))
+            try:
+                key = next(keys)
+            except StopIteration:
+                raise ValueError('keys are shorter than month_days')
+            if not isinstance(key, numbers.Integral):
+                raise TypeError('key must be an integer, not ' + repr(key))
+            buckets[month_day._ordinal].append(key)
+        for _ in keys:
+            raise ValueError('keys are longer than month_days')
+        counts = [len(bucket) for bucket in buckets]
+    offsets = _array(_int64, [0])
+    for count in counts:
+        offsets.append(offsets[-1] + count)
+    count = offsets[-1]
+    ordinals = _array('H')
+    for ordinal, n in enumerate(counts):
+        ordinals.extend(_array('H', [ordinal]) * n)
+    ordinals.extend(_array('H', [0]) * (-count % 4))
+    columns = [offsets, ordinals]
+    if keys is not None:
+        key_column = _array(_int64)
+        for bucket in buckets:
+            key_column.extend(bucket)
+        columns.append(key_column)
+    with open(path, 'wb') as f:
+        f.write(_header.pack(MAGIC, VERSION,
+                             0 if keys is None else _has_keys, count))
+        for column in columns:
+            if sys.byteorder != 'little':
+                column.byteswap()
+            f.write(_tobytes(column))
+
+
+class MonthDayStore(object):
+    """Read-only, memory-mapped view of a file made by :func:`write()`.
+    It can be used as a context manager to close the file.
+
+    :param path: the path of the file to open
+    :type path: :class:`str`
+    :raise ValueError: if the file is not in the valid format
+
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, flags, count = _header.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError('{0!r} is not a monthday store'.format(path))
+            elif version != VERSION:
+                raise ValueError('unsupported format version: ' +
+                                 repr(version))
+            self._count = count
+            self._flags = flags
+            self._ordinals_start, self._keys_start = _layout(count)
+            end = self._keys_start + (8 * count if self.has_keys else 0)
+            if len(self._mmap) < end:
+                raise ValueError('{0!r} is truncated'.format(path))
+            self._offsets = self._read(_int64, _header.size,
+                                       _offsets_length)
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+
+    def _read(self, typecode, start, count):
+        result = _array(typecode)
+        _frombytes(result, self._mmap[start:start + count * result.itemsize])
+        if sys.byteorder != 'little':
+            result.byteswap()
+        return result
+
+    @property
+    def has_keys(self):
+        """(:class:`bool`) Whether there's a key column."""
+        return bool(self._flags & _has_keys)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if not isinstance(index, numbers.Integral):
+            raise TypeError('index must be an integer, not ' + repr(index))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('index out of range')
+        ordinal, = self._read('H', self._ordinals_start + 2 * index, 1)
+        return _interned[ordinal]
+
+    def __iter__(self):
+        for ordinal in self._read('H', self._ordinals_start, self._count):
+            yield _interned[ordinal]
+
+    def count(self, month_day):
+        """Count rows having the given ``month_day``.  It reads only
+        the offset index.
+
+        :param month_day: the month and day to count
+        :type month_day: :class:`~monthday.MonthDay`
+        :return: the number of rows
+        :rtype: :class:`int`
+
+        """
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+        ordinal = month_day._ordinal
+        return self._offsets[ordinal + 1] - self._offsets[ordinal]
+
+    def counts(self):
+        """Count rows for each :class:`~monthday.MonthDay`.  It reads only
+        the offset index.
+
+        :return: a mapping of :class:`~monthday.MonthDay` values to
+                 the numbers of rows having them, in chronological order.
+                 values having no rows are omitted
+        :rtype: :class:`dict`
+
+        """
+        offsets = self._offsets
+        return dict(
+            (_interned[ordinal], offsets[ordinal + 1] - offsets[ordinal])
+            for ordinal in range(366)
+            if offsets[ordinal + 1] > offsets[ordinal]
+        )
+
+    def keys_on(self, month_day):
+        """Get the keys of rows having the given ``month_day``.  It reads
+        only the pages of the key column which contain them.
+
+        :param month_day: the month and day to look up
+        :type month_day: :class:`~monthday.MonthDay`
+        :return: the keys
+        :rtype: :class:`array.array`
+        :raise ValueError: if there's no key column
+
+        """
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+        elif not self.has_keys:
+            raise ValueError('the store has no key column')
+        ordinal = month_day._ordinal
+        start = self._offsets[ordinal]
+        return self._read(_int64, self._keys_start + 8 * start,
+                          self._offsets[ordinal + 1] - start)
+
+    def close(self):
+        """Close the memory-mapped file."""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return '<{0.__module__}.{0.__name__} of {1} rows>'.format(
+            type(self), self._count
+        )
@@ -0,0 +1,130 @@
+""":mod:`monthday.zones` --- Time zone-aware evaluation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Whether today is someone's birthday depends on their time zone.  Since there
+are far fewer time zones than people, functions in this module compute each
+zone's local date only once per call, and then answer for all records
+in a single pass:
+
+>>> import datetime
+>>> from monthday import MonthDay
+>>> instant = datetime.datetime(2015, 12, 24, 20, 0,
+...                             tzinfo=datetime.timezone.utc)
+>>> is_today([(MonthDay(12, 25), 'Asia/Seoul'),
+...           (MonthDay(12, 25), 'America/New_York'),
+...           (MonthDay(12, 24), 'America/New_York')], instant)
+[True, False, True]
+
+Time zones can be given as :class:`datetime.tzinfo` objects, or as IANA
+time zone names if :mod:`zoneinfo` is available (Python 3.9 or higher).
+
+"""
+import datetime
+
+from . import (MonthDay, _feb_29_ordinal, _is_leap, _month_offsets,
+               _observed_leap_policies, _substitute_day_of_year)
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+__all__ = 'is_today', 'local_ordinals'
+
+
+def _resolve(zone):
+    if isinstance(zone, datetime.tzinfo):
+        return zone
+    elif isinstance(zone, str):
+        if ZoneInfo is None:
+            raise ValueError('time zone names require zoneinfo (Python 3.9 '
+                             'or higher); use tzinfo objects instead')
+        return ZoneInfo(zone)
+    raise TypeError('zone must be a datetime.tzinfo or a time zone name, '
+                    'not ' + repr(zone))
+
+
+def _check_instant(instant):
+    if instant is None:
+        return datetime.datetime.now(datetime.timezone.utc)
+    elif not isinstance(instant, datetime.datetime):
+        raise TypeError('instant must be a datetime.datetime, not ' +
+                        repr(instant))
+    elif instant.tzinfo is None or instant.utcoffset() is None:
+        raise ValueError('instant must be timezone-aware')
+    return instant
+
+
+def local_ordinals(zone, instant, leap_policy='skip'):
+    """Get the ordinals (see :meth:`MonthDay.toordinal()
+    <monthday.MonthDay.toordinal>`) of :class:`~monthday.MonthDay` values
+    which are today in the given ``zone`` at the given ``instant``.
+    There are two if the ``leap_policy`` observes February 29 on the local
+    date, otherwise one.
+
+    >>> import datetime
+    >>> instant = datetime.datetime(2015, 2, 28, 12, 0,
+    ...                             tzinfo=datetime.timezone.utc)
+    >>> local_ordinals(datetime.timezone.utc, instant)
+    (58, 58)
+    >>> local_ordinals(datetime.timezone.utc, instant, leap_policy='feb28')
+    (58, 59)
+
+    :param zone: a time zone
+    :type zone: :class:`datetime.tzinfo`, :class:`str`
+    :param instant: a timezone-aware instant
+    :type instant: :class:`datetime.datetime`
+    :param leap_policy: how to treat February 29 in non-leap years.
+                        one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+    :type leap_policy: :class:`str`
+    :return: a pair of ordinals, which are the same if there's only one
+    :rtype: :class:`tuple`
+
+    """
+    if leap_policy not in _observed_leap_policies:
+        raise ValueError("leap_policy must be one of 'skip', 'feb28', and "
+                         "'mar1', not " + repr(leap_policy))
+    local = _check_instant(instant).astimezone(_resolve(zone))
+    ordinal = _month_offsets[local.month - 1] + local.day - 1
+    if not _is_leap(local.year) and _substitute_day_of_year(leap_policy) == (
+        ordinal - (ordinal > _feb_29_ordinal)
+    ):
+        return ordinal, _feb_29_ordinal
+    return ordinal, ordinal
+
+
+def is_today(records, instant=None, leap_policy='skip'):
+    """Evaluate whether each :class:`~monthday.MonthDay` is today in its
+    time zone at the given ``instant``.  The local date of each distinct
+    zone is computed only once.
+
+    :param records: pairs of a :class:`~monthday.MonthDay` and its time
+                    zone, which is a :class:`datetime.tzinfo` or
+                    a time zone name
+    :type records: :class:`~collections.abc.Iterable`
+    :param instant: a timezone-aware instant.  the current time by default
+    :type instant: :class:`datetime.datetime`
+    :param leap_policy: how to treat February 29 in non-leap years.
+                        one of ``'skip'``, ``'feb28'``, and ``'mar1'``
+    :type leap_policy: :class:`str`
+    :return: a boolean for each record, in the same order
+    :rtype: :class:`list`
+
+    """
+    instant = _check_instant(instant)
+    todays = {}
+    result = []
+    append = result.append
+    for month_day, zone in records:
+        try:
+            today, alternative = todays[zone]
+        except KeyError:
+            today, alternative = todays[zone] = local_ordinals(
+                zone, instant, leap_policy
+            )
+        if not isinstance(month_day, MonthDay):
+            raise TypeError('expected monthday.MonthDay, not ' +
+                            repr(month_day))
+        ordinal = month_day._ordinal
+        append(ordinal == today or ordinal == alternative)
+    return result
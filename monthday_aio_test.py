@@ -0,0 +1,144 @@
+import datetime
+
+from pytest import importorskip, raises
+
+from monthday import MonthDay
+
+asyncio = importorskip('asyncio')
+AnniversaryNotifier = importorskip('monthday.aio').AnniversaryNotifier
+
+
+class FakeClock(object):
+
+    def __init__(self, now):
+        self.current = now
+        self.slept = []
+
+    def now(self):
+        return self.current
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(0)
+        self.slept.append(seconds)
+        self.current += datetime.timedelta(seconds=seconds)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_anniversary_notifier():
+    clock = FakeClock(datetime.datetime(2015, 12, 24, 18, 0))
+    notifier = AnniversaryNotifier({
+        'christmas_eve': MonthDay(12, 24),
+        'christmas': MonthDay(12, 25),
+        'new_year': MonthDay(1, 1),
+        'leapling': MonthDay(2, 29),
+    }, clock=clock)
+
+    async def collect():
+        result = []
+        async for date, key in notifier:
+            result.append((clock.now(), date, key))
+            if len(result) >= 4:
+                notifier.stop()
+        return result
+    assert run(collect()) == [
+        (datetime.datetime(2015, 12, 24, 18, 0),
+         datetime.date(2015, 12, 24), 'christmas_eve'),
+        (datetime.datetime(2015, 12, 25),
+         datetime.date(2015, 12, 25), 'christmas'),
+        (datetime.datetime(2016, 1, 1),
+         datetime.date(2016, 1, 1), 'new_year'),
+        (datetime.datetime(2016, 2, 29),
+         datetime.date(2016, 2, 29), 'leapling'),
+    ]
+    assert clock.slept[0] == 6 * 60 * 60
+
+
+def test_anniversary_notifier_registration():
+    clock = FakeClock(datetime.datetime(2015, 8, 1))
+    notifier = AnniversaryNotifier(clock=clock)
+
+    async def collect():
+        result = []
+        async for date, key in notifier:
+            result.append((date, key))
+            if key == 'b':
+                notifier.stop()
+        return result
+
+    async def main():
+        task = asyncio.ensure_future(collect())
+        await asyncio.sleep(0)
+        notifier.register('a', MonthDay(12, 25))
+        await asyncio.sleep(0)
+        notifier.register('b', MonthDay(8, 4))
+        notifier.register('c', MonthDay(8, 3))
+        notifier.cancel('c')
+        return await task
+    assert run(main()) == [(datetime.date(2015, 8, 4), 'b')]
+    with raises(ValueError):
+        AnniversaryNotifier(leap_policy='raise')
+
+
+def test_anniversary_notifier_made_before_loop():
+    # On Python 3.9 or lower, an Event made before the loop bound to
+    # another loop, so waiting for changes failed at once and busy-looped.
+    class SlowClock(FakeClock):
+
+        async def sleep(self, seconds):
+            await asyncio.sleep(3600)
+
+    class CountingNotifier(AnniversaryNotifier):
+
+        waits = 0
+
+        async def _wait(self, due):
+            self.waits += 1
+            await super(CountingNotifier, self)._wait(due)
+
+    notifier = CountingNotifier(
+        clock=SlowClock(datetime.datetime(2015, 8, 1))
+    )
+
+    async def main():
+        async def first():
+            async for date, key in notifier:
+                notifier.stop()
+                return date, key
+        task = asyncio.ensure_future(first())
+        for _ in range(100):
+            await asyncio.sleep(0)
+        notifier.register('a', MonthDay(8, 1))
+        return await task
+    assert run(main()) == (datetime.date(2015, 8, 1), 'a')
+    assert notifier.waits == 1
+
+
+def test_anniversary_notifier_clock_moved():
+    class SlowClock(FakeClock):
+
+        async def sleep(self, seconds):
+            await asyncio.sleep(3600)
+
+    clock = SlowClock(datetime.datetime(2015, 8, 1))
+    notifier = AnniversaryNotifier({'christmas': MonthDay(12, 25)},
+                                   clock=clock)
+
+    async def main():
+        async def first():
+            async for date, key in notifier:
+                notifier.stop()
+                return date, key
+        task = asyncio.ensure_future(first())
+        await asyncio.sleep(0)
+        clock.current = datetime.datetime(2015, 8, 10, 9, 0)
+        notifier.register('late', MonthDay(8, 5))
+        notifier.register('today', MonthDay(8, 10))
+        return await task
+    assert run(main()) == (datetime.date(2015, 8, 10), 'today')
@@ -0,0 +1,111 @@
+import datetime
+
+from pytest import importorskip, raises
+
+from monthday import MonthDay
+
+numpy = importorskip('numpy')
+MonthDayArray = importorskip('monthday.array').MonthDayArray
+
+
+def test_month_day_array_init():
+    array = MonthDayArray([MonthDay(8, 4), MonthDay(2, 29)])
+    assert len(array) == 2
+    assert array.ordinals.dtype == numpy.uint16
+    assert array.ordinals.tolist() == [216, 59]
+    assert array[0] is MonthDay(8, 4)
+    assert array[-1] is MonthDay(2, 29)
+    assert list(array) == [MonthDay(8, 4), MonthDay(2, 29)]
+    assert array[::-1] == MonthDayArray([MonthDay(2, 29), MonthDay(8, 4)])
+    assert MonthDayArray(array) == array
+    assert len(MonthDayArray([])) == 0
+    with raises(TypeError):
+        MonthDayArray([MonthDay(8, 4), datetime.date(1988, 8, 4)])
+    with raises(ValueError):
+        array.ordinals[0] = 0
+
+
+def test_month_day_array_from_ordinals():
+    array = MonthDayArray.from_ordinals(numpy.arange(366))
+    assert list(array) == [MonthDay.fromordinal(i) for i in range(366)]
+    with raises(ValueError):
+        MonthDayArray.from_ordinals([0, 366])
+    with raises(ValueError):
+        MonthDayArray.from_ordinals([-1])
+    with raises(TypeError):
+        MonthDayArray.from_ordinals([1.5])
+
+
+def test_month_day_array_from_datetime64():
+    start = datetime.date(2015, 1, 1)
+    dates = [start + datetime.timedelta(days=i) for i in range(365 * 2)]
+    array = MonthDayArray.from_datetime64(
+        numpy.array(dates, dtype='datetime64[D]')
+    )
+    assert list(array) == [MonthDay.from_date(d) for d in dates]
+    array = MonthDayArray.from_datetime64(
+        numpy.array(['1988-08-04T12:34'], dtype='datetime64[m]')
+    )
+    assert list(array) == [MonthDay(8, 4)]
+    with raises(ValueError):
+        MonthDayArray.from_datetime64(numpy.array(['NaT'], dtype='M8[D]'))
+    with raises(TypeError):
+        MonthDayArray.from_datetime64(numpy.arange(3))
+
+
+def test_month_day_array_date():
+    array = MonthDayArray.from_ordinals(numpy.arange(366))
+    for year in 2015, 2016, 1900, 2000:
+        dates, invalid = array.date(year)
+        expected = [
+            d for md in array for d in md.dates([year], None)
+        ]
+        assert invalid.tolist() == [d is None for d in expected]
+        assert dates.tolist() == expected
+    array = MonthDayArray([MonthDay(2, 29), MonthDay(2, 29), MonthDay(3, 1)])
+    dates, invalid = array.date(numpy.array([2015, 2016, 2015]))
+    assert invalid.tolist() == [True, False, False]
+    assert dates.tolist() == [
+        None, datetime.date(2016, 2, 29), datetime.date(2015, 3, 1),
+    ]
+    with raises(TypeError):
+        array.date(2015.0)
+
+
+def test_month_day_from_dates_datetime64():
+    dates = numpy.array(['2016-02-29', '1988-08-04'], dtype='datetime64[D]')
+    assert MonthDay.from_dates(dates) == [MonthDay(2, 29), MonthDay(8, 4)]
+    dates = numpy.array(['2016-02-29', 'NaT'], dtype='datetime64[D]')
+    with raises(ValueError) as excinfo:
+        MonthDay.from_dates(dates)
+    assert 'dates[1]' in str(excinfo.value)
+
+
+def test_month_day_array_days_until_since():
+    array = MonthDayArray.from_ordinals(numpy.arange(366).repeat(3))
+    dates = numpy.array(['1896-03-01', '2015-12-24', '2016-02-29'] * 366,
+                        dtype='datetime64[D]')
+    for leap_policy in 'skip', 'feb28', 'mar1':
+        assert array.days_until(dates, leap_policy).tolist() == [
+            md.days_until(d, leap_policy)
+            for md, d in zip(array, dates.tolist())
+        ]
+        assert array.days_since(dates, leap_policy).tolist() == [
+            md.days_since(d, leap_policy)
+            for md, d in zip(array, dates.tolist())
+        ]
+    today = datetime.date(2015, 12, 24)
+    assert array.days_until(today).tolist() == [
+        md.days_until(today) for md in array
+    ]
+    assert array[:0].days_until(today).tolist() == []
+    with raises(ValueError):
+        array.days_until(numpy.array(['NaT'] * len(array),
+                                     dtype='datetime64[D]'))
+    with raises(TypeError):
+        array.days_until(numpy.arange(len(array)))
+
+
+def test_month_day_array_format_many():
+    array = MonthDayArray([MonthDay(8, 4), MonthDay(2, 29)])
+    assert MonthDay.format_many(array, '%d.%m.') == ['04.08.', '29.02.']
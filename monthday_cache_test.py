@@ -0,0 +1,105 @@
+import datetime
+import sys
+import threading
+
+from pytest import fixture, mark, raises
+
+from monthday import MonthDay
+from monthday.cache import CacheInfo, clear, disable, enable, info
+
+# Python 2's xrange objects are compared by identity, not by value.
+pytestmark = mark.skipif(sys.version_info < (3,),
+                         reason='the tests compare range objects')
+
+
+@fixture
+def cache():
+    enable(range(2000, 2020))
+    try:
+        yield
+    finally:
+        disable()
+
+
+def test_cache_disabled():
+    assert info() is None
+    clear()
+    assert MonthDay(8, 4).date(2015) == datetime.date(2015, 8, 4)
+    assert info() is None
+
+
+def test_cache(cache):
+    aug_4 = MonthDay(8, 4)
+    date = aug_4.date(2015)
+    assert date == datetime.date(2015, 8, 4)
+    assert aug_4.date(2015) is date
+    assert aug_4.date(2015, leap_policy='feb28') is date
+    assert aug_4.date(2030) == datetime.date(2030, 8, 4)
+    assert info() == CacheInfo(hits=2, misses=2, years=range(2000, 2020),
+                               currsize=1)
+    clear()
+    assert info() == CacheInfo(hits=0, misses=0, years=range(2000, 2020),
+                               currsize=0)
+    assert aug_4.date(2015) is not date
+    assert info().currsize == 1
+    enable(range(1990, 2000))
+    assert info().currsize == 0
+
+
+def test_cache_feb_29(cache):
+    feb_29 = MonthDay(2, 29)
+    for _ in range(2):
+        assert feb_29.date(2016) == datetime.date(2016, 2, 29)
+        with raises(ValueError) as excinfo:
+            feb_29.date(2015)
+        assert str(excinfo.value) == (
+            "since 2015 is not a leap year, monthday.MonthDay(2, 29) can't "
+            'be combined with 2015'
+        )
+        assert feb_29.date(2015, leap_policy='feb28') == \
+            datetime.date(2015, 2, 28)
+        assert feb_29.date(2015, leap_policy='none') is None
+    assert info().currsize == 1
+    misses = info().misses
+    with raises(TypeError):
+        feb_29.date(2016.0)
+    with raises(ValueError):
+        feb_29.date(2016, leap_policy='invalid')
+    assert info().misses == misses
+
+
+def test_cache_threads(cache):
+    month_days = [MonthDay.fromordinal(i) for i in range(366)]
+    errors = []
+
+    def run():
+        try:
+            for year in range(1995, 2025):
+                for md in month_days:
+                    if md.month == 2 and md.day == 29:
+                        continue
+                    assert md.date(year) == datetime.date(year, md.month,
+                                                          md.day)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert info().currsize == 20 * 365
+    stats = info()
+    assert stats.hits + stats.misses == 4 * 30 * 365
+
+
+def test_enable_invalid():
+    with raises(TypeError):
+        enable([2015, 2016])
+    with raises(ValueError):
+        enable(range(2000, 2020, 2))
+    with raises(ValueError):
+        enable(range(2000, 2000))
+    with raises(ValueError):
+        enable(range(9000, 10001))
+    assert info() is None
@@ -0,0 +1,189 @@
+import array
+import collections
+import datetime
+import pickle
+import random
+
+from pytest import importorskip, raises
+
+from monthday import MonthDay, pack
+from monthday.containers import MonthDayCounter, MonthDayMap, MonthDaySet
+
+
+def random_month_days(seed, count):
+    rand = random.Random(seed)
+    return [MonthDay.fromordinal(rand.randrange(366)) for _ in range(count)]
+
+
+def test_month_day_set():
+    values = random_month_days(0, 100)
+    month_days = MonthDaySet(values)
+    assert len(month_days) == len(set(values))
+    assert list(month_days) == sorted(set(values))
+    assert list(reversed(month_days)) == sorted(set(values), reverse=True)
+    assert all(md in month_days for md in values)
+    assert datetime.date(2015, 1, 1) not in month_days
+    assert month_days == set(values)
+    assert MonthDaySet(month_days) == month_days
+    assert MonthDaySet.from_bits(month_days.bits) == month_days
+    month_days.add(MonthDay(2, 29))
+    assert MonthDay(2, 29) in month_days
+    month_days.discard(MonthDay(2, 29))
+    month_days.discard(MonthDay(2, 29))
+    assert MonthDay(2, 29) not in month_days
+    with raises(KeyError):
+        month_days.remove(MonthDay(2, 29))
+    with raises(TypeError):
+        month_days.add('02-29')
+    with raises(TypeError):
+        MonthDaySet([1])
+    with raises(ValueError):
+        MonthDaySet.from_bits(1 << 366)
+    with raises(TypeError):
+        MonthDaySet.from_bits(3.0)
+    with raises(TypeError):
+        MonthDaySet.from_bits('3')
+    assert len(~MonthDaySet()) == 366
+    assert ~~month_days == month_days
+    month_days.clear()
+    assert not month_days
+
+
+def test_month_day_set_operations():
+    a_values = set(random_month_days(1, 100))
+    b_values = set(random_month_days(2, 100))
+    a, b = MonthDaySet(a_values), MonthDaySet(b_values)
+    assert a | b == a_values | b_values
+    assert a & b == a_values & b_values
+    assert a - b == a_values - b_values
+    assert a ^ b == a_values ^ b_values
+    assert isinstance(a | b, MonthDaySet)
+    assert a | b_values == a_values | b_values
+    assert isinstance(a | b_values, MonthDaySet)
+    assert a & b <= a and a & b < a
+    assert not a <= b
+    assert a >= a & b and not a > a
+    assert a.isdisjoint(b - a)
+    c = a.copy()
+    c |= b
+    assert c == a_values | b_values
+    c &= b
+    assert c == b_values
+    c -= a
+    assert c == b_values - a_values
+    c ^= b
+    assert c == a_values & b_values
+    c |= a_values
+    assert c == a_values
+
+
+def test_month_day_map():
+    mapping = MonthDayMap({MonthDay(12, 25): 'christmas'})
+    mapping[MonthDay(1, 1)] = 'new_year'
+    mapping[MonthDay(2, 29)] = None
+    assert len(mapping) == 3
+    assert list(mapping) == [MonthDay(1, 1), MonthDay(2, 29),
+                             MonthDay(12, 25)]
+    assert list(reversed(mapping)) == list(mapping)[::-1]
+    assert mapping[MonthDay(2, 29)] is None
+    assert mapping.get(MonthDay(8, 4)) is None
+    assert MonthDay(2, 29) in mapping
+    assert MonthDay(8, 4) not in mapping
+    assert 'x' not in mapping
+    assert mapping.keyset() == MonthDaySet(mapping)
+    mapping[MonthDay(1, 1)] = 'new_years_day'
+    assert len(mapping) == 3
+    del mapping[MonthDay(2, 29)]
+    assert len(mapping) == 2
+    assert dict(mapping) == {
+        MonthDay(1, 1): 'new_years_day', MonthDay(12, 25): 'christmas',
+    }
+    with raises(KeyError):
+        mapping[MonthDay(2, 29)]
+    with raises(KeyError):
+        del mapping[MonthDay(2, 29)]
+    with raises(KeyError):
+        mapping['01-01']
+    with raises(TypeError):
+        mapping['01-01'] = 1
+    mapping.clear()
+    assert len(mapping) == 0 and list(mapping) == []
+
+
+def test_containers_pickle():
+    containers = [
+        MonthDaySet([MonthDay(8, 4), MonthDay(2, 29)]),
+        MonthDayMap({MonthDay(12, 25): 'christmas'}),
+        MonthDayCounter([[MonthDay(8, 4), MonthDay(8, 4)]]),
+    ]
+    for container in containers:
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(container, protocol))
+            assert type(loaded) is type(container)
+            assert loaded == container
+            assert list(loaded) == list(container)
+
+
+def test_month_day_counter():
+    values = random_month_days(2, 500)
+    expected = collections.Counter(values)
+    counter = MonthDayCounter()
+    counter.update(values[:100])
+    counter.update(md.date(2016) for md in values[100:200])
+    counter.update(array.array('H', [md.toordinal() for md in values[200:]]))
+    assert dict(counter) == dict(expected)
+    assert counter.total() == 500
+    assert len(counter) == len(expected)
+    assert list(counter) == sorted(expected)
+    assert counter[MonthDay(2, 29)] == expected[MonthDay(2, 29)]
+    assert counter.most_common(3) == sorted(
+        expected.items(), key=lambda pair: (-pair[1], pair[0])
+    )[:3]
+    assert MonthDayCounter([pack(values)]) == counter
+    assert MonthDayCounter.from_counts(counter.counts) == counter
+    with raises(TypeError):
+        counter.update(['08-04'])
+    with raises(TypeError):
+        counter.update(array.array('d', [1.0]))
+    with raises(ValueError):
+        counter.update(array.array('H', [366]))
+    with raises(ValueError):
+        counter.update(b'\x00')
+    with raises(ValueError):
+        MonthDayCounter.from_counts([0] * 365)
+    assert counter.total() == 500
+
+
+def test_month_day_counter_merge():
+    values = random_month_days(3, 300)
+    shards = [MonthDayCounter([values[i:i + 100]]) for i in (0, 100, 200)]
+    merged = shards[0] + shards[1] + shards[2]
+    assert merged == MonthDayCounter([values])
+    shards[0] += shards[1]
+    assert shards[0].total() == 200
+    assert pickle.loads(pickle.dumps(merged)) == merged
+
+
+def test_month_day_counter_numpy():
+    numpy = importorskip('numpy')
+    from monthday.array import MonthDayArray
+    values = random_month_days(4, 300)
+    ordinals = numpy.array([md.toordinal() for md in values])
+    dates = numpy.array([md.date(2016) for md in values],
+                        dtype='datetime64[D]')
+    expected = MonthDayCounter([values])
+    assert MonthDayCounter([ordinals]) == expected
+    assert MonthDayCounter([dates]) == expected
+    assert MonthDayCounter([MonthDayArray(values)]) == expected
+    assert MonthDayCounter([dates.reshape(4, 75)]) == expected
+    assert MonthDayCounter([ordinals.reshape(4, 75)]) == expected
+
+    class MonthDayArray(list):
+        pass
+    assert MonthDayCounter([MonthDayArray(values)]) == expected
+    with raises(ValueError):
+        MonthDayCounter([numpy.array([-1])])
+    with raises(ValueError):
+        MonthDayCounter([numpy.array(['NaT'], dtype='datetime64[D]')])
+    with raises(TypeError):
+        MonthDayCounter([numpy.array([1.0])])
@@ -0,0 +1,125 @@
+import datetime
+
+from pytest import fixture, raises
+
+from monthday import MonthDay
+from monthday.index import MonthDayIndex
+
+
+@fixture
+def index():
+    return MonthDayIndex({
+        'feb_29': MonthDay(2, 29),
+        'feb_28': MonthDay(2, 28),
+        'mar_1': MonthDay(3, 1),
+        'aug_4': MonthDay(8, 4),
+        'dec_25': MonthDay(12, 25),
+        'jan_1': MonthDay(1, 1),
+    })
+
+
+def brute_force(index, start, end, leap_policy):
+    result = []
+    date = start
+    while date <= end:
+        for key, md in index.items():
+            if md == MonthDay.from_date(date):
+                result.append((date, key))
+            elif md == MonthDay(2, 29) and date.month != 2 and \
+                    (date.year % 4 or not date.year % 100 and date.year % 400):
+                if leap_policy == 'mar1' and (date.month, date.day) == (3, 1):
+                    result.append((date, key))
+        if leap_policy == 'feb28' and (date.month, date.day) == (2, 28):
+            for key, md in index.items():
+                if md == MonthDay(2, 29) and not (
+                    date.year % 4 == 0 and
+                    (date.year % 100 or date.year % 400 == 0)
+                ):
+                    result.append((date, key))
+        date += datetime.timedelta(days=1)
+    return result
+
+
+def test_month_day_index_mapping(index):
+    assert len(index) == 6
+    assert index['aug_4'] is MonthDay(8, 4)
+    assert 'aug_4' in index
+    assert list(index) == ['jan_1', 'feb_28', 'feb_29', 'mar_1', 'aug_4',
+                           'dec_25']
+    index['aug_4'] = MonthDay(1, 1)
+    assert index.keys_on(MonthDay(1, 1)) == ['jan_1', 'aug_4']
+    assert index.keys_on(MonthDay(8, 4)) == []
+    del index['aug_4']
+    assert 'aug_4' not in index
+    assert index.keys_on(MonthDay(1, 1)) == ['jan_1']
+    with raises(KeyError):
+        del index['aug_4']
+    with raises(TypeError):
+        index['x'] = datetime.date(1988, 8, 4)
+
+
+def test_month_day_index_between(index):
+    windows = [
+        (datetime.date(2015, 1, 1), datetime.date(2015, 12, 31)),
+        (datetime.date(2015, 12, 1), datetime.date(2016, 3, 1)),
+        (datetime.date(2014, 2, 28), datetime.date(2015, 2, 28)),
+        (datetime.date(2015, 3, 1), datetime.date(2015, 8, 4)),
+        (datetime.date(2015, 3, 2), datetime.date(2015, 3, 1)),
+        (datetime.date(2099, 1, 1), datetime.date(2101, 3, 1)),
+    ]
+    for leap_policy in 'skip', 'feb28', 'mar1':
+        for start, end in windows:
+            assert list(index.between(start, end, leap_policy)) == \
+                brute_force(index, start, end, leap_policy)
+    with raises(ValueError):
+        index.between(windows[0][0], windows[0][1], 'raise')
+    with raises(TypeError):
+        index.between('2015-01-01', windows[0][1])
+
+
+def test_month_day_index_upcoming(index):
+    today = datetime.date(2015, 12, 20)
+    assert list(index.upcoming(today, 13)) == [
+        (datetime.date(2015, 12, 25), 'dec_25'),
+        (datetime.date(2016, 1, 1), 'jan_1'),
+    ]
+    assert list(index.upcoming(today, 12)) == [
+        (datetime.date(2015, 12, 25), 'dec_25'),
+    ]
+    assert list(index.upcoming(today, 0)) == []
+    with raises(ValueError):
+        index.upcoming(today, -1)
+
+
+def test_month_day_index_occurrences(index):
+    since = datetime.date(2015, 6, 1)
+    for leap_policy in 'skip', 'feb28', 'mar1':
+        occurrences = index.occurrences(since, leap_policy)
+        expected = brute_force(index, since, datetime.date(2021, 5, 31),
+                               leap_policy)
+        assert [next(occurrences) for _ in expected] == expected
+    occurrences = MonthDayIndex({'x': MonthDay(2, 29)}).occurrences(since)
+    assert next(occurrences) == (datetime.date(2016, 2, 29), 'x')
+    assert next(occurrences) == (datetime.date(2020, 2, 29), 'x')
+    assert list(MonthDayIndex().occurrences(since)) == []
+    index = MonthDayIndex({'x': MonthDay(12, 31)})
+    occurrences = index.occurrences(datetime.date(9998, 1, 1))
+    assert list(occurrences) == [
+        (datetime.date(9998, 12, 31), 'x'), (datetime.date(9999, 12, 31), 'x'),
+    ]
+
+
+def test_month_day_index_occurrences_mutation():
+    index = MonthDayIndex({'a': MonthDay(1, 1)})
+    occurrences = index.occurrences(datetime.date(2015, 1, 1))
+    assert next(occurrences) == (datetime.date(2015, 1, 1), 'a')
+    index['b'] = MonthDay(8, 4)
+    assert next(occurrences) == (datetime.date(2015, 8, 4), 'b')
+    del index['a']
+    assert next(occurrences) == (datetime.date(2016, 8, 4), 'b')
+    del index['b']
+    assert list(occurrences) == []
+    with raises(TypeError):
+        index.occurrences('2015-01-01')
+    with raises(ValueError):
+        index.occurrences(datetime.date(2015, 1, 1), 'raise')
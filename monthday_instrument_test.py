@@ -0,0 +1,93 @@
+import datetime
+import pickle
+import sys
+
+from pytest import mark, raises
+
+from monthday import MonthDay, MonthDayDates
+from monthday.instrument import add_hook, collect, remove_hook
+
+
+def test_collect():
+    original_new = MonthDay.__new__
+    original_dates = MonthDay.__dict__['dates']
+    with collect() as stats:
+        assert MonthDay.__new__ is not original_new
+        aug_4 = MonthDay(8, 4)
+        MonthDay.from_date(datetime.date(2016, 2, 29))
+        aug_4.date(2015)
+        pickle.loads(pickle.dumps(aug_4))
+        years = range(2011, 2017)
+        list(MonthDay(2, 29).dates(years, False))
+        list(MonthDay(2, 29).dates(years, None))
+        with raises(ValueError):
+            list(MonthDay(2, 29).dates(years))
+        with raises(TypeError):
+            MonthDay(8, 4).dates(2015)
+        with collect() as inner:
+            MonthDay(12, 25)
+    assert MonthDay.__new__ is original_new
+    assert MonthDay.__dict__['dates'] is original_dates
+    assert stats.counters['construct'] == 6
+    assert stats.counters['from_date'] == 1
+    assert stats.counters['date'] == 2
+    assert stats.counters['dates'] == 4
+    assert stats.counters['dates.yielded'] == 4
+    assert stats.counters['dates.invalid'] == 9
+    assert stats.counters['pickle'] == 1
+    assert stats.timings['construct'].count == 6
+    assert stats.timings['construct'].mean > 0
+    assert sum(stats.timings['construct'].buckets.values()) == 6
+    assert inner.counters == {'construct': 1}
+    MonthDay(8, 4)
+    assert stats.counters['construct'] == 6
+
+
+@mark.skipif(sys.version_info < (3,), reason='range views need Python 3')
+def test_collect_dates_range():
+    original_iter = MonthDayDates.__iter__
+    years = range(2011, 2017)
+    with collect() as stats:
+        assert MonthDayDates.__iter__ is not original_iter
+        dates = MonthDay(2, 29).dates(years, False)
+        assert isinstance(dates, MonthDayDates)
+        assert len(dates) == 2
+        assert dates[-1] == datetime.date(2016, 2, 29)
+        assert list(dates) == [datetime.date(2012, 2, 29),
+                               datetime.date(2016, 2, 29)]
+        assert isinstance(MonthDay(2, 29).dates(years, None), MonthDayDates)
+        assert list(reversed(MonthDay(2, 29).dates(years, None)))[0] == \
+            datetime.date(2016, 2, 29)
+        for _ in MonthDay(8, 4).dates(years):
+            break
+        # Slices don't record years they don't span.
+        list(MonthDay(2, 29).dates(years, False)[:1])
+    assert MonthDayDates.__iter__ is original_iter
+    assert stats.counters['dates'] == 5
+    assert stats.counters['dates.yielded'] == 2 + 2 + 1 + 1
+    assert stats.counters['dates.invalid'] == 4 + 4
+
+
+def test_hook():
+    records = []
+
+    def hook(operation, seconds, count):
+        records.append((operation, seconds is not None, count))
+    add_hook(hook)
+    try:
+        MonthDay(8, 4)
+        list(MonthDay(8, 4).dates([2015]))
+    finally:
+        remove_hook(hook)
+    MonthDay(8, 4)
+    assert records == [
+        ('construct', True, 1),
+        ('construct', True, 1),
+        ('dates', False, 1),
+        ('dates.yielded', False, 1),
+        ('dates.invalid', False, 0),
+    ]
+    with raises(TypeError):
+        add_hook(None)
+    with raises(ValueError):
+        remove_hook(hook)
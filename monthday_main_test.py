@@ -0,0 +1,149 @@
+import datetime
+import io
+import os
+import subprocess
+import sys
+
+from pytest import fixture, raises
+
+import monthday
+from monthday import MonthDay
+from monthday.__main__ import main
+from monthday.index import MonthDayIndex
+
+
+CSV = '''name,birthday
+alice,1988-12-25
+bob,1990-02-29
+carol,2000-02-29T10:00:00
+dave,12-26
+"eve, jr.",1970-01-03
+frank,1971-12-25
+'''
+
+
+def run(argv, stdin=''):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    assert main(argv, io.StringIO(stdin), stdout, stderr) == 0
+    return stdout.getvalue(), stderr.getvalue()
+
+
+@fixture
+def csv_file(tmpdir):
+    path = tmpdir.join('users.csv')
+    path.write(CSV)
+    return str(path)
+
+
+def test_count(csv_file):
+    out, err = run(['count', '--column', 'birthday', '--skip-invalid'], CSV)
+    assert out == '01-03,1\n02-29,1\n12-25,2\n12-26,1\n'
+    assert err == ''
+    out, _ = run(['group', '-c', '1', '--header', '--skip-invalid',
+                  '--sort', 'count', csv_file, csv_file])
+    assert out.splitlines()[0] == '12-25,4'
+    assert len(out.splitlines()) == 4
+    out, _ = run(['count'], '08-04\n--08-04\n0804\n2016-02-29\n')
+    assert out == '02-29,1\n08-04,3\n'
+
+
+def test_count_invalid(csv_file):
+    with raises(SystemExit) as e:
+        run(['count', '-c', 'birthday'], CSV)
+    assert str(e.value) == "error: <stdin>: row 2: invalid date: '1990-02-29'"
+    with raises(SystemExit) as e:
+        run(['count', '-c', 'nonexistent'], CSV)
+    with raises(SystemExit) as e:
+        run(['count', '-c', '3'], 'a,08-04\n')
+    assert 'row 1' in str(e.value)
+    # Rows are numbered in each file.
+    with raises(SystemExit) as e:
+        run(['count', '-c', '1', '--header', '-', csv_file],
+            'name,birthday\na,08-04\nb,08-05\nc,08-06\n')
+    assert str(e.value) == (
+        "error: {0}: row 2: invalid date: '1990-02-29'".format(csv_file)
+    )
+
+
+def test_count_stats():
+    _, err = run(['--stats', 'count'], '08-04\n' * 10)
+    assert err.startswith('count: 10 rows in ')
+    assert err.endswith(' rows/s)\n')
+
+
+def test_upcoming():
+    out, _ = run(['upcoming', '-c', 'birthday', '--skip-invalid',
+                  '--from', '2015-12-24', '--days', '10'], CSV)
+    assert out == (
+        '2015-12-25,1,alice,1988-12-25\n'
+        '2015-12-26,2,dave,12-26\n'
+        '2015-12-25,1,frank,1971-12-25\n'
+    )
+    # The window agrees with MonthDayIndex.upcoming().
+    index = MonthDayIndex({'eve': MonthDay(1, 3)})
+    assert not list(index.upcoming(datetime.date(2015, 12, 24), 10))
+    out, _ = run(['upcoming', '--from', '2015-12-24', '--days', '11'],
+                 '1970-01-03\n')
+    assert out == '2016-01-03,10,1970-01-03\n'
+    out, _ = run(['upcoming', '--from', '2015-02-27', '--days', '2'],
+                 '02-29\n02-28\n03-01\n')
+    assert out == '2015-02-28,1,02-28\n'
+    out, _ = run(['upcoming', '--from', '2015-02-27', '--days', '2',
+                  '--leap-policy', 'feb28'], '02-29\n')
+    assert out == '2015-02-28,1,02-29\n'
+    out, _ = run(['upcoming', '--from', '2015-02-27', '--days', '0'],
+                 '02-27\n')
+    assert out == ''
+    out, _ = run(['upcoming', '--from', '9999-12-30', '--days', '5'],
+                 '12-31\n01-01\n')
+    assert out == '9999-12-31,1,12-31\n'
+
+
+def test_expand():
+    out, _ = run(['expand', '--years', '2015:2017', '08-04', '02-29'])
+    assert out == '2015-08-04\n2016-08-04\n2017-08-04\n2016-02-29\n'
+    out, _ = run(['expand', '-y', '2015:2016', '--leap-policy', 'mar1'],
+                 '02-29\n\n12-25\n')
+    assert out == '2015-03-01\n2016-02-29\n2015-12-25\n2016-12-25\n'
+    out, _ = run(['expand', '-y', '9998:10000', '12-31'])
+    assert out == '9998-12-31\n9999-12-31\n'
+    for leap_policy in 'skip', 'feb28', 'mar1':
+        out, _ = run(['expand', '-y', '9999:10000', '--leap-policy',
+                      leap_policy, '08-04'])
+        assert out == '9999-08-04\n'
+        out, _ = run(['expand', '-y', '0:1', '--leap-policy', leap_policy,
+                      '02-29'])
+        assert out == {'skip': '', 'feb28': '0001-02-28\n',
+                       'mar1': '0001-03-01\n'}[leap_policy]
+    out, _ = run(['expand', '-y', '2015:2014', '12-31'])
+    assert out == ''
+    with raises(SystemExit):
+        run(['expand', '-y', '2015', '12-31'])
+    with raises(SystemExit):
+        run(['expand', '-y', '2015:2016', '13-01'])
+    with raises(SystemExit) as e:
+        run(['expand', '-y', '2015:2016'], '08-04\n\n13-01\n')
+    assert str(e.value) == "error: <stdin>: line 3: invalid month-day: '13-01'"
+
+
+def test_standard_streams():
+    # Run as a process to read and write the real standard streams.
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'monthday', 'count', '-c', 'birthday',
+         '--skip-invalid'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        cwd=os.path.dirname(os.path.dirname(monthday.__file__))
+    )
+    out, _ = process.communicate(CSV.replace('\n', '\r\n').encode())
+    assert process.returncode == 0
+    assert out == b'01-03,1\n02-29,1\n12-25,2\n12-26,1\n'
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'monthday', 'count'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        cwd=os.path.dirname(os.path.dirname(monthday.__file__)),
+        env=dict(os.environ, PYTHONIOENCODING='utf-8')
+    )
+    _, err = process.communicate(b'08-04\n\xff\n')
+    assert process.returncode == 1
+    assert err.startswith(b"error: <stdin>: 'utf-8' codec can't decode")
@@ -0,0 +1,114 @@
+from pytest import importorskip, raises
+
+from monthday import MonthDay
+
+numpy = importorskip('numpy')
+pandas = importorskip('pandas')
+monthday_pandas = importorskip('monthday.pandas')
+MonthDayDtype = monthday_pandas.MonthDayDtype
+MonthDayExtensionArray = monthday_pandas.MonthDayExtensionArray
+
+
+def make_series():
+    return pandas.Series(
+        [MonthDay(8, 4), MonthDay(2, 29), None, MonthDay(1, 1)],
+        dtype='monthday'
+    )
+
+
+def test_dtype():
+    series = make_series()
+    assert isinstance(series.dtype, MonthDayDtype)
+    assert series.dtype == pandas.api.types.pandas_dtype('monthday')
+    assert series.array.ordinals.dtype == numpy.uint16
+    assert series.array.nbytes == 8
+    assert series[0] is MonthDay(8, 4)
+    assert series[2] is pandas.NA
+    assert series.isna().tolist() == [False, False, True, False]
+    assert pandas.Series(['08-04', None], dtype='monthday').tolist() == [
+        MonthDay(8, 4), pandas.NA
+    ]
+    with raises(TypeError):
+        pandas.Series([MonthDay(8, 4), 1], dtype='monthday')
+    with raises(ValueError):
+        MonthDayExtensionArray(numpy.array([366], dtype=numpy.uint16))
+
+
+def test_array_operations():
+    series = make_series()
+    assert series.sort_values().tolist() == [
+        MonthDay(1, 1), MonthDay(2, 29), MonthDay(8, 4), pandas.NA
+    ]
+    assert series.take([3, 0]).tolist() == [MonthDay(1, 1), MonthDay(8, 4)]
+    assert pandas.concat([series, series]).tolist() == series.tolist() * 2
+    assert series.fillna(MonthDay(12, 25))[2] is MonthDay(12, 25)
+    copied = series.copy()
+    copied[0] = MonthDay(3, 1)
+    assert series[0] is MonthDay(8, 4)
+    assert copied[0] is MonthDay(3, 1)
+    frame = pandas.DataFrame({'md': pandas.concat([series, series]),
+                              'x': range(8)})
+    sums = frame.groupby('md').x.sum()
+    assert sums.index.tolist() == [MonthDay(1, 1), MonthDay(2, 29),
+                                   MonthDay(8, 4)]
+    assert sums.tolist() == [10, 6, 4]
+
+
+def test_comparison():
+    series = make_series()
+    assert (series == MonthDay(1, 1)).tolist() == [False, False, pandas.NA,
+                                                   True]
+    assert (series < MonthDay(3, 1)).tolist() == [False, True, pandas.NA,
+                                                  True]
+    assert (series >= series).tolist() == [True, True, pandas.NA, True]
+    assert (series == 5).tolist() == [False] * 4
+    assert (series != 5).tolist() == [True] * 4
+    assert (series == 'foo').tolist() == [False] * 4
+    assert (series != 'foo').tolist() == [True] * 4
+    with raises(TypeError):
+        series < 5
+
+
+def test_accessor():
+    series = make_series()
+    assert series.md.month.tolist() == [8, 2, pandas.NA, 1]
+    assert series.md.day.tolist() == [4, 29, pandas.NA, 1]
+    assert series.md.ordinal.tolist() == [216, 59, pandas.NA, 0]
+    assert series.md.date(2016).tolist() == [
+        pandas.Timestamp(2016, 8, 4), pandas.Timestamp(2016, 2, 29),
+        pandas.NaT, pandas.Timestamp(2016, 1, 1),
+    ]
+    assert series.md.date(2015).isna().tolist() == [False, True, True, False]
+    with raises(AttributeError):
+        pandas.Series([1, 2]).md
+
+
+def test_parquet_round_trip(tmpdir):
+    pyarrow = importorskip('pyarrow')
+    importorskip('pyarrow.parquet')
+    from monthday.arrow import MonthDayType
+    frame = pandas.DataFrame({'md': make_series(), 'x': range(4)})
+    table = pyarrow.Table.from_pandas(frame)
+    assert table.schema.field('md').type == MonthDayType()
+    assert table.column('md').chunk(0).storage.type == pyarrow.uint16()
+    path = str(tmpdir.join('month_days.parquet'))
+    frame.to_parquet(path)
+    read = pandas.read_parquet(path)
+    assert isinstance(read.md.dtype, MonthDayDtype)
+    assert read.md.tolist() == frame.md.tolist()
+
+
+def test_arrow():
+    pyarrow = importorskip('pyarrow')
+    arrow = importorskip('monthday.arrow')
+    array = arrow.from_month_days([MonthDay(8, 4), None, MonthDay(2, 29)])
+    assert array.type == arrow.MonthDayType()
+    assert array.storage.to_pylist() == [216, None, 59]
+    assert array.to_pylist() == [MonthDay(8, 4), None, MonthDay(2, 29)]
+    assert array[0].as_py() is MonthDay(8, 4)
+    with raises(TypeError):
+        arrow.from_month_days(['08-04'])
+    chunked = pyarrow.chunked_array([array, array])
+    assert MonthDayDtype().__from_arrow__(chunked).tolist() == [
+        MonthDay(8, 4), pandas.NA, MonthDay(2, 29)
+    ] * 2
@@ -0,0 +1,104 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import mark, raises
+
+from monthday import MonthDay
+from monthday import parallel
+from monthday.parallel import expand, expand_ordinals
+
+
+month_days = [MonthDay.fromordinal(i * 7 % 366) for i in range(500)]
+years = range(1896, 1906)
+
+
+@mark.parametrize('error_invalid_dates', [False, None])
+def test_expand(error_invalid_dates):
+    result = list(expand(month_days, years, error_invalid_dates,
+                         chunk_size=64))
+    assert result == [list(md.dates(years, error_invalid_dates))
+                      for md in month_days]
+
+
+@mark.parametrize('leap_policy', ['skip', 'none', 'feb28', 'mar1'])
+def test_expand_leap_policy(leap_policy):
+    with ThreadPoolExecutor(2) as executor:
+        result = list(expand(month_days, [1900, 2000, 2015, 2016],
+                             leap_policy=leap_policy, executor=executor,
+                             chunk_size=7))
+    assert result == [list(md.dates([1900, 2000, 2015, 2016],
+                                    leap_policy=leap_policy))
+                      for md in month_days]
+
+
+def test_expand_raise():
+    results = expand(month_days, years, chunk_size=100)
+    # MonthDay(2, 29) is in the 2nd chunk; the 1st chunk is still generated.
+    assert month_days.index(MonthDay(2, 29)) == 113
+    for _ in range(100):
+        next(results)
+    with raises(ValueError):
+        next(results)
+    with raises(ValueError):
+        list(expand(month_days, years, leap_policy='invalid'))
+    with raises(TypeError):
+        list(expand([MonthDay(8, 4), '08-04'], years))
+    with raises(TypeError):
+        expand(month_days, ['1988'])
+
+
+def test_expand_inline(monkeypatch):
+    def spawn():
+        raise AssertionError('no process pool needed')
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', spawn)
+    assert len(set(month_days)) * len(years) < parallel.inline_threshold
+    result = list(expand(month_days, years, error_invalid_dates=None))
+    assert result == [list(md.dates(years, None)) for md in month_days]
+
+
+def test_expand_process_pool(monkeypatch):
+    monkeypatch.setattr(parallel, 'inline_threshold', 0)
+    result = list(expand(month_days, years, error_invalid_dates=None,
+                         chunk_size=100))
+    assert result == [list(md.dates(years, None)) for md in month_days]
+    results = expand(month_days, years, chunk_size=100)
+    for _ in range(100):
+        next(results)
+    with raises(ValueError):
+        next(results)
+
+
+def test_expand_empty():
+    assert list(expand([], years)) == []
+    assert list(expand(month_days[:3], [])) == [[], [], []]
+
+
+def test_expand_ordinals():
+    with ThreadPoolExecutor(2) as executor:
+        buffers = list(expand_ordinals(month_days, [2015, 2016],
+                                       error_invalid_dates=False,
+                                       executor=executor, chunk_size=100))
+    assert len(buffers) == 5
+    assert all(buffer.typecode == 'i' for buffer in buffers)
+    assert [len(buffer) for buffer in buffers] == [200] * 5
+    flat = [o for buffer in buffers for o in buffer]
+    assert flat[226:228] == [0, datetime.date(2016, 2, 29).toordinal()]
+    with raises(ValueError):
+        expand_ordinals(month_days, years, chunk_size=0)
+
+
+def test_expand_distinct():
+    submitted = []
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, fn, data, *args):
+            submitted.append(len(data) // 2)
+            return super(Executor, self).submit(fn, data, *args)
+
+    repeated = month_days * 3
+    with Executor(2) as executor:
+        result = list(expand(repeated, years, error_invalid_dates=None,
+                             executor=executor, chunk_size=100))
+    assert result == [list(md.dates(years, None)) for md in repeated]
+    # Rows of each distinct value are computed only once.
+    assert sum(submitted) == len(set(month_days)) == 366
@@ -0,0 +1,104 @@
+import datetime
+import itertools
+
+from pytest import raises
+
+from monthday import MonthDay
+from monthday.ranges import MonthDayRange, MonthDayRangeTable
+
+
+def md(ordinal):
+    return MonthDay.fromordinal(ordinal)
+
+
+def test_month_day_range():
+    summer = MonthDayRange(MonthDay(6, 1), MonthDay(8, 31))
+    assert not summer.wraps
+    assert len(summer) == 92
+    assert list(summer)[0] is MonthDay(6, 1)
+    assert list(summer)[-1] is MonthDay(8, 31)
+    assert list(reversed(summer)) == list(summer)[::-1]
+    assert MonthDay(8, 4) in summer
+    assert datetime.date(1988, 8, 4) in summer
+    assert MonthDay(9, 1) not in summer
+    assert '08-04' not in summer
+    winter = MonthDayRange(MonthDay(12, 1), MonthDay(2, 29))
+    assert winter.wraps
+    assert len(winter) == 91
+    assert list(winter) == [md(o) for o in range(335, 366)] + \
+        [md(o) for o in range(0, 60)]
+    assert datetime.date(2015, 3, 1) not in winter
+    day = MonthDayRange(MonthDay(8, 4), MonthDay(8, 4))
+    assert list(day) == [MonthDay(8, 4)]
+    assert len(MonthDayRange(MonthDay(1, 1), MonthDay(12, 31))) == 366
+    assert len(MonthDayRange(MonthDay(8, 5), MonthDay(8, 4))) == 366
+    assert summer == MonthDayRange(MonthDay(6, 1), MonthDay(8, 31))
+    assert hash(summer) == hash(MonthDayRange(MonthDay(6, 1),
+                                              MonthDay(8, 31)))
+    assert summer != winter
+    with raises(TypeError):
+        MonthDayRange(MonthDay(6, 1), datetime.date(2015, 8, 31))
+    assert summer.start is MonthDay(6, 1)
+    assert summer.stop is MonthDay(8, 31)
+    with raises(AttributeError):
+        summer.start = MonthDay(7, 1)
+    with raises(AttributeError):
+        summer.stop = MonthDay(9, 30)
+    assert len(summer) == 92
+
+
+def test_month_day_range_eq_subclass():
+    class Anniversary(MonthDay):
+        pass
+    summer = MonthDayRange(MonthDay(6, 1), MonthDay(8, 31))
+    other = MonthDayRange(Anniversary(6, 1), Anniversary(8, 31))
+    assert other.start is not Anniversary(6, 1)
+    assert other == summer
+    assert summer == other
+    assert hash(other) == hash(summer)
+    assert not other != summer
+    assert other != MonthDayRange(Anniversary(6, 1), Anniversary(8, 30))
+
+
+def test_month_day_range_intersection():
+    bounds = [0, 1, 58, 59, 60, 200, 364, 365]
+    ranges = [MonthDayRange(md(a), md(b))
+              for a, b in itertools.product(bounds, repeat=2)]
+    for a, b in itertools.product(ranges, repeat=2):
+        result = a.intersection(b)
+        assert len(result) <= 2
+        assert sorted(x.start for x in result) == [x.start for x in result]
+        days = [d for r in result for d in r]
+        assert len(days) == len(set(days))
+        assert set(days) == set(a) & set(b)
+        assert a.overlaps(b) == bool(days)
+        if len(result) == 2:
+            # Separate ranges must not be adjacent.
+            assert (result[0].stop.toordinal() + 1) % 366 != \
+                result[1].start.toordinal()
+    with raises(TypeError):
+        ranges[0].intersection(set())
+
+
+def test_month_day_range_table():
+    spring = MonthDayRange(MonthDay(3, 1), MonthDay(5, 31))
+    winter = MonthDayRange(MonthDay(12, 1), MonthDay(2, 29))
+    table = MonthDayRangeTable([spring, winter])
+    assert len(table) == 2
+    assert list(table) == [spring, winter]
+    assert table[MonthDay(4, 1)] is spring
+    assert table[datetime.date(2016, 2, 29)] is winter
+    assert table.find(datetime.date(2015, 12, 31)) is winter
+    assert table.find(MonthDay(8, 4)) is None
+    assert MonthDay(8, 4) not in table
+    assert MonthDay(1, 1) in table
+    with raises(KeyError):
+        table[MonthDay(8, 4)]
+    with raises(TypeError):
+        table.find('08-04')
+    with raises(ValueError):
+        MonthDayRangeTable([
+            winter, MonthDayRange(MonthDay(1, 1), MonthDay(1, 2)),
+        ])
+    with raises(TypeError):
+        MonthDayRangeTable([(MonthDay(1, 1), MonthDay(1, 2))])
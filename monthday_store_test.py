@@ -0,0 +1,70 @@
+import random
+
+from pytest import fixture, raises
+
+from monthday import MonthDay
+from monthday.store import MonthDayStore, write
+
+
+@fixture
+def month_days():
+    rand = random.Random(0)
+    return [MonthDay.fromordinal(rand.randrange(366)) for _ in range(1000)]
+
+
+def test_store_with_keys(tmpdir, month_days):
+    path = str(tmpdir.join('store.mds'))
+    keys = list(range(-500, 500))
+    write(path, month_days, keys)
+    with MonthDayStore(path) as store:
+        assert store.has_keys
+        assert len(store) == len(month_days)
+        assert list(store) == sorted(month_days)
+        assert store[0] == min(month_days)
+        assert store[-1] == max(month_days)
+        for ordinal in range(366):
+            md = MonthDay.fromordinal(ordinal)
+            expected = [k for k, m in zip(keys, month_days) if m is md]
+            assert list(store.keys_on(md)) == expected
+            assert store.count(md) == len(expected)
+        counts = store.counts()
+        assert sum(counts.values()) == len(month_days)
+        assert list(counts) == sorted(set(month_days))
+        with raises(IndexError):
+            store[len(month_days)]
+
+
+def test_store_without_keys(tmpdir, month_days):
+    path = str(tmpdir.join('store.mds'))
+    write(path, iter(month_days[:3]))
+    with MonthDayStore(path) as store:
+        assert not store.has_keys
+        assert list(store) == sorted(month_days[:3])
+        with raises(ValueError):
+            store.keys_on(month_days[0])
+    path = str(tmpdir.join('empty.mds'))
+    write(path, [])
+    with MonthDayStore(path) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        assert store.counts() == {}
+
+
+def test_store_errors(tmpdir):
+    path = str(tmpdir.join('store.mds'))
+    with raises(ValueError):
+        write(path, [MonthDay(8, 4)], [1, 2])
+    with raises(ValueError):
+        write(path, [MonthDay(8, 4), MonthDay(8, 5)], [1])
+    with raises(TypeError):
+        write(path, ['08-04'])
+    with raises(TypeError):
+        write(path, [MonthDay(8, 4)], ['key'])
+    tmpdir.join('invalid.mds').write_binary(b'INVALID' * 100)
+    with raises(ValueError):
+        MonthDayStore(str(tmpdir.join('invalid.mds')))
+    write(path, [MonthDay(8, 4)] * 10, range(10))
+    data = tmpdir.join('store.mds').read_binary()
+    tmpdir.join('truncated.mds').write_binary(data[:-8])
+    with raises(ValueError):
+        MonthDayStore(str(tmpdir.join('truncated.mds')))
@@ -1,9 +1,13 @@
+import array
 import datetime
+import io
+import mmap
 import pickle
+import sys
 
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
-from monthday import MonthDay
+from monthday import MonthDay, MonthDayDates, _buffer_lines, pack, unpack
 
 
 @fixture
@@ -173,3 +177,428 @@ def test_month_day_repr(aug_4, dec_25):
 def test_month_day_pickle(aug_4, dec_25):
     assert pickle.loads(pickle.dumps(aug_4)) == aug_4
     assert pickle.loads(pickle.dumps(dec_25)) == dec_25
+
+
+def test_month_day_unpickle_0_9_0(aug_4):
+    # Pickles of MonthDay(8, 4) written by monthday 0.9.0.
+    pickles = [
+        b'ccopy_reg\n_reconstructor\np0\n(cmonthday\nMonthDay\np1\n'
+        b'c__builtin__\nobject\np2\nNtp3\nRp4\n(I8\nI4\ntp5\nb.',
+        b'ccopy_reg\n_reconstructor\nq\x00(cmonthday\nMonthDay\nq\x01'
+        b'c__builtin__\nobject\nq\x02Ntq\x03Rq\x04(K\x08K\x04tq\x05b.',
+        b'\x80\x02cmonthday\nMonthDay\nq\x00)\x81q\x01K\x08K\x04\x86q'
+        b'\x02b.',
+        b'\x80\x04\x95#\x00\x00\x00\x00\x00\x00\x00\x8c\x08monthday'
+        b'\x94\x8c\x08MonthDay\x94\x93\x94)\x81\x94K\x08K\x04\x86\x94b.',
+    ]
+    for data in pickles[:3 if pickle.HIGHEST_PROTOCOL < 4 else None]:
+        loaded = pickle.loads(data)
+        assert type(loaded) is MonthDay
+        assert loaded == aug_4
+        assert hash(loaded) == hash(aug_4)
+        assert loaded.toordinal() == aug_4.toordinal()
+        assert pickle.loads(pickle.dumps(loaded)) is aug_4
+    with raises(TypeError):
+        MonthDay()
+    with raises(TypeError):
+        MonthDay(None, None)
+    with raises(TypeError):
+        MonthDay(month=None, day=None)
+    with raises(TypeError):
+        MonthDay(8)
+    with raises(TypeError):
+        MonthDay(day=4)
+    with raises(AttributeError):
+        aug_4.__setstate__((1, 1))
+    assert aug_4 == MonthDay(8, 4)
+
+
+def test_month_day_interned(aug_4, feb_29):
+    assert MonthDay(8, 4) is aug_4
+    assert MonthDay.from_date(datetime.date(2016, 2, 29)) is feb_29
+    assert pickle.loads(pickle.dumps(aug_4)) is aug_4
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(feb_29, protocol)) is feb_29
+
+
+def test_month_day_immutable(aug_4):
+    with raises(AttributeError):
+        aug_4.month = 9
+    with raises(AttributeError):
+        del aug_4.day
+    assert aug_4 == MonthDay(8, 4)
+
+
+def test_month_day_ordinal(feb_29, aug_4, dec_25):
+    assert MonthDay(1, 1).toordinal() == 0
+    assert feb_29.toordinal() == 59
+    assert MonthDay(3, 1).toordinal() == 60
+    assert aug_4.toordinal() == 216
+    assert dec_25.toordinal() == 359
+    assert MonthDay(12, 31).toordinal() == 365
+    for ordinal in range(366):
+        assert MonthDay.fromordinal(ordinal).toordinal() == ordinal
+    assert MonthDay.fromordinal(216) is aug_4
+    with raises(ValueError):
+        MonthDay.fromordinal(-1)
+    with raises(ValueError):
+        MonthDay.fromordinal(366)
+    with raises(TypeError):
+        MonthDay.fromordinal(1.0)
+
+
+def test_month_day_ordering(feb_29, aug_4, dec_25):
+    assert feb_29 < aug_4 < dec_25
+    assert dec_25 > aug_4 > feb_29
+    assert aug_4 <= aug_4 and aug_4 >= aug_4
+    assert not aug_4 < aug_4
+    assert sorted([dec_25, feb_29, aug_4]) == [feb_29, aug_4, dec_25]
+    with raises(TypeError):
+        aug_4 < datetime.date(1988, 8, 4)
+
+
+def test_month_day_rotated_key(feb_29, aug_4, dec_25):
+    key = aug_4.rotated_key()
+    assert key is aug_4.rotated_key()
+    assert key(aug_4) == 0
+    assert key(MonthDay(8, 3)) == 365
+    assert sorted([feb_29, dec_25, aug_4, MonthDay(8, 3)], key=key) == [
+        aug_4, dec_25, feb_29, MonthDay(8, 3),
+    ]
+
+
+def test_month_day_from_dates(feb_29, aug_4, dec_25):
+    dates = [
+        datetime.date(2016, 2, 29),
+        datetime.datetime(1988, 8, 4, 12, 34),
+        datetime.date(2015, 12, 25),
+    ]
+    assert MonthDay.from_dates([]) == []
+    assert MonthDay.from_dates(dates) == [feb_29, aug_4, dec_25]
+    assert MonthDay.from_dates(tuple(dates)) == [feb_29, aug_4, dec_25]
+    assert MonthDay.from_dates(iter(dates)) == [feb_29, aug_4, dec_25]
+    assert MonthDay.from_dates(array.array('H', [59, 216, 359])) == [
+        feb_29, aug_4, dec_25,
+    ]
+    assert MonthDay.from_dates(array.array('H')) == []
+
+
+def test_month_day_from_dates_error():
+    with raises(TypeError) as excinfo:
+        MonthDay.from_dates([datetime.date(2016, 2, 29), '1988-08-04'])
+    assert 'dates[1]' in str(excinfo.value)
+    with raises(TypeError):
+        MonthDay.from_dates([MonthDay(8, 4)])
+    with raises(TypeError):
+        MonthDay.from_dates(19880804)
+    with raises(ValueError) as excinfo:
+        MonthDay.from_dates(array.array('h', [0, 1, -1, 366]))
+    assert 'dates[2]' in str(excinfo.value)
+    with raises(TypeError):
+        MonthDay.from_dates(array.array('d', [0.0]))
+
+
+def test_month_day_parse(feb_29, aug_4, dec_25):
+    assert MonthDay.parse('08-04') is aug_4
+    assert MonthDay.parse('--08-04') is aug_4
+    assert MonthDay.parse('0804') is aug_4
+    assert MonthDay.parse(b'02-29') is feb_29
+    assert MonthDay.fromisoformat('--12-25') is dec_25
+    assert MonthDay.fromisoformat(dec_25.isoformat()) is dec_25
+    for ordinal in range(366):
+        md = MonthDay.fromordinal(ordinal)
+        assert MonthDay.parse(str(md)) is md
+    for invalid in '02-30', '13-01', '00-01', '8-4', '08-04 ', '', '-08-04':
+        with raises(ValueError):
+            MonthDay.parse(invalid)
+    with raises(TypeError):
+        MonthDay.parse(804)
+    with raises(TypeError):
+        MonthDay.parse(['08-04'])
+
+
+def test_month_day_parse_many(feb_29, aug_4, dec_25):
+    assert list(MonthDay.parse_many([])) == []
+    lines = ['08-04\n', '--12-25\r\n', '0229', ' 08-04 \n']
+    assert list(MonthDay.parse_many(lines)) == [aug_4, dec_25, feb_29, aug_4]
+    assert list(MonthDay.parse_many(io.BytesIO(b'08-04\n12-25\n'))) == [
+        aug_4, dec_25,
+    ]
+    buffer = b'08-04\r\n--12-25\n0229'
+    assert list(MonthDay.parse_many(buffer)) == [aug_4, dec_25, feb_29]
+    assert list(MonthDay.parse_many(memoryview(buffer))) == [
+        aug_4, dec_25, feb_29,
+    ]
+    assert list(MonthDay.parse_many(bytearray(buffer))) == [
+        aug_4, dec_25, feb_29,
+    ]
+    with raises(ValueError) as excinfo:
+        list(MonthDay.parse_many(b'08-04\n12-25\n02-30\n'))
+    assert 'line 3' in str(excinfo.value)
+    with raises(ValueError) as excinfo:
+        list(MonthDay.parse_many(['08-04\n', '02-30\n']))
+    assert 'line 2' in str(excinfo.value)
+    with raises(ValueError):
+        list(MonthDay.parse_many([804]))
+    with raises(TypeError):
+        MonthDay.parse_many(804)
+
+
+def test_month_day_parse_many_buffer(tmpdir):
+    lines = [md.isoformat() if md.day % 2 else str(md) for md in
+             map(MonthDay.fromordinal, range(366))]
+    data = '\n'.join(lines).encode() + b'\r\n'
+    # Lines cross the boundaries of windows.
+    for window in 1, 7, 64, len(data), len(data) + 1:
+        assert list(_buffer_lines(data, window)) == data.split(b'\n')[:-1]
+    if sys.version_info < (3,):
+        return  # Python 2's mmap doesn't support memoryview.
+    path = tmpdir.join('month_days.txt')
+    path.write_binary(data * 300)
+    with path.open('rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            values = MonthDay.parse_many(memoryview(mapped))
+            assert next(values) is MonthDay(1, 1)
+            assert sum(1 for _ in values) == 366 * 300 - 1
+        finally:
+            mapped.close()
+
+
+def test_month_day_date_leap_policy(aug_4, feb_29):
+    assert aug_4.date(2015, leap_policy='skip') == datetime.date(2015, 8, 4)
+    assert feb_29.date(2016, leap_policy='mar1') == \
+        datetime.date(2016, 2, 29)
+    assert feb_29.date(2015, leap_policy='feb28') == \
+        datetime.date(2015, 2, 28)
+    assert feb_29.date(1900, leap_policy='mar1') == datetime.date(1900, 3, 1)
+    assert feb_29.date(2000) == datetime.date(2000, 2, 29)
+    assert feb_29.date(2015, leap_policy='skip') is None
+    assert feb_29.date(2015, leap_policy='none') is None
+    with raises(ValueError):
+        feb_29.date(2015, leap_policy='raise')
+    with raises(ValueError):
+        feb_29.date(2016, leap_policy='invalid')
+
+
+def test_month_day_dates_leap_policy(aug_4, feb_29):
+    years = range(2011, 2017)
+    with raises(ValueError):
+        list(feb_29.dates(years, leap_policy='raise'))
+    assert list(feb_29.dates(years, leap_policy='skip')) == \
+        list(feb_29.dates(years, error_invalid_dates=False))
+    assert list(feb_29.dates(years, leap_policy='none')) == \
+        list(feb_29.dates(years, error_invalid_dates=None))
+    assert list(feb_29.dates(years, True, leap_policy='feb28')) == [
+        datetime.date(2011, 2, 28), datetime.date(2012, 2, 29),
+        datetime.date(2013, 2, 28), datetime.date(2014, 2, 28),
+        datetime.date(2015, 2, 28), datetime.date(2016, 2, 29),
+    ]
+    assert list(feb_29.dates([1900, 2000], leap_policy='mar1')) == [
+        datetime.date(1900, 3, 1), datetime.date(2000, 2, 29),
+    ]
+    assert list(aug_4.dates([0, 1988], error_invalid_dates=None)) == [
+        None, datetime.date(1988, 8, 4),
+    ]
+    with raises(ValueError):
+        list(aug_4.dates([0, 1988]))
+    with raises(ValueError):
+        feb_29.dates(years, leap_policy='invalid')
+    with raises(TypeError):
+        list(aug_4.dates(['1988']))
+
+
+def test_month_day_bytes(feb_29, aug_4):
+    assert aug_4.to_bytes() == b'\xd8\x00'
+    assert MonthDay.from_bytes(b'\xd8\x00') is aug_4
+    for ordinal in range(366):
+        md = MonthDay.fromordinal(ordinal)
+        assert MonthDay.from_bytes(md.to_bytes()) is md
+    assert MonthDay.from_bytes(bytearray(feb_29.to_bytes())) is feb_29
+    with raises(ValueError):
+        MonthDay.from_bytes(b'\x00')
+    with raises(ValueError):
+        MonthDay.from_bytes(b'\x6e\x01')
+    with raises(TypeError):
+        MonthDay.from_bytes(216)
+
+
+def test_pack_unpack(feb_29, aug_4, dec_25):
+    month_days = [feb_29, aug_4, dec_25, aug_4]
+    packed = pack(month_days)
+    assert packed == b''.join(md.to_bytes() for md in month_days)
+    assert unpack(packed) == month_days
+    assert unpack(memoryview(packed)) == month_days
+    assert unpack(bytearray(packed)) == month_days
+    assert pack(iter(month_days)) == packed
+    assert pack([]) == b''
+    assert unpack(b'') == []
+    with raises(TypeError) as excinfo:
+        pack([aug_4, datetime.date(1988, 8, 4)])
+    assert 'month_days[1]' in str(excinfo.value)
+    with raises(ValueError):
+        unpack(b'\xd8\x00\x00')
+    with raises(ValueError):
+        unpack(b'\x6e\x01')
+
+
+def test_month_day_init_integral_types(aug_4):
+    class Integer(int):
+        pass
+    assert MonthDay(Integer(8), Integer(4)) is aug_4
+    assert type(MonthDay(Integer(8), 4).month) is int
+    assert MonthDay(True, True) is MonthDay(1, 1)
+    with raises(ValueError) as excinfo:
+        MonthDay(2, 30)
+    assert str(excinfo.value) == \
+        'day must be from 1 to 29 for month=2, but 30 was given'
+
+
+def test_month_day_make(aug_4):
+    assert MonthDay._make(8, 4) is aug_4
+    assert MonthDay._make(12, 31) is MonthDay.fromordinal(365)
+
+
+def next_occurrence(month_day, date, leap_policy, step):
+    year = date.year
+    while True:
+        try:
+            occurrence = month_day.date(
+                year, 'raise' if leap_policy == 'skip' else leap_policy
+            )
+        except ValueError:
+            pass
+        else:
+            if (occurrence - date).days * step >= 0:
+                return abs((occurrence - date).days)
+        year += step
+
+
+def test_month_day_days_until_since(feb_29, aug_4, dec_25):
+    dates = [datetime.date(year, 1, 1) + datetime.timedelta(days)
+             for year in (1896, 1899, 1900, 2000, 2015, 2016)
+             for days in range(0, 366, 5)]
+    for month_day in feb_29, aug_4, dec_25, MonthDay(2, 28), MonthDay(3, 1):
+        for leap_policy in 'skip', 'feb28', 'mar1':
+            for date in dates:
+                assert month_day.days_until(date, leap_policy) == \
+                    next_occurrence(month_day, date, leap_policy, 1)
+                assert month_day.days_since(date, leap_policy) == \
+                    next_occurrence(month_day, date, leap_policy, -1)
+    assert feb_29.days_until(datetime.date(1896, 3, 1)) == 2920
+    assert aug_4.days_until(datetime.datetime(1988, 8, 4, 23, 59)) == 0
+    # Beyond datetime.MAXYEAR; 10000 is a leap year.
+    assert dec_25.days_until(datetime.date(9999, 12, 26)) == 365
+    assert dec_25.days_since(datetime.date(1, 1, 1)) == 7
+    with raises(TypeError):
+        aug_4.days_until('1988-08-04')
+    with raises(ValueError):
+        aug_4.days_since(datetime.date(1988, 8, 4), leap_policy='raise')
+
+
+def test_month_day_format(feb_29, aug_4, dec_25):
+    assert format(aug_4) == str(aug_4) == '08-04'
+    assert '{0:%b %-d}'.format(aug_4) == 'Aug 4'
+    assert '{0:%d/%m}'.format(aug_4) == '04/08'
+    assert format(dec_25, '%B %d, 100%% {x}') == 'December 25, 100% {x}'
+    assert format(feb_29, '%-m/%-d') == '2/29'
+    assert format(feb_29, '%%d') == '%d'
+    for ordinal in range(366):
+        month_day = MonthDay.fromordinal(ordinal)
+        date = month_day.date(2016)
+        for spec in '%m-%d', '%b %d', '%B/%d %%':
+            assert format(month_day, spec) == date.strftime(spec)
+    for spec in '%', 'abc%', '%j', '%Y', '%-x':
+        with raises(ValueError):
+            format(aug_4, spec)
+    with raises(TypeError):
+        format(aug_4, 1)
+
+
+def test_month_day_format_unicode(aug_4):
+    text_type = type(u'')
+    for spec, expected in [(u'', u'08-04'), (u'%b %-d', u'Aug 4')]:
+        # Cached byte string tables aren't taken for unicode on Python 2.
+        format(aug_4, str(spec))
+        assert format(aug_4, spec) == expected
+        assert type(format(aug_4, spec)) is text_type
+        assert type(MonthDay.format_many([aug_4], spec)[0]) is text_type
+    assert u'{0:%b}'.format(aug_4) == u'Aug'
+
+
+def test_month_day_format_many(feb_29, aug_4, dec_25):
+    values = [aug_4, dec_25, feb_29, aug_4]
+    assert MonthDay.format_many(values) == [str(md) for md in values]
+    assert MonthDay.format_many(iter(values), '%b %-d') == [
+        'Aug 4', 'Dec 25', 'Feb 29', 'Aug 4'
+    ]
+    assert MonthDay.format_many([], '%m') == []
+    with raises(TypeError):
+        MonthDay.format_many([aug_4, '08-04'])
+    with raises(TypeError):
+        MonthDay.format_many(None)
+    with raises(ValueError):
+        MonthDay.format_many(values, '%j')
+
+
+py2 = mark.skipif(sys.version_info < (3,),
+                  reason='dates() views need the range type of Python 3')
+
+
+@py2
+@mark.parametrize('leap_policy', ['raise', 'skip', 'none', 'feb28', 'mar1'])
+@mark.parametrize('years', [
+    range(1890, 2020), range(2020, 1890, -1), range(1800, 2800, 3),
+    range(1900, 3000, 100), range(2100, 1700, -400), range(-10, 20),
+    range(9990, 10010, 2), range(2015, 2015),
+])
+def test_month_day_dates_range(feb_29, aug_4, leap_policy, years):
+    for month_day in feb_29, aug_4:
+        view = month_day.dates(years, leap_policy=leap_policy)
+        assert isinstance(view, MonthDayDates)
+        try:
+            expected = list(month_day.dates(iter(years),
+                                            leap_policy=leap_policy))
+        except ValueError:
+            with raises(ValueError):
+                list(view)
+            continue
+        assert list(view) == expected
+        assert len(view) == len(expected)
+        assert list(reversed(view)) == expected[::-1]
+        for index in range(-len(expected), len(expected)):
+            assert view[index] == expected[index]
+        for s in (slice(None, None, 2), slice(3, -3), slice(None, None, -5),
+                  slice(-7, None, 3)):
+            assert list(view[s]) == expected[s]
+            assert len(view[s]) == len(expected[s])
+            assert list(view[s][::2]) == expected[s][::2]
+        with raises(IndexError):
+            view[len(expected)]
+        for date in expected[:10]:
+            assert date in view
+            assert view.index(date) == expected.index(date)
+        assert (None in view) == (None in expected)
+        assert datetime.date(2015, 8, 5) not in view
+        assert datetime.datetime(2016, 8, 4) not in view
+        assert '2016-08-04' not in view
+
+
+@py2
+def test_month_day_dates_range_lazy(feb_29):
+    dates = feb_29.dates(range(1, 10000), False)
+    assert len(dates) == 2424
+    assert dates[0] == datetime.date(4, 2, 29)
+    assert dates[-1] == datetime.date(9996, 2, 29)
+    assert list(dates[1000:1002]) == [datetime.date(4128, 2, 29),
+                                      datetime.date(4132, 2, 29)]
+    assert datetime.date(2000, 2, 29) in dates
+    with raises(ValueError):
+        dates.index(datetime.date(2015, 8, 4))
+    invalid = feb_29.dates(range(2011, 2017))
+    assert len(invalid) == 6
+    assert invalid[1] == datetime.date(2012, 2, 29)
+    with raises(ValueError):
+        invalid[0]
+    with raises(TypeError):
+        MonthDayDates(feb_29, [2016])
@@ -0,0 +1,84 @@
+import datetime
+
+from pytest import importorskip, mark, raises
+
+from monthday import MonthDay
+from monthday.zones import is_today, local_ordinals
+
+try:
+    import zoneinfo
+except ImportError:
+    zoneinfo = None
+
+
+utc = datetime.timezone.utc
+kst = datetime.timezone(datetime.timedelta(hours=9))
+est = datetime.timezone(datetime.timedelta(hours=-5))
+
+
+def test_local_ordinals():
+    instant = datetime.datetime(2015, 2, 28, 20, 0, tzinfo=utc)
+    assert local_ordinals(utc, instant) == (58, 58)
+    assert local_ordinals(kst, instant) == (60, 60)
+    assert local_ordinals(kst, instant, 'mar1') == (60, 59)
+    assert local_ordinals(utc, instant, 'mar1') == (58, 58)
+    assert local_ordinals(utc, instant, 'feb28') == (58, 59)
+    leap = datetime.datetime(2016, 2, 28, 20, 0, tzinfo=utc)
+    assert local_ordinals(utc, leap, 'feb28') == (58, 58)
+    with raises(ValueError):
+        local_ordinals(utc, instant, 'raise')
+    with raises(ValueError):
+        local_ordinals(utc, datetime.datetime(2015, 2, 28))
+    with raises(TypeError):
+        local_ordinals(utc, datetime.date(2015, 2, 28))
+    with raises(TypeError):
+        local_ordinals(9, instant)
+
+
+def test_is_today():
+    instant = datetime.datetime(2015, 12, 24, 20, 0, tzinfo=utc)
+    records = [
+        (MonthDay(12, 25), kst),
+        (MonthDay(12, 25), est),
+        (MonthDay(12, 24), est),
+        (MonthDay(12, 24), utc),
+        (MonthDay(8, 4), kst),
+    ]
+    assert is_today(records, instant) == [True, False, True, True, False]
+    assert is_today([], instant) == []
+    with raises(TypeError):
+        is_today([('12-25', kst)], instant)
+    leapling = [(MonthDay(2, 29), kst), (MonthDay(2, 29), utc)]
+    instant = datetime.datetime(2015, 2, 28, 20, 0, tzinfo=utc)
+    assert is_today(leapling, instant) == [False, False]
+    assert is_today(leapling, instant, 'feb28') == [False, True]
+    assert is_today(leapling, instant, 'mar1') == [True, False]
+    assert len(is_today(leapling)) == 2
+
+
+@mark.skipif(zoneinfo is None, reason='zoneinfo is unavailable')
+def test_is_today_zone_names():
+    instant = datetime.datetime(2015, 7, 1, 3, 30, tzinfo=utc)
+    records = [
+        (MonthDay(6, 30), 'America/Los_Angeles'),
+        (MonthDay(7, 1), 'Asia/Seoul'),
+        (MonthDay(7, 1), 'America/New_York'),
+    ]
+    assert is_today(records, instant) == [True, True, False]
+
+
+def test_month_day_array_is_today():
+    numpy = importorskip('numpy')
+    MonthDayArray = importorskip('monthday.array').MonthDayArray
+    instant = datetime.datetime(2015, 12, 24, 20, 0, tzinfo=utc)
+    array = MonthDayArray([MonthDay(12, 25), MonthDay(12, 25),
+                           MonthDay(12, 24), MonthDay(2, 29)])
+    result = array.is_today(numpy.array([0, 1, 1, 0]), [kst, est], instant)
+    assert result.tolist() == [True, False, True, False]
+    with raises(ValueError):
+        array.is_today([0], [kst], instant)
+    with raises(TypeError):
+        array.is_today([0.0] * 4, [kst], instant)
+    instant = datetime.datetime(2015, 2, 28, 20, 0, tzinfo=utc)
+    result = array.is_today([0, 1, 0, 1], [kst, utc], instant, 'feb28')
+    assert result.tolist() == [False, False, False, True]
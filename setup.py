@@ -23,7 +23,12 @@ setup(
     author='Hong Minhee',
     author_email='hongminhee' '@' 'member.fsf.org',
     url='https://monthday.readthedocs.org/',
-    py_modules=['monthday'],
+    packages=['monthday'],
+    extras_require={
+        'numpy': ['numpy >= 1.7.0'],
+        'pandas': ['numpy >= 1.7.0', 'pandas >= 1.0.0'],
+        'arrow': ['pyarrow >= 0.15.0'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',